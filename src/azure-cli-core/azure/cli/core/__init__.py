@@ -38,7 +38,7 @@ class AzCli(CLI):
             register_ids_argument, register_global_subscription_argument)
         from azure.cli.core.cloud import get_active_cloud
         from azure.cli.core.commands.transform import register_global_transforms
-        from azure.cli.core._session import ACCOUNT, CONFIG, SESSION
+        from azure.cli.core._session import ACCOUNT, CONFIG, SESSION, INDEX
 
         from knack.util import ensure_dir
 
@@ -53,6 +53,7 @@ class AzCli(CLI):
         ACCOUNT.load(os.path.join(azure_folder, 'azureProfile.json'))
         CONFIG.load(os.path.join(azure_folder, 'az.json'))
         SESSION.load(os.path.join(azure_folder, 'az.sess'), max_age=3600)
+        INDEX.load(os.path.join(azure_folder, 'commandIndex.json'))
         self.cloud = get_active_cloud(self)
         logger.debug('Current cloud config:\n%s', str(self.cloud.name))
 
@@ -103,6 +104,15 @@ class AzCli(CLI):
         from azure.cli.core.util import handle_exception
         return handle_exception(ex)
 
+    def invoke(self, args, initial_invocation_data=None, out_file=None):
+        from azure.cli.core._session import commit_sessions
+        try:
+            return super(AzCli, self).invoke(args, initial_invocation_data=initial_invocation_data,
+                                             out_file=out_file)
+        finally:
+            # Session modifications are batched, write them once the command is done
+            commit_sessions()
+
 
 class MainCommandsLoader(CLICommandsLoader):
 
@@ -128,19 +138,33 @@ class MainCommandsLoader(CLICommandsLoader):
         from azure.cli.core.extension import (
             get_extensions, get_extension_path, get_extension_modname)
 
-        def _update_command_table_from_modules(args):
+        command_index = CommandIndex(self.cli_ctx) \
+            if self.cli_ctx.config.getboolean('core', 'use_command_index', True) else None
+        # {top-level command: {'modules': [...], 'extensions': [...]}} collected while loading
+        loaded_index = {}
+
+        def _add_to_loaded_index(command_table, kind, name):
+            for cmd_name in command_table:
+                entry = loaded_index.setdefault(cmd_name.split()[0], {'modules': [], 'extensions': []})
+                if name not in entry[kind]:
+                    entry[kind].append(name)
+
+        def _update_command_table_from_modules(args, command_modules=None):
             '''Loads command table(s)
-            When `module_name` is specified, only commands from that module will be loaded.
-            If the module is not found, all commands are loaded.
+            When `command_modules` is specified, only commands from those modules will be loaded.
+            Otherwise, all installed command modules are loaded.
             '''
             installed_command_modules = []
-            try:
-                mods_ns_pkg = import_module('azure.cli.command_modules')
-                installed_command_modules = [modname for _, modname, _ in
-                                             pkgutil.iter_modules(mods_ns_pkg.__path__)
-                                             if modname not in BLACKLISTED_MODS]
-            except ImportError as e:
-                logger.warning(e)
+            if command_modules is not None:
+                installed_command_modules = command_modules
+            else:
+                try:
+                    mods_ns_pkg = import_module('azure.cli.command_modules')
+                    installed_command_modules = [modname for _, modname, _ in
+                                                 pkgutil.iter_modules(mods_ns_pkg.__path__)
+                                                 if modname not in BLACKLISTED_MODS]
+                except ImportError as e:
+                    logger.warning(e)
 
             logger.debug('Installed command modules %s', installed_command_modules)
             cumulative_elapsed_time = 0
@@ -150,6 +174,7 @@ class MainCommandsLoader(CLICommandsLoader):
                     module_command_table, module_group_table = _load_module_command_loader(self, args, mod)
                     for cmd in module_command_table.values():
                         cmd.command_source = mod
+                    _add_to_loaded_index(module_command_table, 'modules', mod)
                     self.command_table.update(module_command_table)
                     self.command_group_table.update(module_group_table)
                     elapsed_time = timeit.default_timer() - start_time
@@ -167,7 +192,7 @@ class MainCommandsLoader(CLICommandsLoader):
                          "(note: there's always an overhead with the first module loaded)",
                          cumulative_elapsed_time)
 
-        def _update_command_table_from_extensions(ext_suppressions):
+        def _update_command_table_from_extensions(ext_suppressions, extension_names=None):
 
             from azure.cli.core.extension.operations import check_version_compatibility
 
@@ -183,6 +208,8 @@ class MainCommandsLoader(CLICommandsLoader):
                 return filtered_extensions
 
             extensions = get_extensions()
+            if extension_names is not None:
+                extensions = [ext for ext in extensions if ext.name in extension_names]
             if extensions:
                 logger.debug("Found %s extensions: %s", len(extensions), [e.name for e in extensions])
                 allowed_extensions = _handle_extension_suppressions(extensions)
@@ -212,6 +239,7 @@ class MainCommandsLoader(CLICommandsLoader):
                                 overrides_command=cmd_name in module_commands,
                                 preview=ext.preview)
 
+                        _add_to_loaded_index(extension_command_table, 'extensions', ext_name)
                         self.command_table.update(extension_command_table)
                         self.command_group_table.update(extension_group_table)
                         elapsed_time = timeit.default_timer() - start_time
@@ -250,15 +278,43 @@ class MainCommandsLoader(CLICommandsLoader):
                             res.append(sup)
             return res
 
-        _update_command_table_from_modules(args)
-        try:
-            ext_suppressions = _get_extension_suppressions(self.loaders)
-            # We always load extensions even if the appropriate module has been loaded
-            # as an extension could override the commands already loaded.
-            _update_command_table_from_extensions(ext_suppressions)
-        except Exception:  # pylint: disable=broad-except
-            logger.warning("Unable to load extensions. Use --debug for more information.")
-            logger.debug(traceback.format_exc())
+        def _load_command_table(command_modules=None, extension_names=None):
+            _update_command_table_from_modules(args, command_modules)
+            try:
+                ext_suppressions = _get_extension_suppressions(self.loaders)
+                # We always load extensions even if the appropriate module has been loaded
+                # as an extension could override the commands already loaded.
+                _update_command_table_from_extensions(ext_suppressions, extension_names)
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Unable to load extensions. Use --debug for more information.")
+                logger.debug(traceback.format_exc())
+
+        index_result = command_index.get(args) if command_index else None
+        if index_result:
+            top_command, index_modules, index_extensions = index_result
+            logger.debug("Loading command modules %s and extensions %s from command index for '%s'.",
+                         index_modules, index_extensions, top_command)
+            _load_command_table(index_modules, index_extensions)
+            if any(cmd_name.split()[0] == top_command for cmd_name in self.command_table):
+                return self.command_table
+            # The index points at modules that no longer provide the command, so start over with a full load.
+            logger.debug("Command index entry for '%s' is stale. Loading all command modules.", top_command)
+            command_index.invalidate()
+            self.command_table = {}
+            self.command_group_table = {}
+            self.cmd_to_loader_map = {}
+            self.loaders = []
+            loaded_index.clear()
+
+        _load_command_table()
+        if command_index:
+            command_index.update(loaded_index)
+        if args is None:
+            # Command modules only import their help when it is shown. Callers loading the whole command table
+            # (e.g. to dump all commands) read `knack.help_files.helps` directly, so fill it for them.
+            from azure.cli.core._help import _import_help_module
+            for loader in self.loaders:
+                _import_help_module(loader)
 
         return self.command_table
 
@@ -300,6 +356,85 @@ class MainCommandsLoader(CLICommandsLoader):
                 loader._update_command_definitions()  # pylint: disable=protected-access
 
 
+class CommandIndex(object):
+    """ Maps top-level command names to the command modules and extensions that provide them, so that a
+    command invocation only needs to import the loaders that own it. The index is persisted in the INDEX
+    session and invalidated whenever the CLI version, cloud profile or set of installed extensions changes. """
+
+    _COMMAND_INDEX = 'commandIndex'
+    _COMMAND_INDEX_VERSION = 'version'
+    _COMMAND_INDEX_CLOUD_PROFILE = 'cloudProfile'
+    _COMMAND_INDEX_EXTENSIONS = 'extensions'
+
+    def __init__(self, cli_ctx=None):
+        self.version = __version__
+        self.cloud_profile = cli_ctx.cloud.profile if cli_ctx else None
+        self._extensions = None
+
+    @property
+    def extensions(self):
+        """ Sorted list of installed extensions which is used to detect extension add/remove. """
+        if self._extensions is None:
+            from azure.cli.core.extension import get_extensions
+            try:
+                self._extensions = sorted('{}:{}'.format(ext.ext_type, ext.name) for ext in get_extensions())
+            except Exception:  # pylint: disable=broad-except
+                logger.debug("Unable to list extensions for the command index.", exc_info=True)
+                self._extensions = []
+        return self._extensions
+
+    def _is_valid(self):
+        from azure.cli.core._session import INDEX
+        return bool(INDEX.get(self._COMMAND_INDEX_VERSION)) and \
+            INDEX.get(self._COMMAND_INDEX_VERSION) == self.version and \
+            INDEX.get(self._COMMAND_INDEX_CLOUD_PROFILE) == self.cloud_profile and \
+            INDEX.get(self._COMMAND_INDEX_EXTENSIONS) == self.extensions
+
+    def get(self, args):
+        """ Returns a tuple of (top-level command, command modules, extension names) for the given args,
+        or None if the index cannot be used and all command modules should be loaded. """
+        from azure.cli.core._session import INDEX
+
+        # Skip the index for `az`, `az --help`, and callers that load everything
+        if not args or args[0].startswith('-'):
+            return None
+
+        if not self._is_valid():
+            logger.debug("Command index is missing or out of date.")
+            return None
+
+        top_command = args[0]
+        entry = INDEX.get(self._COMMAND_INDEX, {}).get(top_command)
+        if not entry:
+            logger.debug("Command index has no entry for '%s'.", top_command)
+            return None
+        return top_command, entry.get('modules', []), entry.get('extensions', [])
+
+    def update(self, index):
+        """ Persist an index of {top-level command: {'modules': [...], 'extensions': [...]}}. """
+        from azure.cli.core._session import INDEX
+        INDEX.data[self._COMMAND_INDEX_VERSION] = self.version
+        INDEX.data[self._COMMAND_INDEX_CLOUD_PROFILE] = self.cloud_profile
+        INDEX.data[self._COMMAND_INDEX_EXTENSIONS] = self.extensions
+        INDEX.data[self._COMMAND_INDEX] = index
+        try:
+            INDEX.save_with_retry()
+        except (OSError, IOError):
+            logger.debug("Unable to save the command index.", exc_info=True)
+        else:
+            logger.debug("Updated command index with %s top-level commands.", len(index))
+
+    def invalidate(self):
+        from azure.cli.core._session import INDEX
+        INDEX.data[self._COMMAND_INDEX_VERSION] = ""
+        INDEX.data[self._COMMAND_INDEX] = {}
+        try:
+            INDEX.save_with_retry()
+        except (OSError, IOError):
+            logger.debug("Unable to save the command index.", exc_info=True)
+        logger.debug("Command index has been invalidated.")
+
+
 class ModExtensionSuppress(object):  # pylint: disable=too-few-public-methods
 
     def __init__(self, mod_name, suppress_extension_name, suppress_up_to_version, reason=None, recommend_remove=False,
@@ -546,7 +681,7 @@ def get_default_cli():
     from azure.cli.core.parser import AzCliCommandParser
     from azure.cli.core._config import GLOBAL_CONFIG_DIR, ENV_VAR_PREFIX
     from azure.cli.core._help import AzCliHelp
-    from azure.cli.core._output import AzOutputProducer
+    from azure.cli.core._output import AzOutputProducer, AzCliQuery
 
     return AzCli(cli_name='az',
                  config_dir=GLOBAL_CONFIG_DIR,
@@ -556,4 +691,5 @@ def get_default_cli():
                  parser_cls=AzCliCommandParser,
                  logging_cls=AzCliLogging,
                  output_cls=AzOutputProducer,
+                 query_cls=AzCliQuery,
                  help_cls=AzCliHelp)
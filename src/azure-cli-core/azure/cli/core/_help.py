@@ -5,6 +5,8 @@
 
 from __future__ import print_function
 import argparse
+import os
+import sys
 
 from azure.cli.core.commands import ExtensionCommandSource
 from azure.cli.core.commands.constants import SURVEY_PROMPT
@@ -48,6 +50,68 @@ Here are the base commands:
 """
 
 
+HELP_INDEX_FILE_NAME = 'helpIndex.marshal'
+_HELP_INDEX_HEADER = (1, tuple(sys.version_info[:2]))
+
+
+class HelpIndex(object):
+    """
+    Store of parsed help entries, saved with marshal in the config directory, so that the YAML of an entry is only
+    parsed again after its text has changed.
+
+    Entries are keyed by command (or help file path) and hold a fingerprint of the YAML text they were parsed from.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._entries = None
+        self._dirty = False
+
+    def _load(self):
+        import marshal
+        self._entries = {}
+        try:
+            with open(self.path, 'rb') as f:
+                header, entries = marshal.load(f)
+            if header == _HELP_INDEX_HEADER:
+                self._entries = entries
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            logger.debug("Help index '%s' is not available.", self.path)
+
+    def get(self, key, text, parse):
+        """ Return the parsed help `text` of `key`, calling `parse` only if it isn't in the index yet. """
+        import hashlib
+        import marshal
+        if not text:
+            return parse(text)
+        if self._entries is None:
+            self._load()
+        fingerprint = hashlib.sha256(text if isinstance(text, bytes) else text.encode('utf-8')).hexdigest()
+        entry = self._entries.get(key)
+        if entry and entry[0] == fingerprint:
+            return entry[1]
+        data = parse(text)
+        try:
+            marshal.dumps(data)
+        except ValueError:
+            # e.g. YAML timestamps can't be stored
+            return data
+        self._entries[key] = (fingerprint, data)
+        self._dirty = True
+        return data
+
+    def save(self):
+        import marshal
+        from azure.cli.core._session import _write_file_atomically
+        if not self._dirty:
+            return
+        try:
+            _write_file_atomically(self.path, marshal.dumps((_HELP_INDEX_HEADER, self._entries)))
+        except (IOError, OSError) as ex:
+            logger.debug("Failed to save help index '%s': %s", self.path, ex)
+        self._dirty = False
+
+
 # PrintMixin class to decouple printing functionality from AZCLIHelp class.
 # Most of these methods override print methods in CLIHelp
 class CLIPrintMixin(CLIHelp):
@@ -144,13 +208,17 @@ class AzCliHelp(CLIPrintMixin, CLIHelp):
 
         HelpObject._normalize_text = new_normalize_text  # pylint: disable=protected-access
 
+        self.help_index = HelpIndex(os.path.join(cli_ctx.config.config_dir, HELP_INDEX_FILE_NAME))
         self._register_help_loaders()
         self._name_to_content = {}
+        # top-level command names whose help modules are imported, None once the help modules of all loaders are
+        self._help_modules_loaded = set()
 
     # override
     def show_help(self, cli_name, nouns, parser, is_group):
         self.update_loaders_with_help_file_contents(nouns)
         super(AzCliHelp, self).show_help(cli_name, nouns, parser, is_group)
+        self.help_index.save()
         print(SURVEY_PROMPT)
 
     def _register_help_loaders(self):
@@ -171,7 +239,36 @@ class AzCliHelp(CLIPrintMixin, CLIHelp):
 
         self.versioned_loaders = versioned_loaders
 
+    def load_help_modules(self, nouns=None):
+        """
+        Import the `_help` modules of the command loaders that may hold the help of the command or group `nouns`,
+        or of all command loaders without `nouns`. Command modules don't import their help when they are loaded,
+        so that it is only imported when help is shown.
+        """
+        invocation = self.cli_ctx.invocation
+        commands_loader = getattr(invocation, 'commands_loader', None)
+        top_name = nouns[0] if nouns else None
+        if not commands_loader or self._help_modules_loaded is None or top_name in self._help_modules_loaded:
+            return
+        # group help may be defined by any module with commands under the same top-level group
+        loaders = set()
+        for cmd_name, cmd_loaders in commands_loader.cmd_to_loader_map.items():
+            if top_name is None or cmd_name.split()[0] == top_name:
+                loaders.update(cmd_loaders)
+        # keep the order modules are loaded in, which decides between entries defined more than once
+        for loader in getattr(commands_loader, 'loaders', []):
+            if loader in loaders:
+                _import_help_module(loader)
+                loaders.discard(loader)
+        for loader in loaders:
+            _import_help_module(loader)
+        if top_name is None:
+            self._help_modules_loaded = None
+        else:
+            self._help_modules_loaded.add(top_name)
+
     def update_loaders_with_help_file_contents(self, nouns):
+        self.load_help_modules(nouns)
         loader_file_names_dict = {}
         file_name_set = set()
         for ldr_cls_name, loader in self.versioned_loaders.items():
@@ -191,6 +288,22 @@ class AzCliHelp(CLIPrintMixin, CLIHelp):
             self.versioned_loaders[ldr_cls_name].update_file_contents(file_contents)
 
 
+def _import_help_module(command_loader):
+    from importlib import import_module
+    module_name = command_loader.__class__.__module__
+    if not hasattr(sys.modules.get(module_name), '__path__'):
+        module_name = module_name.rpartition('.')[0]
+    help_module_name = module_name + '._help'
+    if help_module_name in sys.modules:
+        return
+    try:
+        import_module(help_module_name)
+    except ImportError as ex:
+        # not every command module or extension has a `_help` module
+        if getattr(ex, 'name', help_module_name) != help_module_name:
+            logger.warning("Failed to load help module '%s': %s", help_module_name, ex)
+
+
 class CliHelpFile(KnackHelpFile):
 
     def __init__(self, help_ctx, delimiters):
@@ -238,6 +351,14 @@ class CliHelpFile(KnackHelpFile):
                 if self._should_include_example(d):
                     self.examples.append(HelpExample(**d))
 
+    # Needs to override base implementation to use the parsed entries of the help index.
+    def _load_from_file(self):
+        import yaml
+        from knack.help_files import helps
+        file_data = self.help_ctx.help_index.get(self.delimiters, helps.get(self.delimiters), yaml.safe_load)
+        if file_data:
+            self._load_from_data(file_data)
+
     def load(self, options):
         ordered_loaders = sorted(self.help_ctx.versioned_loaders.values(), key=lambda ldr: ldr.version)
         for loader in ordered_loaders:
@@ -122,13 +122,21 @@ class YamlLoaderMixin(object):  # pylint:disable=too-few-public-methods
             for loader in loaders:
                 loader_file_path = inspect.getfile(loader.__class__)
                 dir_name = os.path.dirname(loader_file_path)
-                files = os.listdir(dir_name)
-                for file in files:
-                    if file.endswith("help.yaml") or file.endswith("help.yml"):
-                        help_file_path = os.path.join(dir_name, file)
-                        results.append(help_file_path)
+                results.extend(YamlLoaderMixin._get_yaml_help_files_in_dir(dir_name))
         return results
 
+    # help files found in each command module directory, so each directory is only listed once
+    _dir_to_help_files = {}
+
+    @staticmethod
+    def _get_yaml_help_files_in_dir(dir_name):
+        help_files = YamlLoaderMixin._dir_to_help_files.get(dir_name)
+        if help_files is None:
+            help_files = [os.path.join(dir_name, file) for file in os.listdir(dir_name)
+                          if file.endswith("help.yaml") or file.endswith("help.yml")]
+            YamlLoaderMixin._dir_to_help_files[dir_name] = help_files
+        return help_files
+
     @staticmethod
     def _parse_yaml_from_string(text, help_file_path):
         dir_name, base_name = os.path.split(help_file_path)
@@ -182,10 +190,13 @@ class HelpLoaderV1(BaseHelpLoader, YamlLoaderMixin):
         return self._get_yaml_help_files_list(nouns, cmd_loader_map_ref)
 
     def update_file_contents(self, file_contents):
+        def _parser(file_name):
+            return lambda text: self._parse_yaml_from_string(text, file_name)
+
         for file_name in file_contents:
             if file_name not in self._file_content_dict:
-                data_dict = {file_name: self._parse_yaml_from_string(file_contents[file_name], file_name)}
-                self._file_content_dict.update(data_dict)
+                self._file_content_dict[file_name] = self.help_ctx.help_index.get(
+                    file_name, file_contents[file_name], _parser(file_name))
 
     def load_entry_data(self, help_obj, parser):
         prog = parser.prog if hasattr(parser, "prog") else parser._prog_prefix  # pylint: disable=protected-access
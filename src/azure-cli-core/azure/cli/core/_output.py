@@ -3,22 +3,39 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
+from __future__ import print_function
+
+import errno
+import json
+from collections import OrderedDict
+
 import knack.output
+from knack.events import EVENT_INVOKER_POST_PARSE_ARGS, EVENT_INVOKER_FILTER_RESULT
+from knack.query import CLIQuery
+from knack.util import CommandResultItem
+
+# Output formats which can be written page by page as a paged result arrives
+STREAMING_OUTPUT_FORMATS = ['jsonl', 'tsv', 'table']
 
 
 class AzOutputProducer(knack.output.OutputProducer):
     def __init__(self, cli_ctx=None):
         super(AzOutputProducer, self).__init__(cli_ctx)
         additional_formats = {
+            'jsonl': self.format_jsonl,
             'yaml': self.format_yaml,
             'none': self.format_none
         }
         super(AzOutputProducer, self)._FORMAT_DICT.update(additional_formats)
 
+    @staticmethod
+    def format_jsonl(obj):
+        result = obj.result
+        return _dump_json_lines(result if isinstance(result, list) else [result])
+
     @staticmethod
     def format_yaml(obj):
         from yaml import (safe_dump, representer)
-        import json
 
         try:
             return safe_dump(obj.result, default_flow_style=False)
@@ -33,6 +50,203 @@ class AzOutputProducer(knack.output.OutputProducer):
     def check_valid_format_type(self, format_type):
         return format_type in self._FORMAT_DICT
 
+    def out(self, obj, formatter=None, out_file=None):
+        if isinstance(obj, CommandResultItem) and isinstance(obj.result, StreamedResult):
+            writer = _get_stream_writer(get_output_format(self.cli_ctx), obj)
+            if writer:
+                self._out_streamed(obj.result, writer, out_file)
+                return
+            obj.result = list(obj.result)
+        super(AzOutputProducer, self).out(obj, formatter=formatter, out_file=out_file)
+
+    @staticmethod
+    def _out_streamed(result, writer, out_file):
+        import platform
+        import colorama
+
+        if platform.system() == 'Windows':
+            out_file = colorama.AnsiToWin32(out_file).stream
+        for page in result.iter_pages():
+            output = writer(page)
+            if not output:
+                continue
+            try:
+                print(output, file=out_file, end='')
+                out_file.flush()
+            except IOError as ex:
+                if ex.errno == errno.EPIPE:
+                    return
+                raise
+            except UnicodeEncodeError:
+                print(output.encode('ascii', 'ignore').decode('utf-8', 'ignore'), file=out_file, end='')
+
+
+class StreamedResult(object):
+    """
+    A paged command result that is converted, transformed, queried and written out one page at a time instead
+    of being materialized first.
+
+    :param pages: An iterable of pages, each a list of SDK objects
+    :param convert: Converts a single SDK object into its output representation
+    """
+
+    def __init__(self, pages, convert):
+        self._pages = pages
+        self._convert = convert
+        self._query = None
+
+    def apply_query(self, query):
+        """ Applies a compiled JMESPath query to each item. Returns False if the query needs the whole result. """
+        item_query = _get_item_query(query)
+        if item_query is None:
+            return False
+        self._query = item_query
+        return True
+
+    def iter_pages(self):
+        for page in self._pages:
+            items = [self._convert(item) for item in page]
+            yield self._query(items) if self._query else items
+
+    def __iter__(self):
+        for page in self.iter_pages():
+            for item in page:
+                yield item
+
+
+class AzCliQuery(CLIQuery):
+    """ Handles --query, applying it to streamed results one item at a time where the expression allows it. """
+
+    def __init__(self, cli_ctx=None):
+        super(AzCliQuery, self).__init__(cli_ctx=cli_ctx)
+        self.cli_ctx.unregister_event(EVENT_INVOKER_POST_PARSE_ARGS, CLIQuery.handle_query_parameter)
+        self.cli_ctx.register_event(EVENT_INVOKER_POST_PARSE_ARGS, AzCliQuery.handle_query_parameter)
+
+    @staticmethod
+    def handle_query_parameter(cli_ctx, **kwargs):
+        args = kwargs['args']
+        query_expression = args._jmespath_query  # pylint: disable=protected-access
+        del args._jmespath_query
+        if query_expression:
+            def filter_output(cli_ctx, **kwargs):
+                from jmespath import Options
+                cli_ctx.unregister_event(EVENT_INVOKER_FILTER_RESULT, filter_output)
+                result = kwargs['event_data']['result']
+                if isinstance(result, StreamedResult):
+                    if result.apply_query(query_expression):
+                        return
+                    result = list(result)
+                kwargs['event_data']['result'] = query_expression.search(result, Options(OrderedDict))
+            cli_ctx.register_event(EVENT_INVOKER_FILTER_RESULT, filter_output)
+            cli_ctx.invocation.data['query_active'] = True
+
+
+def _is_false(value):
+    # JMESPath false values
+    return value is None or value is False or value in ('', [], {})
+
+
+def _get_item_query(query):
+    """
+    Returns a function applying the query to a list of items one item at a time, or None if the query can't be
+    applied that way. That is the case for list projections like `[].name`, `[*].{n:name}` and `[?x=='y'].name`.
+    """
+    from jmespath.visitor import Options, TreeInterpreter
+
+    node = query.parsed
+    flatten = False
+    condition = None
+    if node['type'] == 'projection':
+        left, right = node['children']
+        if left['type'] == 'flatten' and left['children'][0]['type'] == 'identity':
+            flatten = True
+        elif left['type'] != 'identity':
+            return None
+    elif node['type'] == 'filter_projection':
+        left, right, condition = node['children']
+        if left['type'] != 'identity':
+            return None
+    else:
+        return None
+
+    interpreter = TreeInterpreter(Options(OrderedDict))
+
+    def _search(items):
+        if flatten:
+            flattened = []
+            for item in items:
+                if isinstance(item, list):
+                    flattened.extend(item)
+                else:
+                    flattened.append(item)
+            items = flattened
+        results = []
+        for item in items:
+            if condition is not None and _is_false(interpreter.visit(condition, item)):
+                continue
+            value = interpreter.visit(right, item)
+            if value is not None:
+                results.append(value)
+        return results
+
+    return _search
+
+
+def _dump_json_lines(items):
+    return ''.join(json.dumps(item, ensure_ascii=False, sort_keys=True, default=str) + '\n' for item in items)
+
+
+def _get_stream_writer(format_type, obj):
+    if format_type == 'jsonl':
+        return _dump_json_lines
+    if format_type == 'tsv':
+        return lambda page: knack.output.format_tsv(CommandResultItem(page))
+    if format_type == 'table':
+        return _StreamingTableWriter(obj.table_transformer, obj.is_query_active)
+    return None
+
+
+class _StreamingTableWriter(object):  # pylint: disable=too-few-public-methods
+    """ Writes a table page by page. Columns and their widths are fixed by the first non-empty page. """
+
+    def __init__(self, table_transformer=None, is_query_active=False):
+        self._table_transformer = None if is_query_active else table_transformer
+        self._should_sort_keys = not is_query_active and not table_transformer
+        self._columns = None
+        self._widths = None
+
+    @staticmethod
+    def _cell(value):
+        return '' if value is None else str(value)
+
+    def _transform(self, page):
+        if not self._table_transformer:
+            return page
+        if isinstance(self._table_transformer, str):
+            from jmespath import compile as compile_jmes, Options
+            page = compile_jmes(self._table_transformer).search(page, Options(OrderedDict))
+        else:
+            page = self._table_transformer(page)
+        return page if isinstance(page, list) else [page]
+
+    def __call__(self, page):
+        rows = knack.output._TableOutput(self._should_sort_keys)._auto_table(  # pylint: disable=protected-access
+            self._transform(page))
+        if not rows:
+            return ''
+        lines = []
+        if self._columns is None:
+            self._columns = []
+            for row in rows:
+                self._columns.extend(k for k in row if k not in self._columns)
+            self._widths = [max([len(c)] + [len(self._cell(row.get(c))) for row in rows]) for c in self._columns]
+            lines.append('  '.join(c.ljust(w) for c, w in zip(self._columns, self._widths)).rstrip())
+            lines.append('  '.join('-' * w for w in self._widths))
+        for row in rows:
+            lines.append('  '.join(self._cell(row.get(c)).ljust(w)
+                                   for c, w in zip(self._columns, self._widths)).rstrip())
+        return '\n'.join(lines) + '\n'
+
 
 def get_output_format(cli_ctx):
     return cli_ctx.invocation.data.get("output", None)
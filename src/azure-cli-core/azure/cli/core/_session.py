@@ -3,10 +3,12 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
+import atexit
 import json
 import logging
 import os
 import time
+from contextlib import contextmanager
 
 try:
     import collections.abc as collections
@@ -27,8 +29,14 @@ class Session(collections.MutableMapping):
     """
     A simple dict-like class that is backed by a JSON file.
 
-    All direct modifications will save the file. Indirect modifications should
-    be followed by a call to `save_with_retry` or `save`.
+    Direct modifications are kept in memory and written once, on `commit` or when the process exits. Indirect
+    modifications should be followed by a call to `save_with_retry` or `save`, which write immediately.
+
+    The file is replaced atomically with a temporary file while holding an advisory lock, so concurrent processes
+    never read a partially written file. When another process has written the file since it was loaded, it is read
+    again under the lock and only the keys modified by this process are written over it.
+
+    Within a process, loading a file that has not changed since it was last parsed or saved is skipped.
     """
 
     def __init__(self, encoding=None):
@@ -36,17 +44,30 @@ class Session(collections.MutableMapping):
         self.filename = None
         self.data = {}
         self._encoding = encoding if encoding else 'utf-8-sig'
+        self._dirty = False
+        self._signature = None
+        # JSON text the data was loaded from, to find the keys modified since. None when the file is to be replaced.
+        self._base_text = None
 
     def load(self, filename, max_age=0):
-        self.filename = filename
-        self.data = {}
+        self.commit()
         try:
-            if max_age > 0:
-                st = os.stat(self.filename)
-                if st.st_mtime + max_age < time.time():
-                    self.save()
+            signature = _get_file_signature(filename)
+            if max_age > 0 and signature[1] + max_age < time.time():
+                self.filename = filename
+                self.data = {}
+                self._base_text = None
+                self.save()
+                return
+            if filename == self.filename and signature == self._signature:
+                return
+            self.filename = filename
+            self.data = {}
             with codecs_open(self.filename, 'r', encoding=self._encoding) as f:
-                self.data = json.load(f)
+                text = f.read()
+            self.data = json.loads(text)
+            self._base_text = text
+            self._signature = signature
         except (OSError, IOError, t_JSONDecodeError) as load_exception:
             # OSError / IOError should imply file not found issues which are expected on fresh runs (e.g. on build
             # agents or new systems). A parse error indicates invalid/bad data in the file. We do not wish to warn
@@ -55,6 +76,11 @@ class Session(collections.MutableMapping):
             if isinstance(load_exception, t_JSONDecodeError):
                 log_level = logging.WARNING
 
+            self.filename = filename
+            self.data = {}
+            self._signature = None
+            # a file that can't be parsed is replaced, a missing one may have been created by another process since
+            self._base_text = None if isinstance(load_exception, t_JSONDecodeError) else '{}'
             get_logger(__name__).log(log_level,
                                      "Failed to load or parse file %s. It will be overridden by default settings.",
                                      self.filename)
@@ -62,8 +88,37 @@ class Session(collections.MutableMapping):
 
     def save(self):
         if self.filename:
-            with codecs_open(self.filename, 'w', encoding=self._encoding) as f:
-                json.dump(self.data, f)
+            with _lock_file(self.filename):
+                self._merge_concurrent_changes()
+                text = json.dumps(self.data)
+                _write_file_atomically(self.filename, text.encode(self._encoding))
+                self._signature = _get_file_signature(self.filename)
+                self._base_text = text
+        self._dirty = False
+
+    def _merge_concurrent_changes(self):
+        """ Take the keys this process didn't modify from the file, if another process has written it since. """
+        if self._base_text is None:
+            return
+        try:
+            if _get_file_signature(self.filename) == self._signature:
+                return
+            with codecs_open(self.filename, 'r', encoding=self._encoding) as f:
+                current = json.loads(f.read())
+        except (OSError, IOError, t_JSONDecodeError):
+            return
+        if not isinstance(current, dict):
+            return
+        base = json.loads(self._base_text)
+        for key in set(base) | set(current) | set(self.data):
+            value = self.data.get(key, _MISSING)
+            # an empty dict added by __getitem__ doesn't count as a modification
+            if value != base.get(key, _MISSING) and not (key not in base and value == {}):
+                continue
+            if key in current:
+                self.data[key] = current[key]
+            elif key in base:
+                del self.data[key]
 
     def save_with_retry(self, retries=5):
         for _ in range(retries - 1):
@@ -75,6 +130,16 @@ class Session(collections.MutableMapping):
         else:
             self.save()
 
+    def commit(self):
+        """ Write the direct modifications that have not been saved yet. """
+        if self._dirty:
+            self.save_with_retry()
+
+    def _mark_dirty(self):
+        if not self._dirty:
+            self._dirty = True
+            _PENDING_SESSIONS.append(self)
+
     def get(self, key, default=None):
         return self.data.get(key, default)
 
@@ -83,11 +148,11 @@ class Session(collections.MutableMapping):
 
     def __setitem__(self, key, value):
         self.data[key] = value
-        self.save_with_retry()
+        self._mark_dirty()
 
     def __delitem__(self, key):
         del self.data[key]
-        self.save_with_retry()
+        self._mark_dirty()
 
     def __iter__(self):
         return iter(self.data)
@@ -96,6 +161,80 @@ class Session(collections.MutableMapping):
         return len(self.data)
 
 
+_MISSING = object()
+
+# Sessions with modifications that have not been written yet
+_PENDING_SESSIONS = []
+
+
+def commit_sessions():
+    """ Write the pending modifications of every session. """
+    while _PENDING_SESSIONS:
+        session = _PENDING_SESSIONS.pop()
+        try:
+            session.commit()
+        except (OSError, IOError):
+            get_logger(__name__).warning("Failed to save file %s.", session.filename)
+
+
+atexit.register(commit_sessions)
+
+
+def _get_file_signature(filename):
+    st = os.stat(filename)
+    return getattr(st, 'st_mtime_ns', st.st_mtime), st.st_mtime, st.st_size
+
+
+@contextmanager
+def _lock_file(filename):
+    """ Hold an advisory lock on a lock file next to the given file. """
+    with open(filename + '.lock', 'a') as lock_file:
+        try:
+            import fcntl
+        except ImportError:
+            import msvcrt
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _write_file_atomically(filename, content):
+    import stat
+    import tempfile
+    directory, name = os.path.split(os.path.abspath(filename))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=name + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(temp_path, stat.S_IMODE(os.stat(filename).st_mode))
+        except OSError:
+            pass
+        if hasattr(os, 'replace'):
+            os.replace(temp_path, filename)
+        else:
+            # Python 2 cannot rename over an existing file on Windows
+            if os.name == 'nt' and os.path.exists(filename):
+                os.remove(filename)
+            os.rename(temp_path, filename)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
 # ACCOUNT contains subscriptions information
 ACCOUNT = Session()
 
@@ -104,3 +243,15 @@ CONFIG = Session()
 
 # SESSION provides read-write session variables
 SESSION = Session()
+
+# INDEX contains {top-level command: [command_modules and extensions]} mapping index
+INDEX = Session()
+
+# PROVIDERS caches the resource types and API versions of resource providers
+PROVIDERS = Session()
+
+# COMPLETIONS caches the results of dynamic argument completers
+COMPLETIONS = Session()
+
+# EXTENSIONS caches the listing and metadata of the installed extensions
+EXTENSIONS = Session()
@@ -45,6 +45,7 @@ except AttributeError:  # in Python 2.7
 
 logger = get_logger(__name__)
 DEFAULT_CACHE_TTL = '10'
+DEFAULT_MAX_CONCURRENT_IDS = 10
 
 
 def _explode_list_args(args):
@@ -587,7 +588,9 @@ class AzCliCommandInvoker(CommandInvoker):
         for expanded_arg in _explode_list_args(parsed_args):
             cmd_copy = copy.copy(cmd)
             cmd_copy.cli_ctx = copy.copy(cmd.cli_ctx)
-            cmd_copy.cli_ctx.data = copy.deepcopy(cmd.cli_ctx.data)
+            # Jobs only replace top-level entries, so a shallow copy (plus the mutable headers) isolates them
+            cmd_copy.cli_ctx.data = dict(cmd.cli_ctx.data)
+            cmd_copy.cli_ctx.data['headers'] = dict(cmd.cli_ctx.data.get('headers', {}))
             expanded_arg.cmd = expanded_arg._cmd = cmd_copy
 
             if hasattr(expanded_arg, '_subscription'):
@@ -597,7 +600,9 @@ class AzCliCommandInvoker(CommandInvoker):
             jobs.append((expanded_arg, cmd_copy))
 
         ids = getattr(parsed_args, '_ids', None) or [None] * len(jobs)
-        if self.cli_ctx.config.getboolean('core', 'disable_concurrent_ids', False) or len(ids) < 2:
+        if len(jobs) == 1 and self._is_streaming_output():
+            results, exceptions = self._run_jobs_serially(jobs, ids, stream=True)
+        elif self.cli_ctx.config.getboolean('core', 'disable_concurrent_ids', False) or len(ids) < 2:
             results, exceptions = self._run_jobs_serially(jobs, ids)
         else:
             results, exceptions = self._run_jobs_concurrently(jobs, ids)
@@ -630,9 +635,27 @@ class AzCliCommandInvoker(CommandInvoker):
         return [(p.split('=', 1)[0] if p.startswith('--') else p[:2]) for p in args if
                 (p.startswith('-') and not p.startswith('---') and len(p) > 1)]
 
-    def _run_job(self, expanded_arg, cmd_copy):
+    def _is_streaming_output(self):
+        """ Whether paged results should be written out page by page. This is always the case for jsonl output,
+        while tsv and table output stream when the core.stream_output setting is enabled. """
+        from azure.cli.core._output import STREAMING_OUTPUT_FORMATS
+        output_format = self.data.get('output')
+        if output_format == 'jsonl':
+            return True
+        return output_format in STREAMING_OUTPUT_FORMATS and \
+            self.cli_ctx.config.getboolean('core', 'stream_output', False)
+
+    @staticmethod
+    def _convert_result(result, cmd_copy):
+        result = todict(result, AzCliCommandInvoker.remove_additional_prop_layer)
+        event_data = {'result': result}
+        cmd_copy.cli_ctx.raise_event(EVENT_INVOKER_TRANSFORM_RESULT, event_data=event_data)
+        return event_data['result']
+
+    def _run_job(self, expanded_arg, cmd_copy, stream=False, limiter=None):
         params = self._filter_params(expanded_arg)
-        try:
+
+        def _run():
             result = cmd_copy(params)
             if cmd_copy.supports_no_wait and getattr(expanded_arg, 'no_wait', False):
                 result = None
@@ -646,39 +669,48 @@ class AzCliCommandInvoker(CommandInvoker):
             if _is_poller(result):
                 result = LongRunningOperation(cmd_copy.cli_ctx, 'Starting {}'.format(cmd_copy.name))(result)
             elif _is_paged(result):
+                if stream and not transform_op:
+                    from azure.cli.core._output import StreamedResult
+                    return StreamedResult(_iter_pages(result, cmd_copy.exception_handler),
+                                          lambda item: AzCliCommandInvoker._convert_result(item, cmd_copy))
                 result = list(result)
 
-            result = todict(result, AzCliCommandInvoker.remove_additional_prop_layer)
-            event_data = {'result': result}
-            cmd_copy.cli_ctx.raise_event(EVENT_INVOKER_TRANSFORM_RESULT, event_data=event_data)
-            return event_data['result']
+            return AzCliCommandInvoker._convert_result(result, cmd_copy)
+
+        try:
+            # throttled jobs are retried by the limiter before their errors reach the exception handler
+            return limiter.call(_run) if limiter else _run()
         except Exception as ex:  # pylint: disable=broad-except
             if cmd_copy.exception_handler:
                 cmd_copy.exception_handler(ex)
                 return CommandResultItem(None, exit_code=1, error=ex)
             six.reraise(*sys.exc_info())
 
-    def _run_jobs_serially(self, jobs, ids):
+    def _run_jobs_serially(self, jobs, ids, stream=False):
         results, exceptions = [], []
         for job, id_arg in zip(jobs, ids):
             expanded_arg, cmd_copy = job
             try:
-                results.append(self._run_job(expanded_arg, cmd_copy))
+                results.append(self._run_job(expanded_arg, cmd_copy, stream=stream))
             except(Exception, SystemExit) as ex:  # pylint: disable=broad-except
                 exceptions.append((ex, id_arg))
         return results, exceptions
 
     def _run_jobs_concurrently(self, jobs, ids):
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        tasks, results, exceptions = [], [], []
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            for expanded_arg, cmd_copy in jobs:
-                tasks.append(executor.submit(self._run_job, expanded_arg, cmd_copy))
-            for index, task in enumerate(as_completed(tasks)):
+        from concurrent.futures import ThreadPoolExecutor
+        from azure.cli.core.util import AdaptiveConcurrencyLimiter
+        max_workers = self.cli_ctx.config.getint('core', 'max_concurrent_ids', fallback=DEFAULT_MAX_CONCURRENT_IDS)
+        limiter = AdaptiveConcurrencyLimiter(max_workers)
+        results, exceptions = [], []
+        with ThreadPoolExecutor(max_workers=limiter.max_limit) as executor:
+            tasks = [executor.submit(self._run_job, expanded_arg, cmd_copy, limiter=limiter)
+                     for expanded_arg, cmd_copy in jobs]
+            # collect in submission order so results and errors line up with the ids they were requested for
+            for task, id_arg in zip(tasks, ids):
                 try:
                     results.append(task.result())
                 except (Exception, SystemExit) as ex:  # pylint: disable=broad-except
-                    exceptions.append((ex, ids[index]))
+                    exceptions.append((ex, id_arg))
         return results, exceptions
 
     def resolve_warnings(self, cmd, parsed_args):
@@ -1029,6 +1061,25 @@ def _is_paged(obj):
     return False
 
 
+def _iter_pages(paged, exception_handler=None):
+    """
+    Yield the pages of a msrest Paged iterator as they are fetched. The pages are fetched while the result is written
+    out, so errors are given to the exception handler of the command as they would be when running it.
+    """
+    while True:
+        try:
+            page = paged.advance_page()
+        except StopIteration:
+            return
+        except Exception as ex:  # pylint: disable=broad-except
+            if exception_handler:
+                exc_info = sys.exc_info()
+                exception_handler(ex)
+                six.reraise(*exc_info)
+            raise
+        yield page
+
+
 def _is_poller(obj):
     # Since loading msrest is expensive, we avoid it until we have to
     if obj.__class__.__name__ in ['AzureOperationPoller', 'LROPoller']:
@@ -10,6 +10,7 @@ from collections import OrderedDict
 import copy
 import json
 import re
+import threading
 from six import string_types
 
 from azure.cli.core import AzCommandsLoader, EXCLUDED_PARAMS
@@ -29,6 +30,8 @@ from knack.util import todict, CLIError
 logger = get_logger(__name__)
 EXCLUDED_NON_CLIENT_PARAMS = list(set(EXCLUDED_PARAMS) - set(['self', 'client']))
 
+DEFAULT_PROVIDER_CACHE_TTL_HOURS = 24
+
 
 # pylint:disable=too-many-lines
 class ArmTemplateBuilder(object):
@@ -1139,7 +1142,7 @@ def get_arm_resource_by_id(cli_ctx, arm_id, api_version=None):
                 highest_child = child_number
 
         # retrieve provider info for the namespace
-        provider = client.providers.get(namespace)
+        provider = get_provider(cli_ctx, client, namespace)
 
         # assemble the resource type key used by the provider list operation.  type1/type2/type3/...
         resource_type_str = ''
@@ -1167,3 +1170,71 @@ def get_arm_resource_by_id(cli_ctx, arm_id, api_version=None):
             api_version = next((x for x in rt.api_versions if not x.endswith('preview')), rt.api_versions[0])
 
     return client.resources.get_by_id(arm_id, api_version)
+
+
+_provider_cache_lock = threading.Lock()
+_provider_fetch_locks = {}
+
+
+def get_provider(cli_ctx, client, namespace, resource_type=None, refresh=False):
+    """
+    Get a resource provider with its resource types and their API versions.
+
+    Providers are cached per cloud and subscription in the config dir for `core.provider_cache_ttl_hours` (0
+    disables the cache), so resolving the API version of many resources only fetches each provider once. The
+    provider is fetched again if `refresh` is set, at most once per command invocation, or if `resource_type` is not
+    one of its cached resource types. Concurrent calls for the same provider wait for a single fetch.
+    """
+    import time
+    ttl = cli_ctx.config.getint('core', 'provider_cache_ttl_hours', fallback=DEFAULT_PROVIDER_CACHE_TTL_HOURS) * 3600
+    if ttl <= 0:
+        return client.providers.get(namespace)
+
+    key = '{}/{}/{}'.format(cli_ctx.cloud.name, client.config.subscription_id, namespace).lower()
+    with _provider_cache_lock:
+        fetch_lock = _provider_fetch_locks.setdefault(key, threading.Lock())
+    with fetch_lock:
+        cache = _load_provider_cache(cli_ctx)
+        entry = cache.get(key)
+        if refresh:
+            refresh = _mark_provider_refreshed(cli_ctx, key)
+        if not refresh and entry and entry['time'] + ttl > time.time():
+            resource_types = [t['resourceType'].lower() for t in entry['provider']['resourceTypes']]
+            if resource_type is None or resource_type.lower() in resource_types:
+                logger.debug("Using cached resource provider '%s'.", namespace)
+                return client.providers.models.Provider.deserialize(entry['provider'])
+
+        provider = client.providers.get(namespace)
+        with _provider_cache_lock:
+            cache[key] = {
+                'time': time.time(),
+                'provider': {
+                    'namespace': provider.namespace,
+                    'resourceTypes': [{'resourceType': t.resource_type, 'apiVersions': t.api_versions}
+                                      for t in provider.resource_types or []]
+                }
+            }
+        return provider
+
+
+def _load_provider_cache(cli_ctx):
+    import os
+    from azure.cli.core._session import PROVIDERS
+    with _provider_cache_lock:
+        if PROVIDERS.filename is None:
+            PROVIDERS.load(os.path.join(cli_ctx.config.config_dir, 'providerCache.json'))
+    return PROVIDERS
+
+
+def _mark_provider_refreshed(cli_ctx, key):
+    """ Record that a provider is refreshed by the current command invocation. Return False if it already was. """
+    from azure.cli.core.commands.client_factory import _get_invocation_cache
+    cache = _get_invocation_cache(cli_ctx)
+    if cache is None:
+        return True
+    with _provider_cache_lock:
+        refreshed = cache.setdefault('refreshed_providers', set())
+        if key in refreshed:
+            return False
+        refreshed.add(key)
+    return True
@@ -4,6 +4,7 @@
 # --------------------------------------------------------------------------------------------
 
 import os
+import threading
 
 from azure.cli.core import __version__ as core_version
 import azure.cli.core._debug as _debug
@@ -18,6 +19,9 @@ logger = get_logger(__name__)
 UA_AGENT = "AZURECLI/{}".format(core_version)
 ENV_ADDITIONAL_USER_AGENT = 'AZURE_HTTP_USER_AGENT'
 
+# guards the credentials and HTTP session shared by the clients of an invocation
+_invocation_cache_lock = threading.Lock()
+
 
 def resolve_client_arg_name(operation, kwargs):
     if not isinstance(operation, str):
@@ -119,12 +123,9 @@ def _get_mgmt_service_client(cli_ctx,
                              sdk_profile=None,
                              aux_subscriptions=None,
                              **kwargs):
-    from azure.cli.core._profile import Profile
     logger.debug('Getting management service client client_type=%s', client_type.__name__)
     resource = resource or cli_ctx.cloud.endpoints.active_directory_resource_id
-    profile = Profile(cli_ctx=cli_ctx)
-    cred, subscription_id, _ = profile.get_login_credentials(subscription_id=subscription_id, resource=resource,
-                                                             aux_subscriptions=aux_subscriptions)
+    cred, subscription_id = _get_login_credentials(cli_ctx, subscription_id, resource, aux_subscriptions)
 
     client_kwargs = {}
     if base_url_bound:
@@ -142,10 +143,69 @@ def _get_mgmt_service_client(cli_ctx,
         client = client_type(cred, **client_kwargs)
 
     configure_common_settings(cli_ctx, client)
+    _use_shared_http_session(cli_ctx, client)
 
     return client, subscription_id
 
 
+def _get_invocation_cache(cli_ctx):
+    invocation = getattr(cli_ctx, 'invocation', None)
+    data = getattr(invocation, 'data', None)
+    return data if isinstance(data, dict) else None
+
+
+def _get_login_credentials(cli_ctx, subscription_id, resource, aux_subscriptions):
+    """
+    Resolve the credentials of a subscription. They are resolved once per command invocation, and shared by all the
+    clients created for the same subscription and resource, including those of concurrent --ids jobs.
+    """
+    from azure.cli.core._profile import Profile
+    cache = _get_invocation_cache(cli_ctx)
+    if cache is None:
+        cred, subscription_id, _ = Profile(cli_ctx=cli_ctx).get_login_credentials(
+            subscription_id=subscription_id, resource=resource, aux_subscriptions=aux_subscriptions)
+        return cred, subscription_id
+
+    key = (subscription_id, resource, tuple(aux_subscriptions or []))
+    with _invocation_cache_lock:
+        credentials = cache.setdefault('mgmt_credentials', {})
+        if key not in credentials:
+            cred, resolved_subscription_id, _ = Profile(cli_ctx=cli_ctx).get_login_credentials(
+                subscription_id=subscription_id, resource=resource, aux_subscriptions=aux_subscriptions)
+            credentials[key] = (cred, resolved_subscription_id)
+        return credentials[key]
+
+
+def _use_shared_http_session(cli_ctx, client):
+    """
+    Send the requests of a management client through a keep-alive connection pool shared by the clients of the
+    command invocation, instead of a session that is closed after every request.
+    """
+    cache = _get_invocation_cache(cli_ctx)
+    if cache is None:
+        return
+    try:
+        driver = client._client.config.pipeline._sender.driver  # pylint: disable=protected-access
+    except AttributeError:
+        # msrest versions without a pipeline manage their own sessions
+        return
+
+    with _invocation_cache_lock:
+        session = cache.get('mgmt_http_session')
+        if session is None:
+            import requests
+            from azure.cli.core.commands import DEFAULT_MAX_CONCURRENT_IDS
+            pool_size = max(10, cli_ctx.config.getint('core', 'max_concurrent_ids',
+                                                      fallback=DEFAULT_MAX_CONCURRENT_IDS))
+            session = requests.Session()
+            for prefix in ('https://', 'http://'):
+                session.mount(prefix, requests.adapters.HTTPAdapter(pool_connections=pool_size,
+                                                                    pool_maxsize=pool_size))
+            cache['mgmt_http_session'] = session
+    driver.session = session
+    client.config.keep_alive = True
+
+
 def get_data_service_client(cli_ctx, service_type, account_name, account_key, connection_string=None,
                             sas_token=None, socket_timeout=None, token_credential=None, endpoint_suffix=None):
     logger.debug('Getting data service client service_type=%s', service_type.__name__)
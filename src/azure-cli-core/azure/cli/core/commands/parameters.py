@@ -27,7 +27,7 @@ def get_subscription_locations(cli_ctx):
     return list(subscription_client.subscriptions.list_locations(subscription_id))
 
 
-@Completer
+@Completer.cached()
 def get_location_completion_list(cmd, prefix, namespace, **kwargs):  # pylint: disable=unused-argument
     result = get_subscription_locations(cmd.cli_ctx)
     return [l.name for l in result]
@@ -113,7 +113,7 @@ def get_resource_groups(cli_ctx):
     return list(rcf.resource_groups.list())
 
 
-@Completer
+@Completer.cached()
 def get_resource_group_completion_list(cmd, prefix, namespace, **kwargs):  # pylint: disable=unused-argument
     result = get_resource_groups(cmd.cli_ctx)
     return [l.name for l in result]
@@ -139,7 +139,7 @@ def get_resources_in_subscription(cli_ctx, resource_type=None):
 
 def get_resource_name_completion_list(resource_type=None):
 
-    @Completer
+    @Completer.cached('resource_group_name', name='get_resource_name_completion_list.{}'.format(resource_type))
     def completer(cmd, prefix, namespace, **kwargs):  # pylint: disable=unused-argument
         rg = getattr(namespace, 'resource_group_name', None)
         if rg:
@@ -9,10 +9,50 @@ from azure.cli.core.util import b64_to_hex
 
 import knack.events as events
 
+_NODE_TRANSFORMS_KEY = 'node_transforms'
+
 
 def register_global_transforms(cli_ctx):
-    cli_ctx.register_event(events.EVENT_INVOKER_TRANSFORM_RESULT, _resource_group_transform)
-    cli_ctx.register_event(events.EVENT_INVOKER_TRANSFORM_RESULT, _x509_from_base64_to_hex_transform)
+    register_node_transform(cli_ctx, _add_resource_group_to_node, skip_keys=['sourceVault'])
+    register_node_transform(cli_ctx, _add_x509_hex_to_node)
+    cli_ctx.register_event(events.EVENT_INVOKER_TRANSFORM_RESULT, _node_transform)
+
+
+def register_node_transform(cli_ctx, transform, skip_keys=None):
+    """ Register a transform applied in place to every dict of a command result.
+
+    All registered transforms share a single walk of the result. The values under any of `skip_keys`
+    are not visited by this transform. Registering the same transform again has no effect.
+    """
+    node_transforms = cli_ctx.data.setdefault(_NODE_TRANSFORMS_KEY, [])
+    if all(t is not transform for t, _ in node_transforms):
+        node_transforms.append((transform, frozenset(skip_keys or [])))
+
+
+def _apply_node_transforms(obj, node_transforms):
+    if not node_transforms:
+        return
+    skip_keys = frozenset().union(*(keys for _, keys in node_transforms))
+    stack = [(obj, tuple(node_transforms))]
+    while stack:
+        node, active = stack.pop()
+        if isinstance(node, dict):
+            for transform, _ in active:
+                transform(node)
+            items = node.items()
+        elif isinstance(node, list):
+            items = ((None, item) for item in node)
+        else:
+            continue
+        for key, value in items:
+            if not isinstance(value, (dict, list)):
+                continue
+            if key in skip_keys:
+                child_active = tuple(t for t in active if key not in t[1])
+                if child_active:
+                    stack.append((value, child_active))
+            else:
+                stack.append((value, active))
 
 
 def _parse_id(strid):
@@ -26,40 +66,38 @@ def _parse_id(strid):
     return parsed
 
 
+def _add_resource_group_to_node(obj):
+    if 'resourceGroup' in obj:
+        return
+    resource_id = obj.get('id')
+    if not resource_id:
+        return
+    try:
+        if all(key.lower() != 'resourcegroup' for key in obj):
+            obj['resourceGroup'] = _parse_id(resource_id)['resource-group']
+    except (KeyError, IndexError, TypeError, AttributeError):
+        pass
+
+
+def _add_x509_hex_to_node(obj):
+    if 'x509ThumbprintHex' in obj:
+        return
+    thumbprint = obj.get('x509Thumbprint')
+    if not thumbprint:
+        return
+    try:
+        obj['x509ThumbprintHex'] = b64_to_hex(thumbprint)
+    except (KeyError, IndexError, TypeError):
+        pass
+
+
 def _add_resource_group(obj):
-    if isinstance(obj, list):
-        for array_item in obj:
-            _add_resource_group(array_item)
-    elif isinstance(obj, dict):
-        try:
-            if 'resourcegroup' not in [x.lower() for x in obj.keys()]:
-                if obj['id']:
-                    obj['resourceGroup'] = _parse_id(obj['id'])['resource-group']
-        except (KeyError, IndexError, TypeError):
-            pass
-        for item_key in obj:
-            if item_key != 'sourceVault':
-                _add_resource_group(obj[item_key])
+    _apply_node_transforms(obj, [(_add_resource_group_to_node, frozenset(['sourceVault']))])
 
 
 def _add_x509_hex(obj):
-    if isinstance(obj, list):
-        for array_item in obj:
-            _add_x509_hex(array_item)
-    elif isinstance(obj, dict):
-        try:
-            if 'x509ThumbprintHex' not in obj:
-                if obj['x509Thumbprint']:
-                    obj['x509ThumbprintHex'] = b64_to_hex(obj['x509Thumbprint'])
-        except (KeyError, IndexError, TypeError):
-            pass
-        for item_key in obj:
-            _add_x509_hex(obj[item_key])
-
-
-def _resource_group_transform(_, **kwargs):
-    _add_resource_group(kwargs['event_data']['result'])
-
-
-def _x509_from_base64_to_hex_transform(_, **kwargs):
-    _add_x509_hex(kwargs['event_data']['result'])
+    _apply_node_transforms(obj, [(_add_x509_hex_to_node, frozenset())])
+
+
+def _node_transform(cli_ctx, **kwargs):
+    _apply_node_transforms(kwargs['event_data']['result'], cli_ctx.data.get(_NODE_TRANSFORMS_KEY, []))
@@ -0,0 +1,373 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""
+Opt-in resident `az` daemon
+
+The daemon keeps a warmed AzCli, with every command module already imported, behind a local Unix socket. The `az`
+entry point forwards argv, environment, working directory and its stdin/stdout/stderr file descriptors to the daemon,
+which forks a child from the warmed process to run the command and reports the exit code back. Enable it with the
+`use_daemon` option in the `[core]` section of the CLI config file or the `AZURE_CORE_USE_DAEMON` environment variable.
+
+The client half of this module runs before the CLI is loaded, so it should only import modules from the Python
+Standard Library and knack.
+"""
+
+from __future__ import print_function
+
+import errno
+import json
+import os
+import socket
+import struct
+import sys
+
+from knack.log import get_logger
+
+logger = get_logger(__name__)
+
+DAEMON_DIR_NAME = 'daemon'
+DEFAULT_IDLE_TIMEOUT = 1800  # seconds
+
+# Files whose changes invalidate the warmed AzCli held by the daemon
+_WATCHED_FILES = ['azureProfile.json', 'az.json', 'accessTokens.json', 'config', 'clouds.config']
+_HEADER = struct.Struct('!I')
+_MAX_SOCKET_PATH = 100
+_STDIO_FDS = [0, 1, 2]
+
+
+def is_daemon_supported():
+    return hasattr(socket, 'AF_UNIX') and hasattr(os, 'fork') and hasattr(socket.socket, 'sendmsg')
+
+
+def is_daemon_enabled():
+    from knack.completion import ARGCOMPLETE_ENV_NAME
+    if not is_daemon_supported() or ARGCOMPLETE_ENV_NAME in os.environ:
+        return False
+    return _get_config().getboolean('core', 'use_daemon', fallback=False)
+
+
+def get_socket_path(config_dir=None):
+    import hashlib
+    import tempfile
+    from azure.cli.core import __version__
+    from azure.cli.core._config import GLOBAL_CONFIG_DIR
+    config_dir = config_dir or GLOBAL_CONFIG_DIR
+    socket_path = os.path.join(config_dir, DAEMON_DIR_NAME, 'az-{}.sock'.format(__version__))
+    if len(socket_path) > _MAX_SOCKET_PATH:
+        # Unix socket paths are limited to ~108 bytes, so fall back to a per-user path in the temp dir
+        digest = hashlib.sha256(socket_path.encode('utf-8')).hexdigest()[:16]
+        socket_path = os.path.join(tempfile.gettempdir(), 'az-daemon-{}-{}'.format(os.getuid(), digest),
+                                   'az-{}.sock'.format(__version__))
+    return socket_path
+
+
+def run_in_daemon(args):
+    """
+    Forward an invocation to the daemon.
+
+    Returns the exit code of the command, or None when the command should run in-process. If the daemon is enabled
+    but not running, it is started in the background for the benefit of later invocations.
+    """
+    if not is_daemon_enabled():
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(get_socket_path())
+    except (OSError, IOError) as ex:
+        sock.close()
+        logger.debug("Unable to connect to the az daemon: %s", ex)
+        if ex.errno in (errno.ENOENT, errno.ECONNREFUSED):
+            start_daemon()
+        return None
+
+    try:
+        return _forward(sock, args)
+    finally:
+        sock.close()
+
+
+def _forward(sock, args):
+    import array
+    import signal
+
+    request = json.dumps({'argv': args, 'env': dict(os.environ), 'cwd': os.getcwd()}).encode('utf-8')
+    payload = _HEADER.pack(len(request)) + request
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        sent = sock.sendmsg([payload], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array('i', _STDIO_FDS))])
+        sock.sendall(payload[sent:])
+    except (OSError, IOError) as ex:
+        logger.debug("Unable to send the invocation to the az daemon: %s", ex)
+        return None
+
+    child_pid = None
+    previous_handlers = {}
+
+    def _forward_signal(signum, _):
+        try:
+            os.kill(child_pid, signum)
+        except OSError:
+            pass
+
+    try:
+        for line in sock.makefile('rb'):
+            message = json.loads(line.decode('utf-8'))
+            if 'pid' in message:
+                child_pid = message['pid']
+                for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+                    previous_handlers[signum] = signal.signal(signum, _forward_signal)
+            elif 'exit_code' in message:
+                return message['exit_code']
+    finally:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+
+    # The daemon went away. If it never started the command, run it in-process instead.
+    return None if child_pid is None else 1
+
+
+def start_daemon():
+    """ Start the daemon as a detached background process. """
+    import subprocess
+    try:
+        with open(os.devnull, 'r+b') as devnull:
+            subprocess.Popen([sys.executable, '-m', 'azure.cli.core.daemon'], stdin=devnull, stdout=devnull,
+                             stderr=devnull, cwd=os.path.abspath(os.sep), close_fds=True, start_new_session=True)
+        logger.debug("Started the az daemon.")
+    except (OSError, IOError) as ex:
+        logger.debug("Unable to start the az daemon: %s", ex)
+
+
+def _get_config():
+    from knack.config import CLIConfig
+    from azure.cli.core._config import GLOBAL_CONFIG_DIR, ENV_VAR_PREFIX
+    return CLIConfig(config_dir=GLOBAL_CONFIG_DIR, config_env_var_prefix=ENV_VAR_PREFIX)
+
+
+def _send_message(conn, message):
+    conn.sendall(json.dumps(message).encode('utf-8') + b'\n')
+
+
+def _receive_request(conn):
+    """ Read a length-prefixed JSON request and the stdio file descriptors passed along with it. """
+    import array
+    fds = array.array('i')
+    data = b''
+    expected = None
+    while expected is None or len(data) < expected:
+        chunk, ancdata, _, _ = conn.recvmsg(65536, socket.CMSG_SPACE(len(_STDIO_FDS) * fds.itemsize))
+        for level, kind, cmsg_data in ancdata:
+            if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+                fds.frombytes(cmsg_data[:len(cmsg_data) - (len(cmsg_data) % fds.itemsize)])
+        if not chunk:
+            break
+        data += chunk
+        if expected is None and len(data) >= _HEADER.size:
+            expected = _HEADER.size + _HEADER.unpack(data[:_HEADER.size])[0]
+    if expected is None or len(data) < expected or len(fds) != len(_STDIO_FDS):
+        for fd in fds:
+            os.close(fd)
+        raise ValueError('Incomplete request received by the az daemon.')
+    return json.loads(data[_HEADER.size:expected].decode('utf-8')), list(fds)
+
+
+def _get_file_signature(path):
+    try:
+        st = os.stat(path)
+        return st.st_mtime, st.st_size
+    except OSError:
+        return None
+
+
+def _invoke(cli, args):
+    """ Run a command the same way `python -m azure.cli` does and return its exit code. """
+    from knack.completion import ARGCOMPLETE_ENV_NAME
+    import azure.cli.core.telemetry as telemetry
+
+    # Every forked command gets its own telemetry session, not the one created when the daemon started
+    telemetry._session = telemetry.TelemetrySession()  # pylint: disable=protected-access
+    telemetry.set_application(cli, ARGCOMPLETE_ENV_NAME)
+    try:
+        telemetry.start()
+        exit_code = cli.invoke(args)
+        if exit_code and exit_code != 0:
+            telemetry.set_failure()
+        else:
+            telemetry.set_success()
+        cli.logging.end_cmd_metadata_logging(exit_code)
+    except KeyboardInterrupt:
+        telemetry.set_user_fault('keyboard interrupt')
+        exit_code = 1
+    except SystemExit as ex:
+        exit_code = ex.code if ex.code is not None else 1
+        cli.logging.end_cmd_metadata_logging(exit_code)
+    finally:
+        telemetry.conclude()
+
+    if not isinstance(exit_code, int):
+        print(exit_code, file=sys.stderr)
+        exit_code = 1
+    return exit_code
+
+
+class AzDaemon(object):
+    """ Serves `az` invocations from a warmed process. Each invocation runs in a forked child. """
+
+    def __init__(self, config_dir=None, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        from azure.cli.core._config import GLOBAL_CONFIG_DIR
+        self.config_dir = config_dir or GLOBAL_CONFIG_DIR
+        self.socket_path = get_socket_path(self.config_dir)
+        self.idle_timeout = idle_timeout
+        self.cli = None
+        self._state = None
+        self._sock = None
+        self._lock_file = None
+
+    def get_state(self):
+        """ Signature of the config, profile and token files and installed extensions the warmed CLI depends on. """
+        from azure.cli.core.extension import EXTENSIONS_DIR
+        files = tuple(_get_file_signature(os.path.join(self.config_dir, f)) for f in _WATCHED_FILES)
+        return files, _get_file_signature(EXTENSIONS_DIR)
+
+    def warm(self):
+        """ Build the AzCli and import every command module and extension so forked commands start warm. """
+        from azure.cli.core import get_default_cli
+        self._state = self.get_state()
+        self.cli = get_default_cli()
+        try:
+            invoker = self.cli.invocation_cls(cli_ctx=self.cli, commands_loader_cls=self.cli.commands_loader_cls,
+                                              parser_cls=self.cli.parser_cls, help_cls=self.cli.help_cls)
+            self.cli.invocation = invoker
+            invoker.commands_loader.load_command_table(None)
+        except Exception:  # pylint: disable=broad-except
+            logger.debug("Unable to preload the command table.", exc_info=True)
+        finally:
+            self.cli.invocation = None
+
+    def refresh(self):
+        """ Rebuild the warmed CLI if the files it was built from have changed. Returns False if the daemon needs a
+        fresh process, which is the case when the installed extensions have changed. """
+        state = self.get_state()
+        if state == self._state:
+            return True
+        if state[1] != self._state[1]:
+            logger.debug("Installed extensions have changed.")
+            return False
+        logger.debug("Configuration files have changed. Reloading.")
+        self.warm()
+        return True
+
+    def _acquire_lock(self):
+        import fcntl
+        self._lock_file = open(self.socket_path + '.lock', 'w')
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except (OSError, IOError):
+            self._lock_file.close()
+            self._lock_file = None
+            return False
+        return True
+
+    def _bind(self):
+        socket_dir = os.path.dirname(self.socket_path)
+        if not os.path.isdir(socket_dir):
+            os.makedirs(socket_dir)
+        os.chmod(socket_dir, 0o700)
+        if not self._acquire_lock():
+            logger.debug("Another az daemon is already serving %s", self.socket_path)
+            return False
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(self.socket_path)
+        self._sock.listen(128)
+        self._sock.settimeout(self.idle_timeout)
+        return True
+
+    def _close(self):
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+            try:
+                os.remove(self.socket_path)
+            except OSError:
+                pass
+        if self._lock_file:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def serve_forever(self):
+        import signal
+        if not self._bind():
+            return
+        try:
+            # Let the kernel reap finished commands
+            signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+            self.warm()
+            logger.debug("az daemon listening on %s", self.socket_path)
+            while True:
+                try:
+                    conn, _ = self._sock.accept()
+                except socket.timeout:
+                    logger.debug("az daemon idle for %s seconds. Exiting.", self.idle_timeout)
+                    return
+                conn.settimeout(None)
+                try:
+                    if not self.refresh():
+                        # Clients which cannot connect run in-process until a new daemon is listening
+                        self._close()
+                        conn.close()
+                        os.execv(sys.executable, [sys.executable, '-m', 'azure.cli.core.daemon'])
+                    self._handle(conn)
+                except Exception:  # pylint: disable=broad-except
+                    logger.debug("Failed to serve an az invocation.", exc_info=True)
+                finally:
+                    conn.close()
+        finally:
+            self._close()
+
+    def _handle(self, conn):
+        request, fds = _receive_request(conn)
+        pid = os.fork()
+        if pid:
+            for fd in fds:
+                os.close(fd)
+            return
+
+        exit_code = 1
+        try:
+            import logging
+            import signal
+            self._sock.close()
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            for target, fd in zip(_STDIO_FDS, fds):
+                os.dup2(fd, target)
+                os.close(fd)
+            os.environ.clear()
+            os.environ.update(request['env'])
+            os.chdir(request['cwd'])
+            _send_message(conn, {'pid': os.getpid()})
+            exit_code = _invoke(self.cli, request['argv'])
+            sys.stdout.flush()
+            sys.stderr.flush()
+            logging.shutdown()
+            _send_message(conn, {'exit_code': exit_code})
+        except BaseException:  # pylint: disable=broad-except
+            logger.debug("az daemon child failed.", exc_info=True)
+        finally:
+            os._exit(exit_code if isinstance(exit_code, int) else 1)  # pylint: disable=protected-access
+
+
+def main():
+    idle_timeout = _get_config().getint('core', 'daemon_idle_timeout', fallback=DEFAULT_IDLE_TIMEOUT)
+    AzDaemon(idle_timeout=idle_timeout).serve_forever()
+
+
+if __name__ == '__main__':
+    main()
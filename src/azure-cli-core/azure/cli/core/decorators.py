@@ -16,17 +16,110 @@ from functools import wraps
 from knack.log import get_logger
 
 
+COMPLETION_CACHE_REFRESH_ENV_NAME = '_AZ_COMPLETION_CACHE_REFRESH'
+DEFAULT_COMPLETION_CACHE_TTL = 300  # seconds
+# Entries older than this are not served while they are refreshed in the background
+_COMPLETION_CACHE_MAX_AGE = 24 * 3600
+_COMPLETION_CACHE_REFRESH_INTERVAL = 60
+
+
 # pylint: disable=too-few-public-methods
 class Completer(object):
 
-    def __init__(self, func):
+    def __init__(self, func, cache_context=None, cache_name=None):
         self.func = func
+        self.cache_context = cache_context
+        self.cache_name = cache_name or '{}.{}'.format(func.__module__, func.__name__)
 
     def __call__(self, **kwargs):
         namespace = kwargs['parsed_args']
         prefix = kwargs['prefix']
         cmd = namespace._cmd  # pylint: disable=protected-access
-        return self.func(cmd, prefix, namespace)
+        if self.cache_context is None:
+            return self.func(cmd, prefix, namespace)
+        return self._call_cached(cmd, prefix, namespace)
+
+    @classmethod
+    def cached(cls, *context, **kwargs):
+        """
+        Same as `Completer`, but the results are cached in the config dir per cloud, subscription and values of the
+        `context` arguments of the namespace. Cached results older than `core.completion_cache_ttl` seconds (0 disables
+        the cache) are still returned while they are refreshed in the background. Use `name` to tell apart the
+        completers created by the same factory function.
+        """
+        def _decorator(func):
+            return cls(func, cache_context=context, cache_name=kwargs.get('name'))
+        return _decorator
+
+    def _call_cached(self, cmd, prefix, namespace):
+        import os
+        import time
+        from knack.util import CLIError
+        from azure.cli.core._session import COMPLETIONS
+
+        cli_ctx = cmd.cli_ctx
+        ttl = cli_ctx.config.getint('core', 'completion_cache_ttl', fallback=DEFAULT_COMPLETION_CACHE_TTL)
+        if ttl <= 0:
+            return self.func(cmd, prefix, namespace)
+        try:
+            key = self._get_cache_key(cli_ctx, namespace)
+        except CLIError:
+            return self.func(cmd, prefix, namespace)
+
+        COMPLETIONS.load(os.path.join(cli_ctx.config.config_dir, 'completionCache.json'))
+        now = time.time()
+        entry = COMPLETIONS.get(key)
+        if entry and not os.environ.get(COMPLETION_CACHE_REFRESH_ENV_NAME):
+            age = now - entry['time']
+            if age < ttl:
+                return entry['result']
+            if age < _COMPLETION_CACHE_MAX_AGE:
+                if now - entry.get('refresh', 0) > _COMPLETION_CACHE_REFRESH_INTERVAL:
+                    entry['refresh'] = now
+                    COMPLETIONS[key] = entry
+                    COMPLETIONS.commit()
+                    _refresh_completions_in_background()
+                return entry['result']
+
+        result = self.func(cmd, prefix, namespace)
+        if isinstance(result, list) and all(isinstance(r, (str, type(u''))) for r in result):
+            expired = [k for k, v in COMPLETIONS.data.items() if now - v.get('time', 0) > _COMPLETION_CACHE_MAX_AGE]
+            for k in expired:
+                del COMPLETIONS[k]
+            COMPLETIONS[key] = {'time': now, 'result': result}
+            # argcomplete exits without running the exit handlers, so write right away
+            COMPLETIONS.commit()
+        return result
+
+    def _get_cache_key(self, cli_ctx, namespace):
+        from azure.cli.core._profile import Profile
+        subscription_id = Profile(cli_ctx=cli_ctx).get_subscription_id(getattr(namespace, '_subscription', None))
+        # the context may hold secrets such as connection strings, so only its digest is stored
+        context = u'\n'.join(u'{}'.format(getattr(namespace, name, None)) for name in self.cache_context)
+        return '/'.join([cli_ctx.cloud.name.lower(), subscription_id.lower(), self.cache_name,
+                         hashlib.sha256(context.encode('utf-8')).hexdigest()])
+
+
+def _refresh_completions_in_background():
+    """ Run the current completion again in a detached process that refreshes the cached results. """
+    import os
+    import subprocess
+    import sys
+
+    env = os.environ.copy()
+    env[COMPLETION_CACHE_REFRESH_ENV_NAME] = '1'
+    kwargs = {}
+    if os.name == 'nt':
+        kwargs['creationflags'] = 0x00000008  # DETACHED_PROCESS
+    else:
+        kwargs['close_fds'] = True
+        kwargs['preexec_fn'] = os.setsid
+    try:
+        with open(os.devnull, 'r+b') as devnull:
+            subprocess.Popen([sys.executable, '-m', 'azure.cli'], env=env, stdin=devnull, stdout=devnull,
+                             stderr=devnull, **kwargs)
+    except (OSError, ValueError) as ex:
+        get_logger(__name__).debug('Failed to refresh the completion cache: %s', ex)
 
 
 def call_once(factory_func):
@@ -25,6 +25,7 @@ EXTENSIONS_MOD_PREFIX = 'azext_'
 WHL_METADATA_FILENAME = 'metadata.json'
 EGG_INFO_METADATA_FILE_NAME = 'PKG-INFO'  # used for dev packages
 AZEXT_METADATA_FILENAME = 'azext_metadata.json'
+EXTENSION_INDEX_FILENAME = 'extensionIndex.json'
 
 EXT_METADATA_MINCLICOREVERSION = 'azext.minCliCoreVersion'
 EXT_METADATA_MAXCLICOREVERSION = 'azext.maxCliCoreVersion'
@@ -115,11 +116,14 @@ class WheelExtension(Extension):
         return self.metadata.get('version')
 
     def get_metadata(self):
-        from glob import glob
-        if not extension_exists(self.name):
+        if not extension_exists(self.name, ext_type=WheelExtension):
             return None
-        metadata = {}
         ext_dir = self.path or get_extension_path(self.name)
+        return _get_cached_metadata(self.name, ext_dir, lambda: self._read_metadata(ext_dir))
+
+    def _read_metadata(self, ext_dir):
+        from glob import glob
+        metadata = {}
         info_dirs = glob(os.path.join(ext_dir, '*.*-info'))
         azext_metadata = WheelExtension.get_azext_metadata(ext_dir)
         if azext_metadata:
@@ -154,15 +158,14 @@ class WheelExtension(Extension):
         """
         Returns all wheel-based extensions.
         """
-        from glob import glob
-        exts = []
-        if os.path.isdir(EXTENSIONS_DIR):
-            for ext_name in os.listdir(EXTENSIONS_DIR):
-                ext_path = os.path.join(EXTENSIONS_DIR, ext_name)
-                pattern = os.path.join(ext_path, '*.*-info')
-                if os.path.isdir(ext_path) and glob(pattern):
-                    exts.append(WheelExtension(ext_name, ext_path))
-        return exts
+        index = _get_extension_index()
+        if index is not None:
+            ext_names = index['extensions']
+        elif os.path.isdir(EXTENSIONS_DIR):
+            ext_names, _ = _scan_wheel_extensions()
+        else:
+            ext_names = []
+        return [WheelExtension(ext_name, os.path.join(EXTENSIONS_DIR, ext_name)) for ext_name in ext_names]
 
 
 class DevExtension(Extension):
@@ -240,6 +243,67 @@ class DevExtension(Extension):
 EXTENSION_TYPES = [WheelExtension, DevExtension]
 
 
+def _scan_wheel_extensions():
+    """
+    Returns the names of the wheel extensions in the extensions directory, and whether every directory in it
+    is an extension. A directory without a dist-info directory may be an extension that is still being installed.
+    """
+    from glob import glob
+    ext_names = []
+    complete = True
+    for ext_name in os.listdir(EXTENSIONS_DIR):
+        ext_path = os.path.join(EXTENSIONS_DIR, ext_name)
+        if os.path.isdir(ext_path):
+            if glob(os.path.join(ext_path, '*.*-info')):
+                ext_names.append(ext_name)
+            else:
+                complete = False
+    return ext_names, complete
+
+
+def _get_extension_index():
+    """
+    Returns the cached listing of the wheel extensions, or None if the cache can't be used.
+    The extensions directory is only scanned again when its modification time changes, which happens whenever an
+    extension is added, updated or removed.
+    """
+    from azure.cli.core._session import EXTENSIONS
+    try:
+        mtime = os.stat(EXTENSIONS_DIR).st_mtime
+        EXTENSIONS.load(os.path.join(GLOBAL_CONFIG_DIR, EXTENSION_INDEX_FILENAME))
+    except (OSError, IOError):
+        return None
+    same_dir = EXTENSIONS.get('dir') == EXTENSIONS_DIR
+    if same_dir and EXTENSIONS.get('mtime') == mtime:
+        return EXTENSIONS
+
+    logger.debug("Scanning extensions directory '%s'", EXTENSIONS_DIR)
+    ext_names, complete = _scan_wheel_extensions()
+    cached_metadata = EXTENSIONS.get('metadata', {}) if same_dir else {}
+    EXTENSIONS['dir'] = EXTENSIONS_DIR
+    # scan again next time if an extension may be partially installed
+    EXTENSIONS['mtime'] = mtime if complete else None
+    EXTENSIONS['extensions'] = ext_names
+    EXTENSIONS['metadata'] = {k: v for k, v in cached_metadata.items() if k in ext_names}
+    return EXTENSIONS
+
+
+def _get_cached_metadata(ext_name, ext_dir, read_metadata):
+    """ Returns the metadata of a wheel extension, which is read again only when its directory has changed. """
+    index = _get_extension_index()
+    if index is None or ext_dir != os.path.join(EXTENSIONS_DIR, ext_name):
+        return read_metadata()
+    mtime = os.stat(ext_dir).st_mtime
+    entry = index['metadata'].get(ext_name)
+    if entry and entry['mtime'] == mtime:
+        return dict(entry['metadata'])
+    metadata = read_metadata()
+    cached_metadata = dict(index['metadata'])
+    cached_metadata[ext_name] = {'mtime': mtime, 'metadata': metadata}
+    index['metadata'] = cached_metadata
+    return dict(metadata)
+
+
 def ext_compat_with_cli(azext_metadata):
     from azure.cli.core import __version__ as core_version
     from pkg_resources import parse_version
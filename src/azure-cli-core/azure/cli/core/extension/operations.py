@@ -16,6 +16,7 @@ from six.moves.urllib.parse import urlparse  # pylint: disable=import-error
 import requests
 from pkg_resources import parse_version
 
+from azure.cli.core import CommandIndex
 from azure.cli.core.util import CLIError, reload_module
 from azure.cli.core.extension import (extension_exists, get_extension_path, get_extensions, get_extension_modname,
                                       get_extension, ext_compat_with_cli, EXT_METADATA_ISPREVIEW,
@@ -221,6 +222,7 @@ def add_extension(cmd, source=None, extension_name=None, index_url=None, yes=Non
             raise CLIError("No matching extensions for '{}'. Use --debug for more information.".format(extension_name))
     _add_whl_ext(cmd=cmd, source=source, ext_sha256=ext_sha256, pip_extra_index_urls=pip_extra_index_urls,
                  pip_proxy=pip_proxy)
+    CommandIndex().invalidate()
     _augment_telemetry_with_ext_info(extension_name)
     try:
         if extension_name and get_extension(extension_name).preview:
@@ -244,6 +246,7 @@ def remove_extension(extension_name):
         # We call this just before we remove the extension so we can get the metadata before it is gone
         _augment_telemetry_with_ext_info(extension_name)
         shutil.rmtree(get_extension_path(extension_name), onerror=log_err)
+        CommandIndex().invalidate()
     except ExtensionNotInstalledException as e:
         raise CLIError(e)
 
@@ -286,6 +289,7 @@ def update_extension(cmd, extension_name, index_url=None, pip_extra_index_urls=N
                          pip_extra_index_urls=pip_extra_index_urls, pip_proxy=pip_proxy)
             logger.debug('Deleting backup of old extension at %s', backup_dir)
             shutil.rmtree(backup_dir)
+            CommandIndex().invalidate()
             # This gets the metadata for the extension *after* the update
             _augment_telemetry_with_ext_info(extension_name)
         except Exception as err:
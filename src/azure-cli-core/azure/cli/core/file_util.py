@@ -28,6 +28,7 @@ def get_all_help(cli_ctx, skip=True):
         if cmd not in sub_parser_keys:
             sub_parser_keys.append(cmd)
             sub_parser_values.append(parser)
+    help_ctx.load_help_modules()
     help_files = []
     help_errors = {}
     for cmd, parser in zip(sub_parser_keys, sub_parser_values):
@@ -44,6 +45,7 @@ def get_all_help(cli_ctx, skip=True):
                 help_errors[cmd] = "Error '{}': {}".format(cmd, ex)
     if help_errors:
         raise CLIError(help_errors)
+    help_ctx.help_index.save()
     help_files = sorted(help_files, key=lambda x: x.command)
     return help_files
 
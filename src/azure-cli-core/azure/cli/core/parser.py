@@ -5,6 +5,7 @@
 
 from __future__ import print_function
 
+import os
 import sys
 import difflib
 
@@ -157,9 +158,12 @@ class AzCliCommandParser(CLICommandParser):
         super(AzCliCommandParser, self).format_help()
 
     def enable_autocomplete(self):
+        from azure.cli.core.decorators import COMPLETION_CACHE_REFRESH_ENV_NAME
+        # a background refresh of the completion cache must not print anything
+        output_stream = open(os.devnull, 'wb') if os.environ.get(COMPLETION_CACHE_REFRESH_ENV_NAME) else None
         argcomplete.autocomplete = AzCompletionFinder()
         argcomplete.autocomplete(self, validator=lambda c, p: c.lower().startswith(p.lower()),
-                                 default_completer=lambda _: ())
+                                 default_completer=lambda _: (), output_stream=output_stream)
 
     def _check_value(self, action, value):
         # Override to customize the error message when a argument is not among the available choices
@@ -5,7 +5,9 @@
 
 import unittest
 from six import StringIO
-from azure.cli.core.commands.transform import _parse_id, _add_resource_group
+from azure.cli.core.commands.transform import (
+    _parse_id, _add_resource_group, _add_x509_hex, register_node_transform, _node_transform)
+from azure.cli.core.mock import DummyCli
 
 
 class TestResourceGroupTransform(unittest.TestCase):
@@ -85,6 +87,37 @@ class TestResourceGroupTransform(unittest.TestCase):
             'name': 'A name'
         })
 
+    def test_skip_source_vault(self):
+        instance = {'sourceVault': {'id': TestResourceGroupTransform.CORRECT_ID},
+                    'secrets': [{'id': TestResourceGroupTransform.CORRECT_ID}]}
+        _add_resource_group(instance)
+        self.assertNotIn('resourceGroup', instance['sourceVault'])
+        self.assertEqual(instance['secrets'][0]['resourceGroup'], 'REsourceGROUPname')
+
+    def test_deeply_nested_result(self):
+        instance = leaf = {}
+        for _ in range(5000):
+            leaf['value'] = [{'x509Thumbprint': 'AQI='}]
+            leaf = leaf['value'][0]
+        leaf['id'] = TestResourceGroupTransform.CORRECT_ID
+        _add_resource_group(instance)
+        _add_x509_hex(instance)
+        self.assertEqual(leaf['resourceGroup'], 'REsourceGROUPname')
+        self.assertEqual(instance['value'][0]['x509ThumbprintHex'], '0102')
+
+    def test_registered_node_transforms_share_walk(self):
+        cli_ctx = DummyCli()
+        visited = []
+        register_node_transform(cli_ctx, lambda node: visited.append(node.get('name')), skip_keys=['properties'])
+        result = [{'name': 'a', 'id': TestResourceGroupTransform.CORRECT_ID,
+                   'sourceVault': {'name': 'b', 'id': TestResourceGroupTransform.CORRECT_ID},
+                   'properties': {'name': 'c', 'x509Thumbprint': 'AQI='}}]
+        _node_transform(cli_ctx, event_data={'result': result})
+        self.assertEqual(sorted(visited), ['a', 'b'])
+        self.assertEqual(result[0]['resourceGroup'], 'REsourceGROUPname')
+        self.assertNotIn('resourceGroup', result[0]['sourceVault'])
+        self.assertEqual(result[0]['properties']['x509ThumbprintHex'], '0102')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,65 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import unittest
+
+import mock
+
+from azure.cli.core.commands.client_factory import _get_mgmt_service_client
+from azure.cli.core.mock import DummyCli
+
+
+class _TestClient(object):
+    def __init__(self, credentials, subscription_id, **kwargs):
+        from msrest.service_client import ServiceClient
+        from msrestazure import AzureConfiguration
+        self.config = AzureConfiguration(kwargs.get('base_url'))
+        self._client = ServiceClient(credentials, self.config)
+        self.subscription_id = subscription_id
+
+
+class TestClientFactory(unittest.TestCase):
+
+    def setUp(self):
+        self.cli_ctx = DummyCli()
+        self.cli_ctx.data['headers'] = {}
+        self.cli_ctx.data['command'] = 'test'
+
+    @mock.patch('azure.cli.core._profile.Profile.get_login_credentials', autospec=True)
+    def test_clients_share_credentials_and_session_within_invocation(self, get_login_credentials_mock):
+        get_login_credentials_mock.side_effect = lambda _, subscription_id=None, **kwargs: (
+            mock.MagicMock(), subscription_id or 'default', None)
+        self.cli_ctx.invocation = mock.MagicMock(data={})
+
+        client1, subscription_id = _get_mgmt_service_client(self.cli_ctx, _TestClient)
+        client2, _ = _get_mgmt_service_client(self.cli_ctx, _TestClient)
+        client3, _ = _get_mgmt_service_client(self.cli_ctx, _TestClient, subscription_id='other')
+        self.assertEqual(subscription_id, 'default')
+        self.assertEqual(get_login_credentials_mock.call_count, 2)
+        self.assertIsNot(client1, client2)
+        self.assertEqual(client3.subscription_id, 'other')
+
+        # pylint: disable=protected-access
+        sessions = set(id(c._client.config.pipeline._sender.driver.session) for c in (client1, client2, client3))
+        self.assertEqual(len(sessions), 1)
+        self.assertTrue(client1.config.keep_alive)
+
+        # a new invocation resolves the credentials again
+        self.cli_ctx.invocation = mock.MagicMock(data={})
+        client4, _ = _get_mgmt_service_client(self.cli_ctx, _TestClient)
+        self.assertEqual(get_login_credentials_mock.call_count, 3)
+        self.assertNotEqual(id(client4._client.config.pipeline._sender.driver.session), sessions.pop())
+
+    @mock.patch('azure.cli.core._profile.Profile.get_login_credentials', autospec=True)
+    def test_no_caching_without_invocation(self, get_login_credentials_mock):
+        get_login_credentials_mock.return_value = (mock.MagicMock(), 'default', None)
+        _get_mgmt_service_client(self.cli_ctx, _TestClient)
+        client, _ = _get_mgmt_service_client(self.cli_ctx, _TestClient)
+        self.assertEqual(get_login_credentials_mock.call_count, 2)
+        self.assertFalse(client.config.keep_alive)
+
+
+if __name__ == '__main__':
+    unittest.main()
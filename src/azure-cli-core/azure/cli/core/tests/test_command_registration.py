@@ -220,6 +220,58 @@ class TestCommandRegistration(unittest.TestCase):
         self.assertTrue(isinstance(ext2.command_source, ExtensionCommandSource))
         self.assertTrue(ext2.command_source.overrides_command)
 
+    @mock.patch('importlib.import_module', _mock_import_lib)
+    @mock.patch('azure.cli.core.extension.get_extension_modname', _mock_extension_modname)
+    @mock.patch('azure.cli.core.extension.get_extensions', _mock_get_extensions)
+    def test_command_index(self):
+        import os
+        import shutil
+        import tempfile
+        from azure.cli.core._session import Session
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        index = Session()
+        index.load(os.path.join(temp_dir, 'commandIndex.json'))
+
+        loaded = []
+
+        def _load_command_loader(loader, args, name, prefix):
+            loaded.append(name)
+            return TestCommandRegistration._mock_load_command_loader(loader, args, name, prefix)
+
+        cli = DummyCli()
+        iter_modules = mock.MagicMock(side_effect=TestCommandRegistration._mock_iter_modules)
+        with mock.patch('azure.cli.core._session.INDEX', index), \
+                mock.patch('pkgutil.iter_modules', iter_modules), \
+                mock.patch('azure.cli.core.commands._load_command_loader', _load_command_loader):
+            # an empty index falls back to loading all modules and then builds the index
+            cmd_tbl = MainCommandsLoader(cli).load_command_table(['hello', 'world'])
+            self.assertIn('hello noodle', cmd_tbl)
+            self.assertEqual(iter_modules.call_count, 1)
+            entry = index['commandIndex']['hello']
+            self.assertEqual(entry['modules'], [__name__])
+            self.assertEqual(sorted(entry['extensions']),
+                             [__name__ + '.Ext2CommandsLoader', __name__ + '.ExtCommandsLoader'])
+
+            # an index hit only loads the owning module and extensions
+            del loaded[:]
+            cmd_tbl = MainCommandsLoader(cli).load_command_table(['hello', 'world'])
+            self.assertIn('hello noodle', cmd_tbl)
+            self.assertTrue(cmd_tbl['hello world'].command_source.overrides_command)
+            self.assertEqual(iter_modules.call_count, 1)
+            self.assertEqual(len(loaded), 3)
+
+            # an index miss loads everything
+            MainCommandsLoader(cli).load_command_table(['unknown'])
+            self.assertEqual(iter_modules.call_count, 2)
+
+            # a different CLI version invalidates the index
+            index.data['version'] = '0.0.1'
+            MainCommandsLoader(cli).load_command_table(['hello', 'world'])
+            self.assertEqual(iter_modules.call_count, 3)
+            self.assertNotEqual(index['version'], '0.0.1')
+
     def test_argument_with_overrides(self):
 
         global_vm_name_type = CLIArgumentType(
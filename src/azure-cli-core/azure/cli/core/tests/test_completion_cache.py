@@ -0,0 +1,87 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import argparse
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from azure.cli.core._session import Session
+from azure.cli.core.decorators import Completer
+from azure.cli.core.mock import DummyCli
+
+
+class TestCompletionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.session = Session()
+        patchers = [mock.patch('azure.cli.core._session.COMPLETIONS', self.session),
+                    mock.patch('azure.cli.core._profile.Profile.get_subscription_id', return_value='sub'),
+                    mock.patch('azure.cli.core.decorators._refresh_completions_in_background'),
+                    mock.patch('time.time', return_value=1000)]
+        mocks = [p.start() for p in patchers]
+        for p in patchers:
+            self.addCleanup(p.stop)
+        self.refresh_mock, self.time_mock = mocks[2], mocks[3]
+
+        self.cli_ctx = DummyCli()
+        self.cli_ctx.config.config_dir = self.temp_dir
+        self.calls = []
+
+        @Completer.cached('resource_group_name')
+        def completer(cmd, prefix, namespace):  # pylint: disable=unused-argument
+            self.calls.append(namespace.resource_group_name)
+            return ['a', 'b']
+        self.completer = completer
+
+    def tearDown(self):
+        self.session.commit()
+        shutil.rmtree(self.temp_dir)
+
+    def _complete(self, resource_group_name='rg'):
+        namespace = argparse.Namespace(_cmd=mock.MagicMock(cli_ctx=self.cli_ctx),
+                                       resource_group_name=resource_group_name)
+        return self.completer(prefix='', action=None, parsed_args=namespace)
+
+    def test_results_are_cached_per_context(self):
+        self.assertEqual(self._complete(), ['a', 'b'])
+        self.assertEqual(self._complete(), ['a', 'b'])
+        self.assertEqual(self.calls, ['rg'])
+        self.assertTrue(os.path.isfile(os.path.join(self.temp_dir, 'completionCache.json')))
+
+        self._complete('other')
+        self.assertEqual(self.calls, ['rg', 'other'])
+
+    def test_stale_results_are_refreshed_in_background(self):
+        self._complete()
+        self.time_mock.return_value = 2000
+        self.assertEqual(self._complete(), ['a', 'b'])
+        self._complete()
+        self.assertEqual(self.calls, ['rg'])
+        self.refresh_mock.assert_called_once_with()
+
+        with mock.patch.dict('os.environ', {'_AZ_COMPLETION_CACHE_REFRESH': '1'}):
+            self._complete()
+        self.assertEqual(self.calls, ['rg', 'rg'])
+
+        # expired results are not served
+        self.time_mock.return_value = 2000 + 24 * 3600
+        self._complete()
+        self.assertEqual(self.calls, ['rg', 'rg', 'rg'])
+
+    def test_cache_can_be_disabled(self):
+        with mock.patch.object(self.cli_ctx.config, 'getint', return_value=0):
+            self._complete()
+            self._complete()
+        self.assertEqual(self.calls, ['rg', 'rg'])
+        self.assertEqual(len(self.session), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
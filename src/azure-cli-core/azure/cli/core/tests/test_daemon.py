@@ -0,0 +1,86 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import json
+import os
+import shutil
+import socket
+import tempfile
+import unittest
+
+import mock
+
+from azure.cli.core.daemon import (
+    AzDaemon, get_socket_path, is_daemon_supported, run_in_daemon, _receive_request, _HEADER)
+
+
+@unittest.skipUnless(is_daemon_supported(), 'The az daemon requires Unix sockets and fork')
+class TestDaemon(unittest.TestCase):
+
+    def setUp(self):
+        self.config_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.config_dir)
+
+    def test_receive_request_with_stdio_fds(self):
+        import array
+        client, server = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(client.close)
+        self.addCleanup(server.close)
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+
+        request = json.dumps({'argv': ['vm', 'list'], 'env': {'A': 'B'}, 'cwd': '/'}).encode('utf-8')
+        payload = _HEADER.pack(len(request)) + request
+        fds = array.array('i', [read_fd, write_fd, write_fd])
+        client.sendmsg([payload], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, fds)])
+
+        received, received_fds = _receive_request(server)
+        self.assertEqual(received['argv'], ['vm', 'list'])
+        self.assertEqual(received['env'], {'A': 'B'})
+        self.assertEqual(len(received_fds), 3)
+        os.write(received_fds[1], b'hello')
+        self.assertEqual(os.read(read_fd, 5), b'hello')
+        for fd in received_fds:
+            os.close(fd)
+
+    def test_incomplete_request_is_rejected(self):
+        client, server = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(server.close)
+        client.sendall(_HEADER.pack(100) + b'{}')
+        client.close()
+        with self.assertRaises(ValueError):
+            _receive_request(server)
+
+    def test_state_changes_with_config_files(self):
+        daemon = AzDaemon(config_dir=self.config_dir)
+        state = daemon.get_state()
+        self.assertEqual(state, daemon.get_state())
+        with open(os.path.join(self.config_dir, 'azureProfile.json'), 'w') as f:
+            f.write('{}')
+        self.assertNotEqual(state, daemon.get_state())
+
+    def test_socket_path_is_bounded(self):
+        self.assertTrue(get_socket_path(self.config_dir).startswith(self.config_dir))
+        long_dir = os.path.join(self.config_dir, 'x' * 120)
+        self.assertLessEqual(len(get_socket_path(long_dir)), 108)
+
+    def test_run_in_daemon_disabled(self):
+        with mock.patch('azure.cli.core.daemon.is_daemon_enabled', return_value=False):
+            self.assertIsNone(run_in_daemon(['vm', 'list']))
+
+    @mock.patch('azure.cli.core.daemon.start_daemon')
+    @mock.patch('azure.cli.core.daemon.get_socket_path')
+    @mock.patch('azure.cli.core.daemon.is_daemon_enabled', return_value=True)
+    def test_run_in_daemon_starts_missing_daemon(self, _, get_socket_path_mock, start_daemon_mock):
+        get_socket_path_mock.return_value = os.path.join(self.config_dir, 'missing.sock')
+        self.assertIsNone(run_in_daemon(['vm', 'list']))
+        start_daemon_mock.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,7 @@ import zipfile
 
 import mock
 
+from azure.cli.core._session import Session
 from azure.cli.core.extension import (get_extensions, get_extension_path, extension_exists,
                                       get_extension, get_extension_names, get_extension_modname, ext_compat_with_cli,
                                       ExtensionNotInstalledException, WheelExtension,
@@ -238,5 +239,50 @@ class TestWheelExtension(TestExtensionsBase):
         self.assertTrue(ext.metadata.get(EXT_METADATA_MINCLICOREVERSION))
 
 
+class TestExtensionIndex(TestExtensionsBase):
+
+    def setUp(self):
+        super(TestExtensionIndex, self).setUp()
+        self.config_dir = tempfile.mkdtemp()
+        self.session = Session()
+        for patcher in [mock.patch('azure.cli.core.extension.GLOBAL_CONFIG_DIR', self.config_dir),
+                        mock.patch('azure.cli.core._session.EXTENSIONS', self.session)]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.session.commit()
+        shutil.rmtree(self.config_dir, ignore_errors=True)
+        super(TestExtensionIndex, self).tearDown()
+
+    def test_extensions_dir_is_scanned_when_changed(self):
+        _install_test_extension1()
+        self.assertEqual(get_extension(EXT_NAME, ext_type=WheelExtension).version, EXT_VERSION)
+        with mock.patch('os.listdir', side_effect=AssertionError('extensions dir was scanned')):
+            self.assertEqual(get_extension_names(ext_type=WheelExtension), [EXT_NAME])
+            self.assertEqual(get_extension(EXT_NAME, ext_type=WheelExtension).version, EXT_VERSION)
+
+        shutil.rmtree(get_extension_path(EXT_NAME))
+        self.assertEqual(get_extension_names(ext_type=WheelExtension), [])
+        self.assertEqual(self.session['metadata'], {})
+
+    def test_partially_installed_extension_is_not_cached(self):
+        os.makedirs(get_extension_path(EXT_NAME))
+        self.assertEqual(get_extension_names(ext_type=WheelExtension), [])
+        _install_test_extension1()
+        self.assertEqual(get_extension_names(ext_type=WheelExtension), [EXT_NAME])
+
+    def test_extension_metadata_is_cached(self):
+        _install_test_extension2()
+        self.assertTrue(get_extension(EXT_NAME).metadata.get(EXT_METADATA_MINCLICOREVERSION))
+        self.session.commit()
+        self.assertTrue(os.path.isfile(os.path.join(self.config_dir, 'extensionIndex.json')))
+
+        with mock.patch('azure.cli.core.extension.WheelExtension._read_metadata') as read_mock:
+            metadata = get_extension(EXT_NAME).metadata
+        self.assertTrue(metadata.get(EXT_METADATA_MINCLICOREVERSION))
+        read_mock.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,6 +6,7 @@
 from __future__ import print_function
 
 import logging
+import os
 import shutil
 import inspect
 from inspect import getmembers as inspect_getmembers
@@ -15,7 +16,7 @@ import mock
 import tempfile
 
 from knack.help import GroupHelpFile, HelpAuthoringException
-from azure.cli.core._help import CliCommandHelpFile
+from azure.cli.core._help import CliCommandHelpFile, HelpIndex
 
 from azure.cli.core.mock import DummyCli
 from azure.cli.core.commands import _load_command_loader
@@ -642,5 +643,104 @@ class TestHelpSupportedProfiles(unittest.TestCase):
                     self.assertTrue(should_include_example)
 
 
+class TestHelpIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        self.path = os.path.join(self.test_dir, 'helpIndex.marshal')
+
+    def test_help_index_reuses_parsed_entries(self):
+        import yaml
+        parse = mock.MagicMock(side_effect=yaml.safe_load)
+        text = "type: command\nshort-summary: Show a thing.\n"
+
+        index = HelpIndex(self.path)
+        self.assertEqual(index.get('thing show', text, parse), {'type': 'command', 'short-summary': 'Show a thing.'})
+        index.save()
+        self.assertTrue(os.path.isfile(self.path))
+
+        index = HelpIndex(self.path)
+        self.assertEqual(index.get('thing show', text, parse)['short-summary'], 'Show a thing.')
+        self.assertEqual(parse.call_count, 1)
+
+        # changed help text is parsed again
+        changed = text.replace('Show a thing.', 'Show the thing.')
+        self.assertEqual(index.get('thing show', changed, parse)['short-summary'], 'Show the thing.')
+        self.assertEqual(parse.call_count, 2)
+
+    def test_help_index_skips_entries_marshal_cannot_store(self):
+        import yaml
+        index = HelpIndex(self.path)
+        data = index.get('thing', "created: 2019-01-01\n", yaml.safe_load)
+        self.assertEqual(str(data['created']), '2019-01-01')
+        index.save()
+        self.assertFalse(os.path.isfile(self.path))
+
+
+class TestHelpModuleLoading(unittest.TestCase):
+
+    def setUp(self):
+        import sys
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        for package, group in [('helpmod_first', 'first'), ('helpmod_second', 'second')]:
+            os.makedirs(os.path.join(self.test_dir, package))
+            with open(os.path.join(self.test_dir, package, '__init__.py'), 'w') as f:
+                f.write('class Loader(object):\n    pass\n')
+            with open(os.path.join(self.test_dir, package, '_help.py'), 'w') as f:
+                f.write('from knack.help_files import helps\nhelps["{0}"] = "short-summary: {0} help."\n'.format(group))
+        sys.path.insert(0, self.test_dir)
+        self.addCleanup(sys.path.remove, self.test_dir)
+        for module in ['helpmod_first', 'helpmod_second', 'helpmod_first._help', 'helpmod_second._help']:
+            self.addCleanup(sys.modules.pop, module, None)
+
+    def test_help_modules_are_imported_on_demand(self):
+        import sys
+        from importlib import import_module
+        from knack.help_files import helps
+        first = import_module('helpmod_first').Loader()
+        second = import_module('helpmod_second').Loader()
+        self.addCleanup(helps.pop, 'first', None)
+        self.addCleanup(helps.pop, 'second', None)
+
+        cli = DummyCli()
+        cli.invocation = mock.MagicMock()
+        cli.invocation.commands_loader.cmd_to_loader_map = {'first show': [first], 'second show': [second]}
+        cli.invocation.commands_loader.loaders = [first, second]
+        help_ctx = cli.help_cls(cli)
+        self.assertNotIn('helpmod_first._help', sys.modules)
+
+        help_ctx.load_help_modules(['first', 'show'])
+        self.assertIn('first', helps)
+        self.assertNotIn('helpmod_second._help', sys.modules)
+
+        help_ctx.load_help_modules()
+        self.assertIn('second', helps)
+
+    def test_help_modules_are_imported_with_full_command_table(self):
+        import sys
+        from importlib import import_module
+        from knack.help_files import helps
+        from azure.cli.core import MainCommandsLoader
+        self.addCleanup(helps.pop, 'first', None)
+        self.addCleanup(helps.pop, 'second', None)
+        cli = DummyCli()
+        main_loader = MainCommandsLoader(cli)
+
+        def _load_module_command_loader(loader, args, mod):
+            if mod == 'resource':
+                loader.loaders.append(import_module('helpmod_first').Loader())
+            return {}, {}
+
+        with mock.patch('azure.cli.core.commands._load_module_command_loader', _load_module_command_loader), \
+                mock.patch('azure.cli.core.extension.get_extensions', return_value=[]):
+            main_loader.load_command_table(['resource'])
+            self.assertNotIn('helpmod_first._help', sys.modules)
+            main_loader.load_command_table(None)
+        self.assertIn('first', helps)
+        self.assertNotIn('helpmod_second._help', sys.modules)
+
+
 if __name__ == '__main__':
     unittest.main()
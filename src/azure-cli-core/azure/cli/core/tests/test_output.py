@@ -5,6 +5,8 @@
 
 import unittest
 
+import mock
+
 
 class TestCoreCLIOutput(unittest.TestCase):
     def test_create_AzOutputProducer(self):
@@ -12,7 +14,8 @@ class TestCoreCLIOutput(unittest.TestCase):
         from azure.cli.core.mock import DummyCli
 
         output_producer = AzOutputProducer(DummyCli())
-        self.assertEqual(6, len(output_producer._FORMAT_DICT))  # six types: json, jsonc, table, tsv, yaml, none
+        self.assertEqual(7, len(output_producer._FORMAT_DICT))  # json, jsonc, jsonl, table, tsv, yaml, none
+        self.assertIn('jsonl', output_producer._FORMAT_DICT)
         self.assertIn('yaml', output_producer._FORMAT_DICT)
         self.assertIn('none', output_producer._FORMAT_DICT)
 
@@ -42,5 +45,105 @@ class TestCoreCLIOutput(unittest.TestCase):
         self.assertEqual(account_dict, yaml.safe_load(yaml_output))
 
 
+class TestStreamedOutput(unittest.TestCase):
+
+    pages = [
+        [{'name': 'a', 'location': 'westus', 'tags': {'env': 'dev'}},
+         {'name': 'b', 'location': 'eastus', 'tags': None}],
+        [],
+        [{'name': 'c', 'location': 'westus', 'tags': {'env': 'prod'}}]
+    ]
+
+    def _get_streamed_result(self):
+        from azure.cli.core._output import StreamedResult
+        converted = []
+
+        def _convert(item):
+            converted.append(item['name'])
+            return dict(item)
+
+        return StreamedResult(iter(self.pages), _convert), converted
+
+    def _write(self, output_format, **kwargs):
+        from six import StringIO
+        from knack.util import CommandResultItem
+        from azure.cli.core._output import AzOutputProducer
+        from azure.cli.core.mock import DummyCli
+
+        cli = DummyCli()
+        cli.invocation = mock.MagicMock(data={'output': output_format})
+        result, _ = self._get_streamed_result()
+        out_file = StringIO()
+        AzOutputProducer(cli).out(CommandResultItem(result, **kwargs),
+                                  formatter=cli.output.get_formatter(output_format), out_file=out_file)
+        return out_file.getvalue()
+
+    def test_streamed_result_is_lazy(self):
+        result, converted = self._get_streamed_result()
+        pages = result.iter_pages()
+        self.assertEqual([i['name'] for i in next(pages)], ['a', 'b'])
+        self.assertEqual(converted, ['a', 'b'])
+        self.assertEqual([i['name'] for i in result], ['c'])
+
+    def test_item_query_matches_jmespath(self):
+        import jmespath
+        from collections import OrderedDict
+        items = [i for page in self.pages for i in page]
+        for query in ['[].name', '[*].{n:name, l:location}', "[?location=='westus'].name", '[?tags].tags.env', '[]']:
+            result, _ = self._get_streamed_result()
+            self.assertTrue(result.apply_query(jmespath.compile(query)), query)
+            expected = jmespath.search(query, items, jmespath.Options(OrderedDict))
+            self.assertEqual(list(result), expected, query)
+
+        for query in ['length(@)', '[0]', '[].name | [0]', 'sort_by(@, &name)']:
+            result, _ = self._get_streamed_result()
+            self.assertFalse(result.apply_query(jmespath.compile(query)), query)
+
+    def test_jsonl_output(self):
+        import json
+        lines = self._write('jsonl').splitlines()
+        self.assertEqual([json.loads(line)['name'] for line in lines], ['a', 'b', 'c'])
+
+    def test_tsv_output_matches_non_streamed(self):
+        from knack.output import format_tsv
+        from knack.util import CommandResultItem
+        expected = format_tsv(CommandResultItem([i for page in self.pages for i in page]))
+        self.assertEqual(self._write('tsv'), expected)
+
+    def test_table_output(self):
+        lines = self._write('table').splitlines()
+        self.assertEqual(lines[0].split(), ['Location', 'Name'])
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(lines[4].split(), ['westus', 'c'])
+
+    def test_paging_errors_go_to_exception_handler(self):
+        from knack.util import CLIError
+        from azure.cli.core.commands import _iter_pages
+
+        class _Paged(object):
+            def __init__(self):
+                self.pages = [['a'], ['b']]
+
+            def advance_page(self):
+                if not self.pages:
+                    raise ValueError('page failed')
+                return self.pages.pop(0)
+
+        def _handler(ex):
+            raise CLIError('handled: {}'.format(ex))
+
+        pages = _iter_pages(_Paged(), _handler)
+        self.assertEqual([next(pages), next(pages)], [['a'], ['b']])
+        with self.assertRaises(CLIError) as context:
+            next(pages)
+        self.assertEqual(str(context.exception), 'handled: page failed')
+        with self.assertRaises(ValueError):
+            list(_iter_pages(_Paged(), lambda ex: None))
+
+    def test_non_streaming_format_materializes(self):
+        import json
+        self.assertEqual([i['name'] for i in json.loads(self._write('json'))], ['a', 'b', 'c'])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,77 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from azure.cli.core._session import Session
+from azure.cli.core.commands.arm import get_provider
+from azure.cli.core.mock import DummyCli
+
+
+class TestProviderCache(unittest.TestCase):
+
+    def setUp(self):
+        from azure.mgmt.resource.resources.v2019_07_01 import models
+        self.temp_dir = tempfile.mkdtemp()
+        self.session = Session()
+        self.session.load(os.path.join(self.temp_dir, 'providerCache.json'))
+        patcher = mock.patch('azure.cli.core._session.PROVIDERS', self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.cli_ctx = DummyCli()
+        self.client = mock.MagicMock()
+        self.client.config.subscription_id = 'sub'
+        self.client.providers.models = models
+        provider = models.Provider()
+        provider.namespace = 'Microsoft.Network'
+        provider.resource_types = [models.ProviderResourceType(resource_type='virtualNetworks',
+                                                               api_versions=['2019-12-01', '2019-11-01'])]
+        self.client.providers.get.return_value = provider
+
+    def tearDown(self):
+        self.session.commit()
+        shutil.rmtree(self.temp_dir)
+
+    def test_provider_is_fetched_once(self):
+        for _ in range(3):
+            provider = get_provider(self.cli_ctx, self.client, 'Microsoft.Network', 'virtualnetworks')
+            self.assertEqual(provider.resource_types[0].api_versions, ['2019-12-01', '2019-11-01'])
+        self.client.providers.get.assert_called_once_with('Microsoft.Network')
+
+        # providers are cached per subscription
+        self.client.config.subscription_id = 'other'
+        get_provider(self.cli_ctx, self.client, 'Microsoft.Network')
+        self.assertEqual(self.client.providers.get.call_count, 2)
+
+    def test_provider_is_fetched_again(self):
+        get_provider(self.cli_ctx, self.client, 'Microsoft.Network')
+        get_provider(self.cli_ctx, self.client, 'Microsoft.Network', 'networkInterfaces')
+        self.assertEqual(self.client.providers.get.call_count, 2)
+
+        self.cli_ctx.invocation = mock.MagicMock(data={})
+        get_provider(self.cli_ctx, self.client, 'Microsoft.Network', refresh=True)
+        get_provider(self.cli_ctx, self.client, 'Microsoft.Network', refresh=True)
+        self.assertEqual(self.client.providers.get.call_count, 3)
+
+        self.session['{}/sub/microsoft.network'.format(self.cli_ctx.cloud.name.lower())]['time'] = 0
+        get_provider(self.cli_ctx, self.client, 'Microsoft.Network')
+        self.assertEqual(self.client.providers.get.call_count, 4)
+
+    def test_cache_can_be_disabled(self):
+        with mock.patch.object(self.cli_ctx.config, 'getint', return_value=0):
+            get_provider(self.cli_ctx, self.client, 'Microsoft.Network')
+            get_provider(self.cli_ctx, self.client, 'Microsoft.Network')
+        self.assertEqual(self.client.providers.get.call_count, 2)
+        self.assertEqual(len(self.session), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
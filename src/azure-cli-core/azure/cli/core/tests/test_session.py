@@ -0,0 +1,109 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from azure.cli.core._session import Session, commit_sessions
+
+
+class TestSession(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.temp_dir, 'session.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _read(self):
+        with open(self.filename, 'rb') as f:
+            return json.loads(f.read().decode('utf-8-sig'))
+
+    def test_writes_are_batched_until_commit(self):
+        session = Session()
+        session.load(self.filename)
+        self.assertEqual(self._read(), {})
+
+        session['a'] = 1
+        session['b'] = 2
+        del session['a']
+        self.assertEqual(self._read(), {})
+
+        commit_sessions()
+        self.assertEqual(self._read(), {'b': 2})
+        self.assertEqual([f for f in os.listdir(self.temp_dir) if f.endswith('.tmp')], [])
+
+    def test_load_skips_parsing_unchanged_file(self):
+        with open(self.filename, 'w') as f:
+            json.dump({'a': 1}, f)
+        session = Session()
+        session.load(self.filename)
+        self.assertEqual(session['a'], 1)
+
+        with mock.patch('json.loads') as json_loads_mock:
+            session.load(self.filename)
+            json_loads_mock.assert_not_called()
+        self.assertEqual(session['a'], 1)
+
+        with open(self.filename, 'w') as f:
+            json.dump({'a': 22}, f)
+        session.load(self.filename)
+        self.assertEqual(session['a'], 22)
+
+    def test_save_replaces_file(self):
+        session = Session()
+        session.load(self.filename)
+        session.data['key'] = 'value'
+        session.save()
+        self.assertEqual(self._read(), {'key': 'value'})
+
+        other = Session()
+        other.load(self.filename)
+        self.assertEqual(other['key'], 'value')
+
+    def test_save_merges_keys_modified_by_other_processes(self):
+        with open(self.filename, 'w') as f:
+            json.dump({'shared': 0, 'removed': 1, 'nested': {'a': 1}}, f)
+        first = Session()
+        first.load(self.filename)
+        second = Session()
+        second.load(self.filename)
+
+        first['first'] = 1
+        first['shared'] = 1
+        first['nested']['b'] = 2
+        first.save()
+        second['second'] = 2
+        del second['removed']
+        self.assertEqual(second['unset'], {})
+        second.save()
+        self.assertEqual(self._read(), {'shared': 1, 'nested': {'a': 1, 'b': 2}, 'first': 1, 'second': 2,
+                                        'unset': {}})
+        self.assertEqual(second['first'], 1)
+
+        # the changes of this process win on the keys it modified
+        first['shared'] = 2
+        second['shared'] = 3
+        first.commit()
+        second.commit()
+        self.assertEqual(self._read()['shared'], 3)
+
+    def test_invalid_file_is_reset(self):
+        with open(self.filename, 'w') as f:
+            f.write('{invalid')
+        session = Session()
+        session.load(self.filename)
+        self.assertEqual(session.data, {})
+        self.assertEqual(self._read(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,7 +14,7 @@ import json
 from azure.cli.core.util import \
     (get_file_json, truncate_text, shell_safe_json_parse, b64_to_hex, hash_string, random_string,
      open_page_in_browser, can_launch_browser, handle_exception, ConfiguredDefaultSetter, send_raw_request,
-     should_disable_connection_verify)
+     should_disable_connection_verify, get_throttling_retry_after, AdaptiveConcurrencyLimiter)
 
 
 class TestUtils(unittest.TestCase):
@@ -172,6 +172,70 @@ class TestUtils(unittest.TestCase):
             result = can_launch_browser()
             self.assertFalse(result)
 
+    def test_get_throttling_retry_after(self):
+        def _error(status_code, headers=None):
+            ex = Exception()
+            ex.status_code = status_code
+            ex.response = mock.MagicMock(status_code=status_code, headers=headers or {})
+            return ex
+
+        self.assertIsNone(get_throttling_retry_after(_error(500, {'Retry-After': '3'})))
+        self.assertIsNone(get_throttling_retry_after(ValueError()))
+        self.assertEqual(get_throttling_retry_after(_error(429, {'Retry-After': '3'})), 3)
+        self.assertEqual(get_throttling_retry_after(_error(429, {'retry-after-ms': '1500'})), 1.5)
+        self.assertEqual(get_throttling_retry_after(_error(429), default=7), 7)
+
+    def test_adaptive_concurrency_limiter(self):
+        limiter = AdaptiveConcurrencyLimiter(8, max_retries=2)
+        throttled = Exception('Too many requests')
+        throttled.status_code = 429
+        throttled.response = mock.MagicMock(headers={'retry-after-ms': '1'})
+        attempts = []
+
+        def _operation():
+            attempts.append(limiter.limit)
+            if len(attempts) < 3:
+                raise throttled
+            return 'done'
+
+        with mock.patch('azure.cli.core.util.logger'):
+            self.assertEqual(limiter.call(_operation), 'done')
+        self.assertEqual(attempts, [8, 4, 2])
+        self.assertEqual(limiter.limit, 2)
+
+        # the limit recovers after consecutive successes
+        for _ in range(5):
+            limiter.call(lambda: None)
+        self.assertEqual(limiter.limit, 4)
+
+        # errors other than throttling are not retried
+        del attempts[:]
+
+        def _fail():
+            attempts.append(1)
+            raise ValueError('boom')
+
+        with self.assertRaises(ValueError):
+            limiter.call(_fail)
+        self.assertEqual(len(attempts), 1)
+
+    def test_throttled_jobs_are_retried_before_exception_handler(self):
+        from azure.cli.core.commands import AzCliCommandInvoker
+        throttled = Exception('Too many requests')
+        throttled.status_code = 429
+        throttled.response = mock.MagicMock(headers={'retry-after-ms': '1'})
+        cmd_copy = mock.MagicMock(side_effect=[throttled, 'done'], supports_no_wait=False, no_wait_param=None,
+                                  command_kwargs={})
+        # the exception handlers of command modules often turn errors into CLIErrors without a status code
+        cmd_copy.exception_handler.side_effect = lambda ex: self.fail('throttled job reached the exception handler')
+        invoker = AzCliCommandInvoker.__new__(AzCliCommandInvoker)
+        limiter = AdaptiveConcurrencyLimiter(4)
+        with mock.patch.object(AzCliCommandInvoker, '_filter_params', return_value={}), \
+                mock.patch('azure.cli.core.util.logger'):
+            self.assertEqual(invoker._run_job(mock.MagicMock(), cmd_copy, limiter=limiter), 'done')
+        self.assertEqual(cmd_copy.call_count, 2)
+        self.assertEqual(limiter.limit, 2)
+
 
 class TestBase64ToHex(unittest.TestCase):
 
@@ -640,3 +640,88 @@ def _ssl_context():
 def urlretrieve(url):
     req = urlopen(url, context=_ssl_context())
     return req.read()
+
+
+def get_throttling_retry_after(ex, default=5):
+    """
+    Returns the number of seconds to back off for if the exception is a throttling (HTTP 429) error,
+    otherwise None. The delay is read from the Retry-After or retry-after-ms response headers.
+    """
+    response = getattr(ex, 'response', None)
+    status_code = getattr(ex, 'status_code', None) or getattr(response, 'status_code', None)
+    if status_code != 429:
+        return None
+    headers = getattr(response, 'headers', None) or {}
+    for header, scale in (('retry-after-ms', 1000.0), ('x-ms-retry-after-ms', 1000.0), ('Retry-After', 1.0)):
+        value = headers.get(header) or headers.get(header.lower())
+        if value:
+            try:
+                return max(0.0, float(value) / scale)
+            except ValueError:
+                # Retry-After can also be an HTTP date
+                continue
+    return default
+
+
+class AdaptiveConcurrencyLimiter(object):
+    """
+    Bounds the number of operations running at the same time. When an operation is throttled the limit is
+    halved, every operation is held back for the Retry-After period and the throttled operation is retried.
+    The limit grows back by one after as many consecutive successes as the current limit.
+    """
+
+    def __init__(self, max_limit, max_retries=3):
+        import threading
+        self.max_limit = max(1, max_limit)
+        self.limit = self.max_limit
+        self.max_retries = max_retries
+        self._active = 0
+        self._successes = 0
+        self._resume_at = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        import time
+        with self._condition:
+            while True:
+                delay = self._resume_at - time.time()
+                if delay > 0:
+                    self._condition.wait(delay)
+                elif self._active >= self.limit:
+                    self._condition.wait()
+                else:
+                    break
+            self._active += 1
+
+    def release(self, throttled_for=None):
+        import time
+        with self._condition:
+            self._active -= 1
+            if throttled_for is None:
+                self._successes += 1
+                if self.limit < self.max_limit and self._successes >= self.limit:
+                    self.limit += 1
+                    self._successes = 0
+            else:
+                self.limit = max(1, self.limit // 2)
+                self._successes = 0
+                self._resume_at = max(self._resume_at, time.time() + throttled_for)
+            self._condition.notify_all()
+
+    def call(self, func, *args, **kwargs):
+        """ Run func under the limiter, retrying it when it is throttled. """
+        attempt = 0
+        while True:
+            throttled_for = None
+            self.acquire()
+            try:
+                return func(*args, **kwargs)
+            except Exception as ex:  # pylint: disable=broad-except
+                throttled_for = get_throttling_retry_after(ex)
+                if throttled_for is None or attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                logger.warning("Request throttled. Retrying in %.1f seconds with at most %d concurrent requests.",
+                               throttled_for, max(1, self.limit // 2))
+            finally:
+                self.release(throttled_for)
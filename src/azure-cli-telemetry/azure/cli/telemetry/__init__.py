@@ -72,7 +72,7 @@ def main():
     from azure.cli.telemetry.util import should_upload
     from azure.cli.telemetry.components.telemetry_note import TelemetryNote
     from azure.cli.telemetry.components.records_collection import RecordsCollection
-    from azure.cli.telemetry.components.telemetry_client import CliTelemetryClient
+    from azure.cli.telemetry.components.telemetry_client import CliTelemetryClient, TelemetryUploader
     from azure.cli.telemetry.components.telemetry_logging import config_logging_for_upload, get_logger
 
     try:
@@ -91,14 +91,29 @@ def main():
                 telemetry_note.touch()
 
                 collection = RecordsCollection(telemetry_note.get_last_sent(), config_dir)
-                collection.snapshot_and_read()
-
-                client = CliTelemetryClient()
-                for each in collection:
-                    client.add(each, flush=True)
-                client.flush(force=True)
-
-                telemetry_note.update_telemetry_note(collection.next_send)
+                collection.snapshot()
+
+                uploader = TelemetryUploader()
+                client = CliTelemetryClient(sender=uploader.create_sender)
+
+                def _save_progress(checkpoints):
+                    for last_time, files in checkpoints:
+                        if last_time:
+                            telemetry_note.update_telemetry_note(last_time)
+                        collection.remove_files(files)
+
+                try:
+                    for records, last_time, files in collection.iter_chunks():
+                        for each in records:
+                            client.add(each)
+                        client.flush(force=True)
+                        uploader.end_chunk((last_time, files))
+                        _save_progress(uploader.confirmed())
+                        if uploader.failed:
+                            logger.warning('Stop uploading. The remaining records will be uploaded next time.')
+                            break
+                finally:
+                    _save_progress(uploader.close())
         except portalocker.AlreadyLocked:
             # another upload process is running.
             logger.info('Lock out from note file under %s which means another process is running. Exit 0.', config_dir)
@@ -5,9 +5,8 @@
 
 import datetime
 import os
-import shutil
 import stat
-import tempfile
+import time
 
 
 class RecordsCollection(object):
@@ -28,7 +27,15 @@ class RecordsCollection(object):
         return self._next_send
 
     def snapshot_and_read(self):
-        """ Scan the telemetry cache files and move all the rotated files to a temp directory. """
+        """ Scan the telemetry cache files, move all the rotated files away and read all their records. """
+        self.snapshot()
+        for records, _, files in self.iter_chunks():
+            self._records.extend(records)
+            self.remove_files(files)
+
+    def snapshot(self):
+        """ Scan the telemetry cache files and move all the rotated files to the upload directory. The files stay there
+        until their records have been uploaded, so an interrupted upload resumes from them. """
         from azure.cli.telemetry.const import TELEMETRY_CACHE_DIR
 
         folder = os.path.join(self._config_dir, TELEMETRY_CACHE_DIR)
@@ -38,52 +45,94 @@ class RecordsCollection(object):
         # sort the cache files base on their last modification time.
         candidates = [(fn, os.stat(os.path.join(folder, fn))) for fn in os.listdir(folder) if fn != 'cache']
         candidates = [(fn, file_stat) for fn, file_stat in candidates if stat.S_ISREG(file_stat.st_mode)]
-        candidates.sort(key=lambda pair: pair[1].st_mtime, reverse=True)  # move the newer cache file first
+        candidates.sort(key=lambda pair: pair[1].st_mtime)  # move the older cache file first
 
         if not candidates:
             self._logger.info('No cache to be uploaded.')
             return
 
-        tmp = tempfile.mkdtemp()
+        upload_dir = self._get_upload_dir()
+        if not os.path.isdir(upload_dir):
+            os.makedirs(upload_dir)
         self._logger.info('%d cache files to move.', len(candidates))
-        self._logger.info('Create temp folder %s', tmp)
-
-        for each in candidates:
-            if stat.S_ISREG(each[1].st_mode):
-                try:
-                    # Platform question: if this op is atom
-                    os.rename(os.path.join(folder, each[0]), os.path.join(tmp, each[0]))
-                    self._logger.info('Move file %s to %s', os.path.join(folder, each[0]), os.path.join(tmp, each[0]))
-                except IOError as err:
-                    self._logger.warning('Fail to move file from %s to %s. Reason: %s.',
-                                         os.path.join(folder, each[0]), os.path.join(tmp, each[0]), err)
-
-        for each in os.listdir(tmp):
-            self._read_file(os.path.join(tmp, each))
-
-        shutil.rmtree(tmp,
-                      ignore_errors=True,
-                      onerror=lambda _, p, tr: self._logger.error('Fail to remove file %s', p))
-        self._logger.info('Remove directory %s', tmp)
+
+        # prefix the moved files, the rotated file names are reused by the next rotation
+        prefix = '{}-'.format(int(time.time() * 1000))
+        for fn, _ in candidates:
+            source, destination = os.path.join(folder, fn), os.path.join(upload_dir, prefix + fn)
+            try:
+                # Platform question: if this op is atom
+                os.rename(source, destination)
+                self._logger.info('Move file %s to %s', source, destination)
+            except (IOError, OSError) as err:
+                self._logger.warning('Fail to move file from %s to %s. Reason: %s.', source, destination, err)
+
+    def iter_chunks(self, size=None):
+        """ Stream the records of the files in the upload directory, the oldest file first.
+
+        Yields tuples of (records, timestamp of the last record, paths of the files read completely). A chunk holds at
+        least `size` records, if there are enough, and ends only where the timestamp changes, so once a chunk and all
+        the chunks before it are uploaded its last timestamp can be saved as the last sent time.
+        """
+        from azure.cli.telemetry.const import TELEMETRY_UPLOAD_CHUNK_SIZE
+
+        size = size or TELEMETRY_UPLOAD_CHUNK_SIZE
+        records, files, last_time = [], [], None
+        for path in self._get_upload_files():
+            for record_time, content in self._read_file(path):
+                if len(records) >= size and record_time > last_time:
+                    yield records, last_time, files
+                    records, files = [], []
+                records.append(content)
+                last_time = max(last_time, record_time) if last_time else record_time
+            files.append(path)
+        if records or files:
+            yield records, last_time, files
+
+    def remove_files(self, files):
+        for path in files:
+            try:
+                os.remove(path)
+                self._logger.info('Remove file %s', path)
+            except (IOError, OSError) as err:
+                self._logger.error('Fail to remove file %s. Reason: %s.', path, err)
+
+    def _get_upload_dir(self):
+        from azure.cli.telemetry.const import TELEMETRY_UPLOAD_DIR
+        return os.path.join(self._config_dir, TELEMETRY_UPLOAD_DIR)
+
+    def _get_upload_files(self):
+        upload_dir = self._get_upload_dir()
+        if not os.path.isdir(upload_dir):
+            return []
+        files = [os.path.join(upload_dir, fn) for fn in os.listdir(upload_dir)]
+        files = [(path, os.stat(path)) for path in files]
+        files = [(path, file_stat) for path, file_stat in files if stat.S_ISREG(file_stat.st_mode)]
+        return [path for path, _ in sorted(files, key=lambda pair: (pair[1].st_mtime, pair[0]))]
 
     def _read_file(self, path):
-        """ Read content of a telemetry cache file and parse them into records. """
+        """ Read the content of a telemetry cache file line by line and parse the lines into records. """
+        count = 0
         try:
             with open(path, mode='r') as fh:
-                for line in fh.readlines():
-                    self._add_record(line)
+                for line in fh:
+                    record = self._parse_record(line)
+                    if record:
+                        count += 1
+                        yield record
 
-                self._logger.info("Processed file %s into %d records.", path, len(self._records))
+                self._logger.info("Processed file %s into %d records.", path, count)
         except IOError as err:
             self._logger.warning("Fail to open file %s. Reason: %s.", path, err)
 
-    def _add_record(self, content_line):
-        """ Parse a line in the recording file. """
+    def _parse_record(self, content_line):
+        """ Parse a line in the recording file. Returns a tuple of (time, content) for the records to send. """
         try:
-            time, content = content_line.split(',', 1)
-            time = datetime.datetime.strptime(time, '%Y-%m-%dT%H:%M:%S')
-            if time > self._last_sent:
-                self._next_send = max(self._next_send, time)
-                self._records.append(content)
+            record_time, content = content_line.split(',', 1)
+            record_time = datetime.datetime.strptime(record_time, '%Y-%m-%dT%H:%M:%S')
+            if record_time > self._last_sent:
+                self._next_send = max(self._next_send, record_time)
+                return record_time, content
         except ValueError as err:
             self._logger.warning("Fail to parse a line of the record %s. Error %s.", content_line, err)
+        return None
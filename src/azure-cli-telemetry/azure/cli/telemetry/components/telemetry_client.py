@@ -5,7 +5,13 @@
 
 import json
 import datetime
+import threading
+from collections import deque
+
 import six
+from six.moves import queue
+from six.moves import http_client
+from six.moves.urllib.parse import urlparse
 
 from applicationinsights import TelemetryClient
 from applicationinsights.channel import SynchronousSender, SynchronousQueue, TelemetryChannel
@@ -118,3 +124,178 @@ class _NoRetrySender(SynchronousSender):
             self._logger.error('Unexpected exception: %s', e)
         finally:
             self._logger.info('Finish uploading in %f seconds.', (datetime.datetime.now() - begin).total_seconds())
+
+
+class TelemetryUploader(object):
+    """ Upload telemetry batches on a few threads, each over its own keep-alive connection.
+
+    At most `max_pending` serialized batches wait for a thread, so producers are throttled instead of buffering the
+    whole telemetry cache. Batches are grouped in chunks, and a chunk is confirmed once all of its batches and those
+    of the chunks before it have been uploaded, so the progress can be saved without resending or skipping records.
+    The batches of a chunk are only posted once the chunks before it are uploaded, and nothing is posted after an
+    upload fails, so later chunks are never sent early. The batches of a chunk are posted in parallel though, so when
+    one of them fails the others may already have been sent, and they are sent again with the chunk on the next upload.
+    """
+
+    def __init__(self, workers=None, max_pending=None, connection_cls=None):
+        from azure.cli.telemetry.const import TELEMETRY_UPLOAD_WORKERS, TELEMETRY_UPLOAD_MAX_PENDING_BATCHES
+        from azure.cli.telemetry.components.telemetry_logging import get_logger
+
+        self._logger = get_logger('uploader')
+        self._queue = queue.Queue(maxsize=max_pending or TELEMETRY_UPLOAD_MAX_PENDING_BATCHES)
+        self._connection_cls = connection_cls or _KeepAliveConnection
+        self._lock = threading.Lock()
+        self._uploaded = threading.Condition(self._lock)
+        self._chunks = deque()
+        self._current = _UploadChunk()
+        # chunks whose batches are not all uploaded yet, in order
+        self._unfinished = deque([self._current])
+        self.failed = False
+
+        self._threads = [threading.Thread(target=self._work) for _ in range(workers or TELEMETRY_UPLOAD_WORKERS)]
+        for thread in self._threads:
+            thread.daemon = True
+            thread.start()
+
+    def create_sender(self):
+        return _PipelinedSender(self)
+
+    def submit(self, endpoint, payload):
+        """ Queue a serialized batch as part of the current chunk. Blocks while too many batches are pending. """
+        with self._lock:
+            chunk = self._current
+            if self.failed:
+                # the chunk is left for the next upload
+                chunk.failed = True
+                return
+            chunk.pending += 1
+        self._queue.put((chunk, endpoint, payload))
+
+    def end_chunk(self, checkpoint):
+        """ Close the current chunk. The checkpoint is returned by `confirmed` once the chunk is uploaded. """
+        with self._lock:
+            self._current.checkpoint = checkpoint
+            self._current.closed = True
+            self._chunks.append(self._current)
+            self._current = _UploadChunk()
+            self._unfinished.append(self._current)
+            self._update_unfinished()
+
+    def confirmed(self):
+        """ Return the checkpoints of the chunks uploaded since the last call, in order. """
+        checkpoints = []
+        with self._lock:
+            while self._chunks and not self._chunks[0].pending:
+                if self._chunks[0].failed:
+                    # keep the failed chunk and everything after it for the next upload
+                    break
+                checkpoints.append(self._chunks.popleft().checkpoint)
+        return checkpoints
+
+    def close(self):
+        """ Wait for the pending batches and return the remaining confirmed checkpoints. """
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        return self.confirmed()
+
+    def _update_unfinished(self):
+        while self._unfinished[0].closed and not self._unfinished[0].pending:
+            self._unfinished.popleft()
+        self._uploaded.notify_all()
+
+    def _work(self):
+        connections = {}
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    return
+                chunk, endpoint, payload = item
+                with self._lock:
+                    while not self.failed and self._unfinished[0] is not chunk:
+                        self._uploaded.wait()
+                    skip = self.failed
+                try:
+                    if skip:
+                        chunk.failed = True
+                        continue
+                    if endpoint not in connections:
+                        connections[endpoint] = self._connection_cls(endpoint)
+                    connections[endpoint].post(payload)
+                    self._logger.info('Sending %d bytes', len(payload))
+                except Exception as e:  # pylint: disable=broad-except
+                    self._logger.error('Upload failed. %s: %s', type(e).__name__, e)
+                    chunk.failed = True
+                    with self._lock:
+                        self.failed = True
+                finally:
+                    with self._lock:
+                        chunk.pending -= 1
+                        self._update_unfinished()
+        finally:
+            for connection in connections.values():
+                connection.close()
+
+
+class _UploadChunk(object):  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.pending = 0
+        self.closed = False
+        self.failed = False
+        self.checkpoint = None
+
+
+class _PipelinedSender(SynchronousSender):
+    def __init__(self, uploader):
+        super(_PipelinedSender, self).__init__()
+        self._uploader = uploader
+
+    def send(self, data_to_send):
+        request_payload = json.dumps([a.write() for a in data_to_send])
+        self._uploader.submit(self._service_endpoint_uri, request_payload.encode('utf-8'))
+
+
+class _KeepAliveConnection(object):
+    """ Post telemetry batches to an endpoint over a connection that is kept open between batches. """
+
+    def __init__(self, endpoint, timeout=10):
+        from azure.cli.telemetry.components.telemetry_logging import get_logger
+
+        url = urlparse(endpoint)
+        self._connection_cls = http_client.HTTPSConnection if url.scheme == 'https' else http_client.HTTPConnection
+        self._host = url.netloc
+        self._path = url.path or '/'
+        self._timeout = timeout
+        self._connection = None
+        self._logger = get_logger('sender')
+
+    def post(self, payload):
+        """ Post a batch. Raises when it should be sent again later, and drops batches the service rejected. """
+        for attempt in range(2):
+            if self._connection is None:
+                self._connection = self._connection_cls(self._host, timeout=self._timeout)
+            try:
+                self._connection.request('POST', self._path, body=payload,
+                                         headers={'Accept': 'application/json',
+                                                  'Content-Type': 'application/json; charset=utf-8'})
+                response = self._connection.getresponse()
+                response.read()
+                break
+            except (http_client.HTTPException, IOError):
+                # the server may have closed the idle connection, reconnect once
+                self.close()
+                if attempt:
+                    raise
+
+        if response.status >= 500 or response.status in (408, 429):
+            raise IOError('HTTP status {}'.format(response.status))
+        if response.status >= 400:
+            # stop retry when the service rejects the batch
+            self._logger.error('Upload failed. HTTP status %d', response.status)
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
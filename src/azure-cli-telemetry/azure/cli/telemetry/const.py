@@ -8,6 +8,11 @@ from datetime import timedelta
 MANDATORY_WAIT_PERIOD = timedelta(minutes=10)
 
 TELEMETRY_CACHE_DIR = 'telemetry'
+TELEMETRY_UPLOAD_DIR = 'telemetry_upload'
 TELEMETRY_NOTE_NAME = 'telemetry.txt'
 TELEMETRY_LOG_NAME = 'telemetry.log'
 TELEMETRY_LOG_DIR = 'logs'
+
+TELEMETRY_UPLOAD_WORKERS = 4
+TELEMETRY_UPLOAD_MAX_PENDING_BATCHES = 8
+TELEMETRY_UPLOAD_CHUNK_SIZE = 500
@@ -49,6 +49,29 @@ class TestRecordsCollection(unittest.TestCase):
         self.assert_cache_files_count(1)
         self.assertEqual(453, len([r for r in collection]))
 
+    def test_records_collection_streams_chunks(self):
+        collection = RecordsCollection(datetime.datetime.min, self.work_dir)
+        collection.snapshot()
+        self.assert_cache_files_count(1)
+
+        chunks = list(collection.iter_chunks(100))
+        self.assertEqual(1750, sum(len(records) for records, _, _ in chunks))
+        self.assertEqual(self.TEST_CACHE_FILE_COUNT - 1, sum(len(files) for _, _, files in chunks))
+        for records, _, _ in chunks[:-1]:
+            self.assertGreaterEqual(len(records), 100)
+
+        # chunks end at a change of timestamp, in increasing order
+        last_times = [last_time for _, last_time, _ in chunks]
+        self.assertEqual(last_times, sorted(set(last_times)))
+        self.assertEqual(collection.next_send, last_times[-1])
+
+        # the files stay in the upload directory until they are removed
+        collection = RecordsCollection(datetime.datetime.min, self.work_dir)
+        self.assertEqual(1750, sum(len(records) for records, _, _ in collection.iter_chunks(100)))
+        for _, _, files in chunks:
+            collection.remove_files(files)
+        self.assertEqual([], list(collection.iter_chunks(100)))
+
     def test_create_records_collection_against_missing_config_folder(self):
         collection = RecordsCollection(datetime.datetime.min, tempfile.mktemp())
         self.assertEqual(0, len([r for r in collection]))
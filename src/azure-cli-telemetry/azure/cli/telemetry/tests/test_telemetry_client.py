@@ -19,7 +19,8 @@ except ImportError:
     import urllib.request as http_client_t
     from urllib.error import HTTPError
 
-from azure.cli.telemetry.components.telemetry_client import (CliTelemetryClient, _NoRetrySender, http_client_t)
+from azure.cli.telemetry.components.telemetry_client import (CliTelemetryClient, TelemetryUploader, _NoRetrySender,
+                                                             http_client_t)
 
 TEST_RESOURCE_FOLDER = os.path.join(os.path.dirname(__file__), 'resources')
 
@@ -155,5 +156,68 @@ class TestNoRetrySender(unittest.TestCase):
         mock_url_open.assert_called_once()
 
 
+class _TestConnection(object):
+    posted = []
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+
+    def post(self, payload):
+        data = json.loads(payload.decode('utf-8'))
+        if any(each['data']['baseData']['name'] == 'azurecli/fail' for each in data):
+            raise IOError('HTTP status 503')
+        _TestConnection.posted.extend(data)
+
+    def close(self):
+        pass
+
+
+class TestTelemetryUploader(unittest.TestCase):
+    def setUp(self):
+        self.sample_records = []
+        for f in sorted(os.listdir(TEST_RESOURCE_FOLDER))[:2]:
+            with open(os.path.join(TEST_RESOURCE_FOLDER, f), mode='r') as fq:
+                for line in fq.readlines():
+                    self.sample_records.append(line[20:])
+        del _TestConnection.posted[:]
+        del _TestSender.instances[:]
+
+    def _upload(self, uploader, chunks):
+        client = CliTelemetryClient(batch=20, sender=uploader.create_sender)
+        for index, records in enumerate(chunks):
+            for record in records:
+                client.add(record, flush=True)
+            client.flush(force=True)
+            uploader.end_chunk(index)
+        return uploader.close()
+
+    def test_uploader_confirms_chunks_in_order(self):
+        uploader = TelemetryUploader(workers=3, max_pending=2, connection_cls=_TestConnection)
+        records = self.sample_records
+        chunks = [records[:50], records[50:55], records[55:]]
+        self.assertEqual([0, 1, 2], self._upload(uploader, chunks))
+        self.assertFalse(uploader.failed)
+
+        expected = CliTelemetryClient(sender=_TestSender)
+        for record in records:
+            expected.add(record)
+        expected.flush(force=True)
+        self.assertEqual(sum(len(data) for data in _TestSender.instances[0].data), len(_TestConnection.posted))
+
+    def test_uploader_stops_confirming_at_failed_chunk(self):
+        uploader = TelemetryUploader(workers=2, connection_cls=_TestConnection)
+        records = self.sample_records
+        failing = [r.replace('azurecli/command', 'azurecli/fail') for r in records[50:55]]
+        self.assertEqual([0], self._upload(uploader, [records[:50], failing, records[55:]]))
+        self.assertTrue(uploader.failed)
+
+        # nothing after the failed chunk is posted, so it isn't sent twice by the next upload
+        expected = CliTelemetryClient(sender=_TestSender)
+        for record in records[:50]:
+            expected.add(record)
+        expected.flush(force=True)
+        self.assertEqual(sum(len(data) for data in _TestSender.instances[0].data), len(_TestConnection.posted))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -11,6 +11,7 @@ from knack.completion import ARGCOMPLETE_ENV_NAME
 from knack.log import get_logger
 
 from azure.cli.core import get_default_cli
+from azure.cli.core.daemon import run_in_daemon
 
 import azure.cli.core.telemetry as telemetry
 
@@ -30,6 +31,11 @@ def cli_main(cli, args):
     return cli.invoke(args)
 
 
+# Hand the invocation to a resident daemon when one is enabled, before paying for the CLI bootstrap
+daemon_exit_code = run_in_daemon(sys.argv[1:])
+if daemon_exit_code is not None:
+    sys.exit(daemon_exit_code)
+
 az_cli = get_default_cli()
 
 telemetry.set_application(az_cli, ARGCOMPLETE_ENV_NAME)
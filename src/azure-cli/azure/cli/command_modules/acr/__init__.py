@@ -5,8 +5,6 @@
 
 from azure.cli.core import AzCommandsLoader
 
-import azure.cli.command_modules.acr._help  # pylint: disable=unused-import
-
 
 class ACRCommandsLoader(AzCommandsLoader):
 
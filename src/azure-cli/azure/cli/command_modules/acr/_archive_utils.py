@@ -23,23 +23,8 @@ def upload_source_code(client,
                        registry_name,
                        resource_group_name,
                        source_location,
-                       tar_file_path,
                        docker_file_path,
                        docker_file_in_tar):
-    _pack_source_code(source_location,
-                      tar_file_path,
-                      docker_file_path,
-                      docker_file_in_tar)
-
-    size = os.path.getsize(tar_file_path)
-    unit = 'GiB'
-    for S in ['Bytes', 'KiB', 'MiB', 'GiB']:
-        if size < 1024:
-            unit = S
-            break
-        size = size / 1024.0
-
-    logger.warning("Uploading archived source code from '%s'...", tar_file_path)
     upload_url = None
     relative_path = None
     try:
@@ -54,22 +39,79 @@ def upload_source_code(client,
         raise CLIError("Failed to get a SAS URL to upload context.")
 
     account_name, endpoint_suffix, container_name, blob_name, sas_token = get_blob_info(upload_url)
-    BlockBlobService(account_name=account_name,
-                     sas_token=sas_token,
-                     endpoint_suffix=endpoint_suffix).create_blob_from_path(
-                         container_name=container_name,
-                         blob_name=blob_name,
-                         file_path=tar_file_path)
+    blob_service = BlockBlobService(account_name=account_name,
+                                    sas_token=sas_token,
+                                    endpoint_suffix=endpoint_suffix)
+
+    # The archive is compressed on a separate thread and streamed to the blob as it's being built,
+    # so that packing and uploading overlap and no temporary tar file is written to disk.
+    # A pipe can't seek, so its blocks have to be read and uploaded sequentially.
+    read_fd, write_fd = os.pipe()
+    reader = os.fdopen(read_fd, 'rb')
+    writer = _CountingWriter(os.fdopen(write_fd, 'wb'))
+    pack_errors = []
+
+    def _pack():
+        try:
+            _pack_source_code(source_location, writer, docker_file_path, docker_file_in_tar)
+        except Exception as err:  # pylint: disable=broad-except
+            pack_errors.append(err)
+        finally:
+            try:
+                writer.close()
+            except (IOError, OSError):
+                pass
+
+    import threading
+    pack_thread = threading.Thread(target=_pack)
+    pack_thread.daemon = True
+    logger.warning("Uploading archived source code from '%s'...", source_location)
+    pack_thread.start()
+    try:
+        blob_service.create_blob_from_stream(
+            container_name=container_name,
+            blob_name=blob_name,
+            stream=reader,
+            max_connections=1)
+    finally:
+        # unblock the packing thread if the upload stopped reading early
+        reader.close()
+        pack_thread.join()
+    if pack_errors:
+        raise pack_errors[0]
+
+    size = writer.count
+    unit = 'GiB'
+    for S in ['Bytes', 'KiB', 'MiB', 'GiB']:
+        if size < 1024:
+            unit = S
+            break
+        size = size / 1024.0
+
     logger.warning("Sending context ({0:.3f} {1}) to registry: {2}...".format(
         size, unit, registry_name))
     return relative_path
 
 
-def _pack_source_code(source_location, tar_file_path, docker_file_path, docker_file_in_tar):
+class _CountingWriter(object):
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.count = 0
+
+    def write(self, data):
+        self._fileobj.write(data)
+        self.count += len(data)
+
+    def close(self):
+        self._fileobj.close()
+
+
+def _pack_source_code(source_location, fileobj, docker_file_path, docker_file_in_tar):
     logger.warning("Packing source code into tar to upload...")
 
     ignore_list, ignore_list_size = _load_dockerignore_file(source_location)
     common_vcs_ignore_list = {'.git', '.gitignore', '.bzr', 'bzrignore', '.hg', '.hgignore', '.svn'}
+    matcher = IgnoreRuleMatcher(ignore_list) if ignore_list else None
 
     def _ignore_check(tarinfo, parent_ignored, parent_matching_rule_index):
         # ignore common vcs dir or file
@@ -82,29 +124,34 @@ def _pack_source_code(source_location, tar_file_path, docker_file_path, docker_f
             # eg, it will ignore the files under .git folder.
             return parent_ignored, parent_matching_rule_index
 
-        for index, item in enumerate(ignore_list):
-            # stop checking the remaining rules whose priorities are lower than the parent matching rule
-            # at this point, current item should just inherit from parent
-            if index >= parent_matching_rule_index:
-                break
-            if re.match(item.pattern, tarinfo.name):
-                logger.debug(".dockerignore: rule '%s' matches '%s'.",
-                             item.rule, tarinfo.name)
-                return item.ignore, index
+        # rules whose priorities are lower than the parent matching rule are not checked,
+        # current item should just inherit from parent in that case
+        index = matcher.match(tarinfo.name, parent_matching_rule_index) if matcher else None
+        if index is not None:
+            item = ignore_list[index]
+            logger.debug(".dockerignore: rule '%s' matches '%s'.",
+                         item.rule, tarinfo.name)
+            return item.ignore, index
 
         logger.debug(".dockerignore: no rule for '%s'. parent ignore '%s'",
                      tarinfo.name, parent_ignored)
         # inherit from parent
         return parent_ignored, parent_matching_rule_index
 
-    with tarfile.open(tar_file_path, "w:gz") as tar:
+    def _prune_check(tarinfo, ignored, matching_rule_index):
+        # the items under an ignored dir can only be included again by an exception rule with a higher priority
+        # than the rule that ignored the dir, so the dir doesn't need to be scanned if there is no such rule
+        return ignored and (matcher is None or not matcher.may_include_under(tarinfo.name, matching_rule_index))
+
+    with tarfile.open(fileobj=fileobj, mode="w|gz") as tar:
         # need to set arcname to empty string as the archive root path
         _archive_file_recursively(tar,
                                   source_location,
                                   arcname="",
                                   parent_ignored=False,
                                   parent_matching_rule_index=ignore_list_size,
-                                  ignore_check=_ignore_check)
+                                  ignore_check=_ignore_check,
+                                  prune_check=_prune_check)
 
         # Add the Dockerfile if it's specified.
         # In the case of run, there will be no Dockerfile.
@@ -143,6 +190,44 @@ class IgnoreRule(object):  # pylint: disable=too-few-public-methods
         self.pattern += "$"
 
 
+class IgnoreRuleMatcher(object):  # pylint: disable=too-few-public-methods
+    """Matches a path against a list of ignore rules, ordered by priority, with a few combined regular expressions
+    instead of one regular expression per rule."""
+
+    # keep the number of groups per expression under the limit of older Python versions
+    RULES_PER_EXPRESSION = 50
+
+    def __init__(self, ignore_list):
+        self.ignore_list = ignore_list
+        self._expressions = []
+        for offset in range(0, len(ignore_list), self.RULES_PER_EXPRESSION):
+            rules = ignore_list[offset:offset + self.RULES_PER_EXPRESSION]
+            pattern = '|'.join('(?P<r{}>{})'.format(offset + i, item.pattern) for i, item in enumerate(rules))
+            self._expressions.append((offset, re.compile(pattern)))
+        # the literal part of each exception rule before its first wildcard
+        self._exception_prefixes = [(index, re.split(r'[*?\[\\]', item.rule[1:], 1)[0])
+                                    for index, item in enumerate(ignore_list) if not item.ignore]
+
+    def match(self, name, max_index=None):
+        """Return the index of the highest priority rule below `max_index` that matches `name`, or None."""
+        max_index = len(self.ignore_list) if max_index is None else max_index
+        for offset, expression in self._expressions:
+            if offset >= max_index:
+                break
+            # the first alternative that matches is the rule with the highest priority
+            m = expression.match(name)
+            if m:
+                index = int(m.lastgroup[1:])
+                return index if index < max_index else None
+        return None
+
+    def may_include_under(self, dir_name, max_index):
+        """Return whether an exception rule with a priority above `max_index` might match an item under `dir_name`."""
+        dir_prefix = dir_name + '/' if dir_name else ''
+        return any(index < max_index and (prefix.startswith(dir_prefix) or dir_prefix.startswith(prefix))
+                   for index, prefix in self._exception_prefixes)
+
+
 def _load_dockerignore_file(source_location):
     # reference: https://docs.docker.com/engine/reference/builder/#dockerignore-file
     docker_ignore_file = os.path.join(source_location, ".dockerignore")
@@ -169,7 +254,8 @@ def _load_dockerignore_file(source_location):
     return ignore_list, len(ignore_list)
 
 
-def _archive_file_recursively(tar, name, arcname, parent_ignored, parent_matching_rule_index, ignore_check):
+def _archive_file_recursively(tar, name, arcname, parent_ignored, parent_matching_rule_index, ignore_check,
+                              prune_check=None):
     # create a TarInfo object from the file
     tarinfo = tar.gettarinfo(name, arcname)
 
@@ -189,11 +275,12 @@ def _archive_file_recursively(tar, name, arcname, parent_ignored, parent_matchin
             tar.addfile(tarinfo)
 
     # even the dir is ignored, its child items can still be included, so continue to scan
-    if tarinfo.isdir():
+    # unless no rule could include them again
+    if tarinfo.isdir() and not (prune_check and prune_check(tarinfo, ignored, matching_rule_index)):
         for f in os.listdir(name):
             _archive_file_recursively(tar, os.path.join(name, f), os.path.join(arcname, f),
                                       parent_ignored=ignored, parent_matching_rule_index=matching_rule_index,
-                                      ignore_check=ignore_check)
+                                      ignore_check=ignore_check, prune_check=prune_check)
 
 
 def check_remote_source_code(source_location):
@@ -2,7 +2,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
-from io import BytesIO
+import sys
 import time
 from random import uniform
 import colorama
@@ -16,6 +16,8 @@ from ._azure_utils import get_blob_info
 logger = get_logger(__name__)
 
 DEFAULT_CHUNK_SIZE = 1024 * 4
+MAX_CHUNK_SIZE = 1024 * 1024 * 4
+TARGET_CHUNK_TIME_IN_SEC = 1
 DEFAULT_LOG_TIMEOUT_IN_SEC = 60 * 30  # 30 minutes
 
 
@@ -24,7 +26,8 @@ def stream_logs(client,
                 registry_name,
                 resource_group_name,
                 no_format=False,
-                raise_error_on_failure=False):
+                raise_error_on_failure=False,
+                log_file=None):
     log_file_sas = None
     error_msg = "Could not get logs for ID: {}".format(run_id)
 
@@ -53,21 +56,85 @@ def stream_logs(client,
                      endpoint_suffix=endpoint_suffix),
                  container_name,
                  blob_name,
-                 raise_error_on_failure)
+                 raise_error_on_failure,
+                 log_file)
 
 
-def _stream_logs(no_format,  # pylint: disable=too-many-locals, too-many-statements, too-many-branches
+class _LogLineDecoder(object):
+    """Incrementally splits streamed log bytes on \\r\\n. Each chunk is appended to the pending buffer once,
+    only the new bytes are scanned, and complete lines are written out as soon as they arrive."""
+
+    def __init__(self, write):
+        self._write = write
+        self._pending = bytearray()
+        self._scanned = 0
+
+    def feed(self, data):
+        self._pending += data
+        # a \r\n may straddle the previous chunk and this one
+        end = self._pending.rfind(b'\r\n', max(self._scanned - 1, 0))
+        if end < 0:
+            self._scanned = len(self._pending)
+            return
+        end += 2
+        self._write(self._pending[:end].decode('utf-8', errors='ignore'))
+        del self._pending[:end]
+        self._scanned = len(self._pending)
+
+    def flush(self):
+        # write out what's left even though it doesn't end in \r\n
+        if self._pending:
+            self._write(self._pending.decode('utf-8', errors='ignore') + '\n')
+            self._pending = bytearray()
+            self._scanned = 0
+
+
+def _write_to_stdout(text):
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def _next_chunk_size(byte_size, amount_read, elapsed_in_sec):
+    """Grow the requested range while full chunks come back quickly, shrink it when they are slow."""
+    if amount_read >= byte_size and elapsed_in_sec < TARGET_CHUNK_TIME_IN_SEC / 2.0:
+        return min(byte_size * 2, MAX_CHUNK_SIZE)
+    if elapsed_in_sec > TARGET_CHUNK_TIME_IN_SEC * 2:
+        return max(byte_size // 2, DEFAULT_CHUNK_SIZE)
+    return byte_size
+
+
+def _stream_logs(no_format,
                  byte_size,
                  timeout_in_seconds,
                  blob_service,
                  container_name,
                  blob_name,
-                 raise_error_on_failure):
+                 raise_error_on_failure,
+                 log_file=None):
+
+    if log_file:
+        with open(log_file, 'wb') as f:
+            logger.warning("Writing logs to %s", log_file)
+            return _stream_logs_to_sink(f.write, None, byte_size, timeout_in_seconds, blob_service, container_name,
+                                        blob_name, raise_error_on_failure)
 
     if not no_format:
         colorama.init()
 
-    stream = BytesIO()
+    decoder = _LogLineDecoder(_write_to_stdout)
+    return _stream_logs_to_sink(decoder.feed, decoder.flush, byte_size, timeout_in_seconds, blob_service,
+                                container_name, blob_name, raise_error_on_failure)
+
+
+def _stream_logs_to_sink(write,  # pylint: disable=too-many-locals, too-many-statements, too-many-branches
+                         flush,
+                         byte_size,
+                         timeout_in_seconds,
+                         blob_service,
+                         container_name,
+                         blob_name,
+                         raise_error_on_failure):
+    flush = flush or (lambda: None)
     metadata = {}
     start = 0
     end = byte_size - 1
@@ -96,36 +163,24 @@ def _stream_logs(no_format,  # pylint: disable=too-many-locals, too-many-stateme
             consecutive_sleep_in_sec = 0
 
             try:
-                old_byte_size = len(stream.getvalue())
-                blob_service.get_blob_to_stream(
+                fetch_start = time.time()
+                chunk = blob_service.get_blob_to_bytes(
                     container_name=container_name,
                     blob_name=blob_name,
                     start_range=start,
                     end_range=end,
-                    stream=stream)
+                    max_connections=1).content
 
-                curr_bytes = stream.getvalue()
-                new_byte_size = len(curr_bytes)
-                amount_read = new_byte_size - old_byte_size
+                amount_read = len(chunk)
                 start += amount_read
+                byte_size = _next_chunk_size(byte_size, amount_read, time.time() - fetch_start)
                 end = start + byte_size - 1
-
-                # Only scan what's newly read. If nothing is read, default to 0.
-                min_scan_range = max(new_byte_size - amount_read - 1, 0)
-                for i in range(new_byte_size - 1, min_scan_range, -1):
-                    if curr_bytes[i - 1:i + 1] == b'\r\n':
-                        flush = curr_bytes[:i]  # won't print \n
-                        stream = BytesIO()
-                        stream.write(curr_bytes[i + 1:])
-                        print(flush.decode('utf-8', errors='ignore'))
-                        break
+                write(chunk)
             except AzureHttpError as ae:
                 if ae.status_code != 404:
                     raise CLIError(ae)
             except KeyboardInterrupt:
-                curr_bytes = stream.getvalue()
-                if curr_bytes:
-                    print(curr_bytes.decode('utf-8', errors='ignore'))
+                flush()
                 return
 
         try:
@@ -137,8 +192,7 @@ def _stream_logs(no_format,  # pylint: disable=too-many-locals, too-many-stateme
             if ae.status_code != 404:
                 raise CLIError(ae)
         except KeyboardInterrupt:
-            if curr_bytes:
-                print(curr_bytes.decode('utf-8', errors='ignore'))
+            flush()
             return
         except Exception as err:
             raise CLIError(err)
@@ -146,9 +200,7 @@ def _stream_logs(no_format,  # pylint: disable=too-many-locals, too-many-stateme
         if consecutive_sleep_in_sec > timeout_in_seconds:
             # Flush anything remaining in the buffer - this would be the case
             # if the file has expired and we weren't able to detect any \r\n
-            curr_bytes = stream.getvalue()
-            if curr_bytes:
-                print(curr_bytes.decode('utf-8', errors='ignore'))
+            flush()
 
             logger.warning("Failed to find any new logs in %d seconds. Client will stop polling for additional logs.",
                            consecutive_sleep_in_sec)
@@ -175,9 +227,7 @@ def _stream_logs(no_format,  # pylint: disable=too-many-locals, too-many-stateme
     # One final check to see if there's anything in the buffer to flush
     # E.g., metadata has been set and start == available, but the log file
     # didn't end in \r\n, so we were unable to flush out the final contents.
-    curr_bytes = stream.getvalue()
-    if curr_bytes:
-        print(curr_bytes.decode('utf-8', errors='ignore'))
+    flush()
 
     build_status = _get_run_status(metadata).lower()
     logger.debug("status was: '%s'", build_status)
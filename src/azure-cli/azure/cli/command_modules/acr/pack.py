@@ -43,7 +43,8 @@ def acr_pack_build(cmd,  # pylint: disable=too-many-locals
                    timeout=None,
                    resource_group_name=None,
                    platform=None,
-                   auth_mode=None):
+                   auth_mode=None,
+                   log_file=None):
     registry, resource_group_name = get_registry_by_name(cmd.cli_ctx, registry_name)
 
     client_registries = cf_acr_registries_tasks(cmd.cli_ctx)
@@ -107,4 +108,4 @@ def acr_pack_build(cmd,  # pylint: disable=too-many-locals
         from ._run_polling import get_run_with_polling
         return get_run_with_polling(cmd, client, run_id, registry_name, resource_group_name)
 
-    return stream_logs(client, run_id, registry_name, resource_group_name, no_format, True)
+    return stream_logs(client, run_id, registry_name, resource_group_name, no_format, True, log_file=log_file)
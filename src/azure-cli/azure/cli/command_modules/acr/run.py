@@ -38,7 +38,8 @@ def acr_run(cmd,  # pylint: disable=too-many-locals
             timeout=None,
             resource_group_name=None,
             platform=None,
-            auth_mode=None):
+            auth_mode=None,
+            log_file=None):
 
     _, resource_group_name = validate_managed_registry(
         cmd, registry_name, resource_group_name, RUN_NOT_SUPPORTED)
@@ -111,4 +112,4 @@ def acr_run(cmd,  # pylint: disable=too-many-locals
         from ._run_polling import get_run_with_polling
         return get_run_with_polling(cmd, client, run_id, registry_name, resource_group_name)
 
-    return stream_logs(client, run_id, registry_name, resource_group_name, no_format, True)
+    return stream_logs(client, run_id, registry_name, resource_group_name, no_format, True, log_file=log_file)
@@ -887,7 +887,8 @@ def acr_task_logs(cmd,
                   run_id=None,
                   task_name=None,
                   image=None,
-                  resource_group_name=None):
+                  resource_group_name=None,
+                  log_file=None):
     _, resource_group_name = validate_managed_registry(
         cmd, registry_name, resource_group_name, TASK_NOT_SUPPORTED)
 
@@ -910,7 +911,7 @@ def acr_task_logs(cmd,
                                                   task_name=task_name,
                                                   image=image))
 
-    return stream_logs(client, run_id, registry_name, resource_group_name)
+    return stream_logs(client, run_id, registry_name, resource_group_name, log_file=log_file)
 
 
 def _get_list_runs_message(base_message, task_name=None, image=None):
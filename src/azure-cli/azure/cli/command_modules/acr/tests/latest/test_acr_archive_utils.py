@@ -0,0 +1,137 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import binascii
+import io
+import os
+import re
+import shutil
+import tarfile
+import tempfile
+import unittest
+import mock
+
+from azure.storage.blob import BlockBlobService
+
+from azure.cli.command_modules.acr._archive_utils import (
+    IgnoreRule,
+    IgnoreRuleMatcher,
+    upload_source_code
+)
+
+UPLOAD_URL = 'https://account.blob.core.windows.net/container/blob?sig=token'
+
+
+class AcrArchiveUtilsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.source_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.source_dir)
+        self.uploaded = io.BytesIO()
+        self.listed = []
+
+    def _write(self, name, content='content'):
+        path = os.path.join(self.source_dir, *name.split('/'))
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, 'w') as f:
+            f.write(content)
+
+    def _upload(self, docker_file_path='', docker_file_in_tar=''):
+        client = mock.MagicMock()
+        client.get_build_source_upload_url.return_value = mock.MagicMock(upload_url=UPLOAD_URL,
+                                                                         relative_path='source/path')
+
+        def _create_blob_from_stream(container_name, blob_name, stream, max_connections):
+            self.assertEqual(max_connections, 1)
+            self.assertEqual((container_name, blob_name), ('container', 'blob'))
+            for chunk in iter(lambda: stream.read(1024), b''):
+                self.uploaded.write(chunk)
+
+        listdir = os.listdir
+
+        def _listdir(path):
+            self.listed.append(os.path.relpath(path, self.source_dir).replace(os.sep, '/'))
+            return listdir(path)
+
+        with mock.patch('azure.cli.command_modules.acr._archive_utils.BlockBlobService') as service_mock, \
+                mock.patch('os.listdir', side_effect=_listdir):
+            service_mock.return_value.create_blob_from_stream.side_effect = _create_blob_from_stream
+            relative_path = upload_source_code(client, 'registry', 'rg', self.source_dir,
+                                               docker_file_path, docker_file_in_tar)
+        self.assertEqual(relative_path, 'source/path')
+        self.uploaded.seek(0)
+        with tarfile.open(fileobj=self.uploaded, mode='r:gz') as tar:
+            return sorted(m.name for m in tar.getmembers() if m.isfile())
+
+    def test_ignore_rule_matcher(self):
+        rules = ['*.md', '!README.md', 'docs', 'docs/**/*.png', '!docs/keep.png']
+        ignore_list = [IgnoreRule(rule) for rule in reversed(rules)]
+        ignore_list += [IgnoreRule('generated/file{}'.format(i)) for i in range(120)]
+        matcher = IgnoreRuleMatcher(ignore_list)
+        for name in ['README.md', 'CHANGES.md', 'docs', 'docs/keep.png', 'docs/a/b.png', 'src/main.py',
+                     'generated/file3', 'generated/file119']:
+            expected = next((i for i, item in enumerate(ignore_list) if re.match(item.pattern, name)), None)
+            self.assertEqual(matcher.match(name), expected, name)
+        self.assertEqual(matcher.match('CHANGES.md', 2), None)
+        self.assertEqual(matcher.match('generated/file119', 50), None)
+        self.assertTrue(matcher.may_include_under('docs', len(ignore_list)))
+        self.assertFalse(matcher.may_include_under('docs', 0))
+        self.assertFalse(matcher.may_include_under('generated', len(ignore_list)))
+        self.assertTrue(matcher.may_include_under('', len(ignore_list)))
+
+    def test_upload_source_code(self):
+        self._write('.dockerignore', 'node_modules\nbuild\n!build/keep.txt\n*.log\n')
+        self._write('app.py')
+        self._write('debug.log')
+        self._write('node_modules/lib/index.js')
+        self._write('build/out.bin')
+        self._write('build/keep.txt')
+        self._write('.git/config')
+        self._write('Dockerfile.custom', 'FROM scratch')
+        members = self._upload(os.path.join(self.source_dir, 'Dockerfile.custom'), 'uuid_Dockerfile')
+        self.assertEqual(members, ['.dockerignore', 'Dockerfile.custom', 'app.py', 'build/keep.txt',
+                                   'uuid_Dockerfile'])
+        # ignored directories are not scanned unless an exception rule could include their items again
+        self.assertIn('build', self.listed)
+        self.assertNotIn('node_modules', self.listed)
+        self.assertNotIn('.git', self.listed)
+
+    def test_upload_source_code_without_dockerignore(self):
+        self._write('app.py')
+        self._write('.git/config')
+        self.assertEqual(self._upload(), ['app.py'])
+        self.assertNotIn('.git', self.listed)
+
+    def test_upload_source_code_in_blocks(self):
+        for i in range(20):
+            self._write('src/file{}.bin'.format(i), binascii.hexlify(os.urandom(4096)).decode())
+        client = mock.MagicMock()
+        client.get_build_source_upload_url.return_value = mock.MagicMock(upload_url=UPLOAD_URL,
+                                                                         relative_path='source/path')
+        blocks = {}
+
+        def _put_block(container_name, blob_name, block, block_id, **kwargs):
+            blocks[block_id] = block if isinstance(block, bytes) else block.read()
+
+        def _put_block_list(container_name, blob_name, block_list, **kwargs):
+            for block in block_list:
+                self.uploaded.write(blocks[block.id])
+
+        # run the real chunked upload of the storage SDK against the pipe, with small blocks
+        with mock.patch.object(BlockBlobService, 'MAX_BLOCK_SIZE', 4096), \
+                mock.patch.object(BlockBlobService, '_put_block', autospec=True,
+                                  side_effect=lambda _, *args, **kwargs: _put_block(*args, **kwargs)), \
+                mock.patch.object(BlockBlobService, '_put_block_list', autospec=True,
+                                  side_effect=lambda _, *args, **kwargs: _put_block_list(*args, **kwargs)):
+            upload_source_code(client, 'registry', 'rg', self.source_dir, '', '')
+        self.assertGreater(len(blocks), 1)
+        self.uploaded.seek(0)
+        with tarfile.open(fileobj=self.uploaded, mode='r:gz') as tar:
+            self.assertEqual(len([m for m in tar.getmembers() if m.isfile()]), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
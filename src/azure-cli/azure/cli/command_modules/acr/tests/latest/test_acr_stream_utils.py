@@ -0,0 +1,86 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+import unittest
+import mock
+
+from knack.util import CLIError
+
+from azure.cli.command_modules.acr._stream_utils import (
+    _LogLineDecoder,
+    _next_chunk_size,
+    _stream_logs,
+    DEFAULT_CHUNK_SIZE,
+    MAX_CHUNK_SIZE
+)
+
+
+class FakeAppendBlobService(object):
+    def __init__(self, content, status='Succeeded'):
+        self.content = content
+        self.status = status
+        self.ranges = []
+
+    def get_blob_properties(self, container_name, blob_name):
+        props = mock.MagicMock()
+        props.metadata = {'Complete': self.status}
+        props.properties.content_length = len(self.content)
+        return props
+
+    def get_blob_to_bytes(self, container_name, blob_name, start_range, end_range, **kwargs):
+        self.ranges.append((start_range, end_range))
+        return mock.MagicMock(content=self.content[start_range:end_range + 1])
+
+
+class AcrStreamUtilsTests(unittest.TestCase):
+
+    def test_log_line_decoder(self):
+        written = []
+        decoder = _LogLineDecoder(written.append)
+        decoder.feed(b'step 1\r\nstep')
+        decoder.feed(b' 2\r')
+        decoder.feed(b'\nstep 3\r\nst')
+        self.assertEqual(written, ['step 1\r\n', 'step 2\r\nstep 3\r\n'])
+        decoder.feed(b'ep 4 \xe2\x9c')
+        decoder.feed(b'\x93')
+        decoder.flush()
+        self.assertEqual(written[2:], [u'step 4 \u2713\n'])
+        decoder.flush()
+        self.assertEqual(len(written), 3)
+
+    def test_next_chunk_size(self):
+        self.assertEqual(_next_chunk_size(DEFAULT_CHUNK_SIZE, DEFAULT_CHUNK_SIZE, 0.1), DEFAULT_CHUNK_SIZE * 2)
+        self.assertEqual(_next_chunk_size(MAX_CHUNK_SIZE, MAX_CHUNK_SIZE, 0.1), MAX_CHUNK_SIZE)
+        self.assertEqual(_next_chunk_size(DEFAULT_CHUNK_SIZE * 4, 10, 0.1), DEFAULT_CHUNK_SIZE * 4)
+        self.assertEqual(_next_chunk_size(DEFAULT_CHUNK_SIZE * 4, DEFAULT_CHUNK_SIZE * 4, 5), DEFAULT_CHUNK_SIZE * 2)
+        self.assertEqual(_next_chunk_size(DEFAULT_CHUNK_SIZE, DEFAULT_CHUNK_SIZE, 5), DEFAULT_CHUNK_SIZE)
+
+    @mock.patch('azure.cli.command_modules.acr._stream_utils._write_to_stdout')
+    def test_stream_logs(self, write_mock):
+        content = b''.join(b'line %d\r\n' % i for i in range(10000)) + b'done'
+        blob_service = FakeAppendBlobService(content)
+        _stream_logs(True, DEFAULT_CHUNK_SIZE, 60, blob_service, 'container', 'blob', True)
+        self.assertEqual(''.join(c[0][0] for c in write_mock.call_args_list).encode(), content + b'\n')
+        # the requested range grows as the chunks come back quickly
+        self.assertLess(len(blob_service.ranges), 10)
+
+    def test_stream_logs_to_file(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        log_file = os.path.join(temp_dir, 'run.log')
+        content = b'step 1\r\nstep 2 failed'
+        blob_service = FakeAppendBlobService(content, status='Failed')
+        with self.assertRaises(CLIError) as context:
+            _stream_logs(False, DEFAULT_CHUNK_SIZE, 60, blob_service, 'container', 'blob', True, log_file)
+        self.assertEqual(str(context.exception), 'Run failed')
+        with open(log_file, 'rb') as f:
+            self.assertEqual(f.read(), content)
+
+
+if __name__ == '__main__':
+    unittest.main()
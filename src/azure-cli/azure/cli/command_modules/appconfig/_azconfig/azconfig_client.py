@@ -114,6 +114,82 @@ class AzconfigClient(object):
                                 body_content,
                                 modify_options)
 
+    def set_keyvalues(self, keyvalues, modify_options=None, current_keyvalues=None, max_concurrency=10):
+        """ Sets many key-values within a configuration store concurrently.
+        Requests share a pool of connections. When the service throttles them, fewer requests are sent at the same
+        time and the throttled ones are retried after the time given in the retry-after-ms header.
+
+        :param list[KeyValue] keyvalues:
+            The key-values to set. The last one wins when a key and label appear more than once.
+        :param ModifyKeyValueOptions modify_options:
+            Optional parameter to set keyvalue modification options
+        :param list[KeyValue] current_keyvalues:
+            Optional snapshot of the configuration store. Key-values whose value, content type and tags are unchanged from the snapshot are not written.
+        :param int max_concurrency:
+            Maximum number of requests sent at the same time.
+
+        :return:
+            The result of each key-value, in the same order.
+        :rtype:
+            list[KeyValueWriteResult]
+
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from azure.cli.core.util import AdaptiveConcurrencyLimiter
+
+        if modify_options is None:
+            modify_options = models.ModifyKeyValueOptions()
+
+        def _state(kv):
+            return kv.value, kv.content_type or None, kv.tags or {}
+
+        current = {(kv.key, kv.label): _state(kv) for kv in current_keyvalues or []}
+        latest = {(kv.key, kv.label): index for index, kv in enumerate(keyvalues)}
+        results = [None] * len(keyvalues)
+        pending = []
+        for index, kv in enumerate(keyvalues):
+            if latest[(kv.key, kv.label)] != index or current.get((kv.key, kv.label)) == _state(kv):
+                results[index] = models.KeyValueWriteResult(kv, models.KeyValueWriteResult.UNCHANGED)
+            else:
+                pending.append(index)
+        if not pending:
+            return results
+
+        max_concurrency = max(1, min(max_concurrency, len(pending)))
+        self._request_session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=1,
+                                                                              pool_maxsize=max_concurrency))
+        limiter = AdaptiveConcurrencyLimiter(max_concurrency)
+
+        def _set(kv):
+            options = models.ModifyKeyValueOptions(correlation_request_id=modify_options.correlation_request_id)
+            key, label = utils.unescape_encode_key_and_label(kv.key, kv.label)
+            body_content = {
+                "content_type": kv.content_type,
+                "value": kv.value,
+                "tags": kv.tags
+            }
+            retries = 0
+            while True:
+                throttled_for = None
+                limiter.acquire()
+                try:
+                    self.__write_key(key, label, body_content, options, retry_throttled=False)
+                    return models.KeyValueWriteResult(kv, models.KeyValueWriteResult.SET)
+                except (exceptions.ThrottledException, exceptions.ServiceUnavailableException) as ex:
+                    if retries >= self._client_options.max_retries:
+                        return models.KeyValueWriteResult(kv, models.KeyValueWriteResult.FAILED, ex)
+                    throttled_for = ex.retry_after
+                    retries += 1
+                except Exception as ex:  # pylint: disable=broad-except
+                    return models.KeyValueWriteResult(kv, models.KeyValueWriteResult.FAILED, ex)
+                finally:
+                    limiter.release(throttled_for)
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for index, result in zip(pending, executor.map(_set, [keyvalues[i] for i in pending])):
+                results[index] = result
+        return results
+
     def update_keyvalue(self, keyvalue, modify_options=None):
         """ Updates a key-value that was retrieved from a configuration store.
         The ETag property is used to ensure that no external changes to the key-value have
@@ -263,11 +339,14 @@ class AzconfigClient(object):
 
         return self.__query_key(key, query_options)
 
-    def get_keyvalues(self, query_options=None):
+    def get_keyvalues(self, query_options=None, prefetch_pages=0):
         """Returns an iterable object which allows the caller to iterate and retrieve key-values.
+        A key filter that is a union of several filters is queried with one request per filter in parallel.
 
         :param QueryKeyValueCollectionOptions query_options:
             Parameters used to modify the set of key-values that are retrieved.
+        :param int prefetch_pages:
+            When positive, the next pages are fetched in the background, up to this many pages ahead of the caller.
 
         :return:
             An iterable of key-values if found, otherwise an empty one                                                                                                                                                                                                                                                                                                                                                                                                                                                                     .
@@ -277,13 +356,32 @@ class AzconfigClient(object):
         if query_options is None:
             query_options = models.QueryKeyValueCollectionOptions
 
-        return iterable.KeyValueIterable(self, query_options, self.__query_keys)
-
-    def read_keyvalue_revisions(self, query_options=None):
+        key_filters = utils.split_key_filter(getattr(query_options, 'key_filter', None))
+        if len(key_filters) > 1:
+            iterables = []
+            for key_filter in key_filters:
+                options = models.QueryKeyValueCollectionOptions(
+                    key_filter=key_filter,
+                    label_filter=query_options.label_filter,
+                    query_datetime=query_options.query_datetime,
+                    fields=query_options.fields,
+                    correlation_request_id=query_options.correlation_request_id)
+                iterables.append(iterable.KeyValueIterable(self, options, self.__query_keys,
+                                                           max(1, prefetch_pages)))
+            fields = query_options.fields or []
+            distinct = not fields or models.QueryFields.ALL in fields or \
+                (models.QueryFields.KEY in fields and models.QueryFields.LABEL in fields)
+            return iterable.UnionKeyValueIterable(iterables, distinct)
+
+        return iterable.KeyValueIterable(self, query_options, self.__query_keys, prefetch_pages)
+
+    def read_keyvalue_revisions(self, query_options=None, prefetch_pages=0):
         """Returns an iterable object which allows the caller to asynchronously iterate and retrieve revisions.
 
         :param QueryKeyValueCollectionOptions query_options:
             Parameters used to modify the set of revisions that are retrieved.
+        :param int prefetch_pages:
+            When positive, the next pages are fetched in the background, up to this many pages ahead of the caller.
 
         :return:
              An iterable of key-value revisions if found, otherwise an empty one
@@ -293,7 +391,7 @@ class AzconfigClient(object):
         if query_options is None:
             query_options = models.QueryKeyValueCollectionOptions
 
-        return iterable.KeyValueIterable(self, query_options, self.__list_revision)
+        return iterable.KeyValueIterable(self, query_options, self.__list_revision, prefetch_pages)
 
     def lock_keyvalue(self, keyvalue, modify_options=None):
         """Locks a key-value within a configuration store.
@@ -391,7 +489,8 @@ class AzconfigClient(object):
                     body_content,
                     modify_options,
                     if_match_etag=None,
-                    if_none_match_etag=None):
+                    if_none_match_etag=None,
+                    retry_throttled=True):
         query_url = '/kv/{}?label={}'.format(key, '' if label is None else label)
         query_url = self.__append_api_version(query_url)
 
@@ -409,7 +508,7 @@ class AzconfigClient(object):
                                                 if_none_match_etag=if_none_match_etag)
 
         response = self._request_handler.execute(request_message.RequestMessage(
-            constants.HttpMethods.Put, headers, url, json.dumps(body_content)), self._request_session)
+            constants.HttpMethods.Put, headers, url, json.dumps(body_content)), self._request_session, retry_throttled)
 
         if response.status_code == constants.StatusCodes.OK:
             return mapper.map_json_to_keyvalue(response.json())
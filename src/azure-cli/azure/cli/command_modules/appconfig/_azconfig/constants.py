@@ -74,6 +74,13 @@ class StatusCodes:
     SERVICE_UNAVAILABLE = 503
 
 
+class Paging:
+    """Constants of paged queries.
+    """
+    PageSize = 100
+    PrefetchPages = 4
+
+
 class Versions:
     """Constants of versions.
     """
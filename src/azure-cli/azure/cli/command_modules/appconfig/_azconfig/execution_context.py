@@ -6,15 +6,18 @@
 """Internal class for query execution context implementation in the Azure Configuration service.
 """
 
+import threading
 from collections import deque
 
+from six.moves import queue
+
 
 class QueryExecutionContext(object):
     """
     This is the execution context class.
     """
 
-    def __init__(self, client, options, fetch_function):
+    def __init__(self, client, options, fetch_function, prefetch_pages=0):
         """
         Constructor
 
@@ -22,6 +25,8 @@ class QueryExecutionContext(object):
         :param dict options:
             The request options for the request.
         :param method fetch_function
+        :param int prefetch_pages:
+            When positive, pages are fetched in the background, up to this many pages ahead of the caller.
         """
         self._client = client
         self._options = options
@@ -29,6 +34,29 @@ class QueryExecutionContext(object):
         self._continuation = None
         self._has_started = False
         self._buffer = deque()
+        self._prefetch_pages = prefetch_pages
+        self._prefetched = None
+        self._prefetch_done = False
+
+    def start_prefetch(self):
+        """Starts fetching pages in the background, if prefetching is enabled and has not started yet."""
+        if self._prefetch_pages > 0 and self._prefetched is None:
+            self._prefetched = queue.Queue(maxsize=self._prefetch_pages)
+            thread = threading.Thread(target=self._prefetch, args=(self._prefetched,))
+            thread.daemon = True
+            thread.start()
+
+    def _prefetch(self, prefetched):
+        # follows the continuation links, blocking while the queue is full
+        try:
+            while self._has_more_pages():
+                items = self._fetch_items(self._fetch_function)
+                if items:
+                    prefetched.put(items)
+        except Exception as ex:  # pylint: disable=broad-except
+            prefetched.put(ex)
+            return
+        prefetched.put(None)
 
     def _has_more_pages(self):
         return not self._has_started or self._continuation
@@ -43,6 +71,9 @@ class QueryExecutionContext(object):
             List of results.
         :rtype: list
         """
+        if self._prefetch_pages > 0:
+            return self._fetch_prefetched_block()
+
         if not self._has_more_pages():
             return []
 
@@ -56,6 +87,24 @@ class QueryExecutionContext(object):
         while self._has_more_pages() and not self._buffer:
             return self._fetch_items(self._fetch_function)
 
+    def _fetch_prefetched_block(self):
+        if self._buffer:
+            res = list(self._buffer)
+            self._buffer.clear()
+            return res
+        if self._prefetch_done:
+            return []
+
+        self.start_prefetch()
+        page = self._prefetched.get()
+        if isinstance(page, Exception):
+            self._prefetch_done = True
+            raise page
+        if page is None:
+            self._prefetch_done = True
+            return []
+        return page
+
     def __iter__(self):
         """Returns itself as an iterator"""
         return self
@@ -3,6 +3,8 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
+import itertools
+
 import azure.cli.command_modules.appconfig._azconfig.execution_context as execution_context
 
 # pylint: disable=too-few-public-methods
@@ -11,7 +13,7 @@ import azure.cli.command_modules.appconfig._azconfig.execution_context as execut
 class KeyValueIterable(object):
     """Represents an iterable object of the query results."""
 
-    def __init__(self, client, query_options, fetch_function):
+    def __init__(self, client, query_options, fetch_function, prefetch_pages=0):
         """
         Instantiates a KeyValueIterable for queries.
 
@@ -20,11 +22,15 @@ class KeyValueIterable(object):
         :param QueryKeyValueCollectionOptions query_options:
             The query options for the request.
         :param method fetch_function:
+        :param int prefetch_pages:
+            When positive, the next pages are fetched in the background while the current one is processed, up to
+            this many pages ahead.
         """
 
         self._client = client
         self.query_options = query_options
         self.fetch_function = fetch_function
+        self.prefetch_pages = prefetch_pages
         self._ex_context = None
 
     def __iter__(self):
@@ -37,7 +43,9 @@ class KeyValueIterable(object):
             self._iterable = iterable
             self._finished = False
             self._ex_context = execution_context.QueryExecutionContext(
-                self._iterable, self._iterable.query_options, self._iterable.fetch_function)
+                self._iterable, self._iterable.query_options, self._iterable.fetch_function,
+                self._iterable.prefetch_pages)
+            self._ex_context.start_prefetch()
 
         def __iter__(self):
             # Always returns self
@@ -65,6 +73,39 @@ class KeyValueIterable(object):
         if self._ex_context is None:
             # initiates execution context for the first time
             self._ex_context = execution_context.QueryExecutionContext(
-                self, self.query_options, self.fetch_function)
+                self, self.query_options, self.fetch_function, self.prefetch_pages)
 
         return self._ex_context.fetch_next_block()
+
+
+class UnionKeyValueIterable(object):
+    """Represents an iterable object of the results of several queries, such as one per part of a key filter.
+
+    All queries are sent in parallel when the iteration starts. Results are returned query by query, and an entry
+    already returned by a previous query is skipped.
+    """
+
+    def __init__(self, iterables, distinct=True):
+        """
+        :param list[KeyValueIterable] iterables:
+            The iterables of each query. They should prefetch pages so that the queries run in parallel.
+        :param bool distinct:
+            Whether to skip the entries with the same key and label as an entry already returned.
+        """
+        self.iterables = iterables
+        self.distinct = distinct
+
+    def __iter__(self):
+        # creating the iterators starts fetching every query
+        results = itertools.chain.from_iterable([iter(i) for i in self.iterables])
+        if not self.distinct:
+            return results
+        return self._distinct(results)
+
+    @staticmethod
+    def _distinct(results):
+        seen = set()
+        for kv in results:
+            if (kv.key, kv.label) not in seen:
+                seen.add((kv.key, kv.label))
+                yield kv
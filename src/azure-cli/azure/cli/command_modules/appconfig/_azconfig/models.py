@@ -156,6 +156,28 @@ class ModifyKeyValueOptions(object):
             uuid.uuid4()) if correlation_request_id is None else correlation_request_id
 
 
+class KeyValueWriteResult(object):
+    '''
+    Result of writing a key-value in a bulk operation
+
+    :ivar KeyValue keyvalue:
+        The key-value to write.
+    :ivar str status:
+        One of SET, UNCHANGED or FAILED.
+    :ivar Exception error:
+        The error of a failed write.
+    '''
+
+    SET = 'set'
+    UNCHANGED = 'unchanged'
+    FAILED = 'failed'
+
+    def __init__(self, keyvalue, status, error=None):
+        self.keyvalue = keyvalue
+        self.status = status
+        self.error = error
+
+
 class ClientOptions(object):
     '''
     Options for customizing Azconfig client
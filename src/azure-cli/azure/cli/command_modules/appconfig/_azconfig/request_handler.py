@@ -18,7 +18,7 @@ class RequestHandler(object):
         self.connection_string = connection_string
         self.request_options = request_options
 
-    def execute(self, request, request_sessions):
+    def execute(self, request, request_sessions, retry_throttled=True):
         """Exectutes the request with passed parameters applying request options
 
         :param _RequestObject request:
@@ -27,6 +27,8 @@ class RequestHandler(object):
             Request sessions instance
         :param ClientOptions request_options:
             Instance of ClientOptions class specifying the retry policies
+        :param bool retry_throttled:
+            Whether to wait and retry throttled requests, otherwise the throttling exception is raised right away
 
         """
 
@@ -53,7 +55,7 @@ class RequestHandler(object):
 
                 end = time.time()
                 total_wait_time += end - start + retry_after_ms
-                if current_retry > max_retries or total_wait_time > max_retry_wait_time:
+                if not retry_throttled or current_retry > max_retries or total_wait_time > max_retry_wait_time:
                     if response.status_code == constants.StatusCodes.TOO_MANY_REQUESTS:
                         raise exceptions.ThrottledException(
                             response.reason, retry_after_ms)
@@ -151,5 +151,14 @@ def __unescape_encode_keyword(string):
     return string
 
 
+def split_key_filter(key_filter):
+    """Splits a key filter on the commas that are not escaped, which separate the filters of a union."""
+    if not key_filter or ',' not in key_filter:
+        return [key_filter]
+    import re
+    parts = [part for part in re.split(r'(?<!\\),', key_filter) if part]
+    return parts or [key_filter]
+
+
 def unescape_encode_key_and_label(key=None, label=None):
     return __unescape_encode_keyword(key), __unescape_encode_keyword(label)
@@ -19,6 +19,7 @@ from knack.util import CLIError
 from ._utils import resolve_connection_string, user_confirmation
 from ._azconfig.azconfig_client import AzconfigClient
 from ._azconfig.models import (KeyValue,
+                               KeyValueWriteResult,
                                ModifyKeyValueOptions,
                                QueryKeyValueCollectionOptions)
 from._featuremodels import (map_keyvalue_to_featureflag,
@@ -28,6 +29,9 @@ from._featuremodels import (map_keyvalue_to_featureflag,
 logger = get_logger(__name__)
 FEATURE_FLAG_PREFIX = ".appconfig.featureflag/"
 FEATURE_FLAG_CONTENT_TYPE = "application/vnd.microsoft.appconfig.ff+json;charset=utf-8"
+# Listing the store to skip unchanged key-values pays off once more key-values are written than fit in a page
+CONFIG_STORE_PAGE_SIZE = 100
+MAX_REPORTED_FAILURES = 20
 
 
 def __compare_kvs_for_restore(restore_kvs, current_kvs):
@@ -162,7 +166,9 @@ def __read_kv_from_config_store(cmd, name=None, connection_string=None, key=None
     return key_values
 
 
-def __write_kv_and_features_to_config_store(cmd, key_values, features=None, name=None, connection_string=None, label=None):
+def __write_kv_and_features_to_config_store(cmd, key_values, features=None, name=None, connection_string=None, label=None, current_key_values=None):
+    # current_key_values is a snapshot of the target store under the label, used to skip unchanged key-values
+    from azure.cli.core.commands import DEFAULT_MAX_CONCURRENT_IDS
     if not key_values and not features:
         return
     try:
@@ -175,10 +181,24 @@ def __write_kv_and_features_to_config_store(cmd, key_values, features=None, name
 
         for kv in key_values:
             kv.label = label
-            azconfig_client.set_keyvalue(kv, ModifyKeyValueOptions())
+        if current_key_values is None and len(key_values) > CONFIG_STORE_PAGE_SIZE:
+            current_key_values = __read_kv_from_config_store(cmd, connection_string=connection_string, label=label)
+        max_concurrency = cmd.cli_ctx.config.getint('core', 'max_concurrent_ids', fallback=DEFAULT_MAX_CONCURRENT_IDS)
+        results = azconfig_client.set_keyvalues(key_values, ModifyKeyValueOptions(),
+                                                current_keyvalues=current_key_values, max_concurrency=max_concurrency)
     except Exception as exception:
         raise CLIError(str(exception))
 
+    unchanged = sum(1 for r in results if r.status == KeyValueWriteResult.UNCHANGED)
+    if unchanged:
+        logger.warning("Skipped %d unchanged key-values.", unchanged)
+    failed = [r for r in results if r.status == KeyValueWriteResult.FAILED]
+    if failed:
+        errors = ['{}: {}'.format(r.keyvalue.key, r.error) for r in failed[:MAX_REPORTED_FAILURES]]
+        if len(failed) > MAX_REPORTED_FAILURES:
+            errors.append('...')
+        raise CLIError('Failed to set {} of {} key-values.\n{}'.format(len(failed), len(results), '\n'.join(errors)))
+
 
 def __is_feature_flag(kv):
     if kv and kv.key and kv.content_type:
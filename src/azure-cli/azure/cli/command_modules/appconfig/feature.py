@@ -15,7 +15,7 @@ from knack.util import CLIError
 
 from ._utils import resolve_connection_string, user_confirmation
 from ._azconfig.azconfig_client import AzconfigClient
-from ._azconfig.constants import StatusCodes
+from ._azconfig.constants import Paging, StatusCodes
 from ._azconfig.exceptions import HTTPException
 from ._azconfig.models import (KeyValue,
                                ModifyKeyValueOptions,
@@ -896,7 +896,7 @@ def __list_all_keyvalues(azconfig_client,
         label_filter=QueryKeyValueCollectionOptions.empty_label if label is not None and not label else label,
         fields=None)
     try:
-        retrieved_kv = azconfig_client.get_keyvalues(query_option)
+        retrieved_kv = azconfig_client.get_keyvalues(query_option, prefetch_pages=Paging.PrefetchPages)
         if key != feature:
             valid_features = []
             for kv in retrieved_kv:
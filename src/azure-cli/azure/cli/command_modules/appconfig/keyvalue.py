@@ -14,7 +14,7 @@ from knack.util import CLIError
 
 from ._utils import resolve_connection_string, user_confirmation
 from ._azconfig.azconfig_client import AzconfigClient
-from ._azconfig.constants import StatusCodes
+from ._azconfig.constants import Paging, StatusCodes
 from ._azconfig.exceptions import HTTPException
 from ._azconfig.models import (KeyValue,
                                ModifyKeyValueOptions,
@@ -118,9 +118,10 @@ def import_config(cmd,
     # append all feature flags to src_kvs list
     src_kvs.extend(src_features)
 
-    # import into configstore
+    # import into configstore, skipping the key-values unchanged from the preview
     __write_kv_and_features_to_config_store(
-        cmd, key_values=src_kvs, name=name, connection_string=connection_string, label=label)
+        cmd, key_values=src_kvs, name=name, connection_string=connection_string, label=label,
+        current_key_values=None if yes else dest_kvs + dest_features)
 
 
 def export_config(cmd,
@@ -419,15 +420,17 @@ def list_key(cmd,
                                                   query_datetime=datetime,
                                                   fields=fields)
     try:
-        keyvalue_iterable = azconfig_client.get_keyvalues(query_option)
-        retrieved_kvs = []
-        count = 0
-
         if all_:
             top = float('inf')
         elif top is None:
             top = 100
 
+        # read ahead when more than a page is needed
+        keyvalue_iterable = azconfig_client.get_keyvalues(
+            query_option, prefetch_pages=Paging.PrefetchPages if top > Paging.PageSize else 0)
+        retrieved_kvs = []
+        count = 0
+
         for kv in keyvalue_iterable:
             if fields:
                 partial_kv = {}
@@ -466,8 +469,10 @@ def restore_key(cmd,
                                                       label_filter=label)
 
     try:
-        restore_keyvalues = azconfig_client.get_keyvalues(query_option_then)
-        current_keyvalues = azconfig_client.get_keyvalues(query_option_now)
+        # both listings are fetched in parallel
+        restore_keyvalues = iter(azconfig_client.get_keyvalues(query_option_then, prefetch_pages=Paging.PrefetchPages))
+        current_keyvalues = iter(azconfig_client.get_keyvalues(query_option_now, prefetch_pages=Paging.PrefetchPages))
+        restore_keyvalues, current_keyvalues = list(restore_keyvalues), list(current_keyvalues)
         kvs_to_restore, kvs_to_modify, kvs_to_delete = __compare_kvs_for_restore(restore_keyvalues, current_keyvalues)
 
         if not yes:
@@ -518,16 +523,16 @@ def list_revision(cmd,
                                                   query_datetime=datetime,
                                                   fields=fields)
     try:
-        revisions_iterable = azconfig_client.read_keyvalue_revisions(
-            query_option)
-        retrieved_revisions = []
-        count = 0
-
         if all_:
             top = float('inf')
         elif top is None:
             top = 100
 
+        revisions_iterable = azconfig_client.read_keyvalue_revisions(
+            query_option, prefetch_pages=Paging.PrefetchPages if top > Paging.PageSize else 0)
+        retrieved_revisions = []
+        count = 0
+
         for revision in revisions_iterable:
             if fields:
                 partial_revision = {}
@@ -0,0 +1,120 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import json
+import threading
+import unittest
+
+import mock
+
+from azure.cli.command_modules.appconfig._azconfig.azconfig_client import AzconfigClient
+from azure.cli.command_modules.appconfig._azconfig.models import (
+    KeyValue, KeyValueWriteResult, QueryKeyValueCollectionOptions)
+from azure.cli.command_modules.appconfig._azconfig.utils import split_key_filter
+
+CONNECTION_STRING = 'Endpoint=https://contoso.azconfig.io;Id=id;Secret=c2VjcmV0'
+
+
+class _FakeStore(object):
+    def __init__(self, throttle=0, fail=None):
+        self.throttle = throttle
+        self.fail = fail or set()
+        self.written = []
+        self.lock = threading.Lock()
+
+    def request(self, method, url, headers=None, data=None):
+        body = json.loads(data)
+        key = url.split('/kv/')[1].split('?')[0]
+        with self.lock:
+            if self.throttle:
+                self.throttle -= 1
+                return mock.MagicMock(status_code=429, reason='Too Many Requests', headers={'retry-after-ms': '1'})
+        if key in self.fail:
+            return mock.MagicMock(status_code=409, reason='Conflict', headers={}, content=b'')
+        with self.lock:
+            self.written.append(key)
+        response = mock.MagicMock(status_code=200, headers={})
+        response.json.return_value = dict(body, key=key, label=None, etag='etag', locked=False, last_modified=None)
+        return response
+
+
+class TestAzconfigClientBulkWrite(unittest.TestCase):
+
+    def _set_keyvalues(self, store, keyvalues, current_keyvalues=None):
+        client = AzconfigClient(CONNECTION_STRING)
+        client._request_session.request = store.request  # pylint: disable=protected-access
+        return client.set_keyvalues(keyvalues, current_keyvalues=current_keyvalues, max_concurrency=4)
+
+    def test_unchanged_keyvalues_are_skipped(self):
+        store = _FakeStore()
+        keyvalues = [KeyValue('a', 'value'), KeyValue('b', 'new', tags={'t': '1'}), KeyValue('c', 'value'),
+                     KeyValue('c', 'latest')]
+        current = [KeyValue('a', 'value', tags={}), KeyValue('b', 'old', tags={'t': '1'})]
+        results = self._set_keyvalues(store, keyvalues, current)
+        self.assertEqual([r.status for r in results], [KeyValueWriteResult.UNCHANGED, KeyValueWriteResult.SET,
+                                                       KeyValueWriteResult.UNCHANGED, KeyValueWriteResult.SET])
+        self.assertEqual(sorted(store.written), ['b', 'c'])
+
+    def test_throttled_writes_are_retried(self):
+        store = _FakeStore(throttle=3, fail={'k3'})
+        keyvalues = [KeyValue('k{}'.format(i), 'value') for i in range(10)]
+        results = self._set_keyvalues(store, keyvalues)
+        self.assertEqual(sorted(store.written), sorted('k{}'.format(i) for i in range(10) if i != 3))
+        self.assertEqual(results[3].status, KeyValueWriteResult.FAILED)
+        self.assertIn('409', str(results[3].error))
+        self.assertTrue(all(r.status == KeyValueWriteResult.SET for i, r in enumerate(results) if i != 3))
+
+
+class _FakePagedStore(object):
+    def __init__(self, keys, page_size=2):
+        self.keys = keys
+        self.page_size = page_size
+        self.urls = []
+
+    def request(self, method, url, headers=None, data=None):
+        from six.moves.urllib.parse import urlparse, parse_qs
+        self.urls.append(url)
+        query = parse_qs(urlparse(url).query)
+        prefix = query['key'][0].rstrip('*')
+        after = int(query.get('after', ['0'])[0])
+        matches = [k for k in self.keys if k.startswith(prefix)]
+        page = matches[after:after + self.page_size]
+        response = mock.MagicMock(status_code=200, headers={})
+        if after + self.page_size < len(matches):
+            link = '</kv?key={}&after={}>; rel="next"'
+            response.headers['link'] = link.format(query['key'][0], after + self.page_size)
+        response.json.return_value = {'items': [{'key': k, 'label': None, 'value': k} for k in page]}
+        return response
+
+
+class TestAzconfigClientPagedQueries(unittest.TestCase):
+
+    def _get_keyvalues(self, store, key_filter, prefetch_pages):
+        client = AzconfigClient(CONNECTION_STRING)
+        client._request_session.request = store.request  # pylint: disable=protected-access
+        query_options = QueryKeyValueCollectionOptions(key_filter=key_filter)
+        return [kv.key for kv in client.get_keyvalues(query_options, prefetch_pages=prefetch_pages)]
+
+    def test_split_key_filter(self):
+        self.assertEqual(split_key_filter('a*,b*'), ['a*', 'b*'])
+        self.assertEqual(split_key_filter('a\\,b*'), ['a\\,b*'])
+        self.assertEqual(split_key_filter('a*'), ['a*'])
+        self.assertEqual(split_key_filter(None), [None])
+
+    def test_pages_are_prefetched(self):
+        keys = ['k{}'.format(i) for i in range(7)]
+        for prefetch_pages in (0, 1, 3):
+            store = _FakePagedStore(keys)
+            self.assertEqual(self._get_keyvalues(store, 'k*', prefetch_pages), keys)
+            self.assertEqual(len(store.urls), 4)
+
+    def test_union_of_key_filters(self):
+        store = _FakePagedStore(['a1', 'a2', 'ab1', 'b1', 'c1'])
+        self.assertEqual(self._get_keyvalues(store, 'b*,a*,ab*', 0), ['b1', 'a1', 'a2', 'ab1'])
+        self.assertEqual(len(store.urls), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,6 +19,10 @@ PYTHON_VERSIONS = ['3.7', '3.6', '2.7']
 NETCORE_VERSIONS = ['1.0', '1.1', '2.1', '2.2']
 DOTNET_VERSIONS = ['3.5', '4.7']
 LINUX_SKU_DEFAULT = "P1V2"
+ZIP_DEPLOY_MAX_ATTEMPTS = 3
+# Archives of the last deployments kept by 'az webapp up', per source directory
+WEBAPP_UP_ZIP_CACHE_SIZE = 5
+WEBAPP_UP_ZIP_CACHE_MAX_AGE = 30 * 24 * 3600  # seconds
 RUNTIME_TO_DEFAULT_VERSION = {
     'node': '8',
     'dotnet': '2',
@@ -13,7 +13,8 @@ from azure.mgmt.web.models import SkuDescription
 from ._constants import (NETCORE_VERSION_DEFAULT, NETCORE_VERSIONS, NODE_VERSION_DEFAULT,
                          NODE_VERSIONS, NETCORE_RUNTIME_NAME, NODE_RUNTIME_NAME, DOTNET_RUNTIME_NAME,
                          DOTNET_VERSION_DEFAULT, DOTNET_VERSIONS, STATIC_RUNTIME_NAME,
-                         PYTHON_RUNTIME_NAME, PYTHON_VERSION_DEFAULT, LINUX_SKU_DEFAULT, OS_DEFAULT)
+                         PYTHON_RUNTIME_NAME, PYTHON_VERSION_DEFAULT, LINUX_SKU_DEFAULT, OS_DEFAULT,
+                         WEBAPP_UP_ZIP_CACHE_SIZE, WEBAPP_UP_ZIP_CACHE_MAX_AGE)
 
 logger = get_logger(__name__)
 
@@ -28,12 +29,93 @@ def web_client_factory(cli_ctx, **_):
     return get_mgmt_service_client(cli_ctx, WebSiteManagementClient)
 
 
-def zip_contents_from_dir(dirPath, lang):
+def zip_contents_from_dir(dirPath, lang, previous_zip_file_path=None):
     relroot = os.path.abspath(os.path.join(dirPath, os.pardir))
     path_and_file = os.path.splitdrive(dirPath)[1]
     file_val = os.path.split(path_and_file)[1]
     zip_file_path = relroot + os.path.sep + file_val + ".zip"
+    tmp_zip_file_path = zip_file_path + ".tmp"
+    # entries of the archive of a previous run are copied over as-is when the file content is unchanged
+    previous_zip_file_path = previous_zip_file_path or zip_file_path
+    previous_zf = None
+    if os.path.isfile(previous_zip_file_path):
+        try:
+            previous_zf = zipfile.ZipFile(previous_zip_file_path, "r")
+        except (zipfile.BadZipfile, IOError):
+            logger.info("Ignoring unreadable archive %s", previous_zip_file_path)
+    try:
+        try:
+            reused = _write_zip_from_dir(dirPath, lang, tmp_zip_file_path, previous_zf)
+        except zipfile.BadZipfile:
+            if previous_zf is None:
+                raise
+            logger.info("Ignoring corrupted archive %s", previous_zip_file_path)
+            reused = _write_zip_from_dir(dirPath, lang, tmp_zip_file_path, None)
+    except Exception:
+        if os.path.isfile(tmp_zip_file_path):
+            os.remove(tmp_zip_file_path)
+        raise
+    finally:
+        if previous_zf is not None:
+            previous_zf.close()
+    if reused:
+        logger.info("Reused %d unchanged entries of %s", reused, previous_zip_file_path)
+    _replace_file(tmp_zip_file_path, zip_file_path)
+    return zip_file_path
+
+
+def get_zip_cache_path(cli_ctx, dirPath):
+    """ Path in the config directory where the archive of the last deployment of a source directory is kept. """
+    import hashlib
+    cache_dir = os.path.join(cli_ctx.config.config_dir, 'webapp_up')
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+    key = hashlib.sha256(os.path.abspath(dirPath).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, key + ".zip")
+
+
+def cache_deployed_zip(zip_file_path, cached_zip_file_path):
+    """
+    Keep the deployed archive, so that the next deployment of the directory can reuse its unchanged entries. Only the
+    archives of the most recently deployed directories are kept.
+    """
+    try:
+        _replace_file(zip_file_path, cached_zip_file_path)
+    except OSError as ex:
+        logger.info("Failed to keep archive %s: %s", zip_file_path, ex)
+        try:
+            os.remove(zip_file_path)
+        except OSError:
+            pass
+    _prune_zip_cache(os.path.dirname(cached_zip_file_path))
+
+
+def _prune_zip_cache(cache_dir):
+    import time
+    archives = []
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if name.endswith('.zip') and os.path.isfile(path):
+            archives.append((os.path.getmtime(path), path))
+    archives.sort(reverse=True)
+    now = time.time()
+    for index, (mtime, path) in enumerate(archives):
+        if index >= WEBAPP_UP_ZIP_CACHE_SIZE or now - mtime > WEBAPP_UP_ZIP_CACHE_MAX_AGE:
+            try:
+                os.remove(path)
+            except OSError as ex:
+                logger.info("Failed to remove archive %s: %s", path, ex)
+
+
+def _replace_file(src, dst):
+    if os.path.isfile(dst):
+        os.remove(dst)
+    os.rename(src, dst)
+
+
+def _write_zip_from_dir(dirPath, lang, zip_file_path, previous_zf=None):
     abs_src = os.path.abspath(dirPath)
+    reused = 0
     with zipfile.ZipFile("{}".format(zip_file_path), "w", zipfile.ZIP_DEFLATED) as zf:
         for dirname, subdirs, files in os.walk(dirPath):
             # skip node_modules folder for Node apps,
@@ -47,8 +129,66 @@ def zip_contents_from_dir(dirPath, lang):
             for filename in files:
                 absname = os.path.abspath(os.path.join(dirname, filename))
                 arcname = absname[len(abs_src) + 1:]
-                zf.write(absname, arcname)
-    return zip_file_path
+                if previous_zf is not None and _reuse_zip_entry(previous_zf, zf, absname, arcname):
+                    reused += 1
+                else:
+                    zf.write(absname, arcname)
+    return reused
+
+
+def _file_crc32(path):
+    import zlib
+    crc = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            crc = zlib.crc32(chunk, crc)
+    return crc & 0xffffffff
+
+
+def _reuse_zip_entry(src_zf, dst_zf, absname, arcname):
+    """ Copy the compressed entry `arcname` of `src_zf` into `dst_zf` without recompressing it, if its
+    size and CRC-32 match the file at `absname`. Returns False when the entry can't be reused. """
+    import struct
+    try:
+        info = src_zf.getinfo(arcname.replace(os.sep, '/'))
+    except KeyError:
+        return False
+    st = os.stat(absname)
+    if (info.file_size != st.st_size or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED) or
+            max(info.file_size, info.compress_size) >= zipfile.ZIP64_LIMIT or info.flag_bits & 0x1 or
+            info.CRC != _file_crc32(absname)):
+        return False
+
+    # skip the local file header of the entry in the source archive
+    src_zf.fp.seek(info.header_offset)
+    header = src_zf.fp.read(zipfile.sizeFileHeader)
+    if header[0:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipfile("Bad header of entry {} in previous archive".format(info.filename))
+    name_length, extra_length = struct.unpack('<HH', header[26:30])
+    src_zf.fp.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+
+    import time
+    new_info = zipfile.ZipInfo(info.filename, time.localtime(st.st_mtime)[0:6])
+    new_info.external_attr = (st.st_mode & 0xFFFF) << 16
+    new_info.compress_type = info.compress_type
+    new_info.file_size = info.file_size
+    new_info.compress_size = info.compress_size
+    new_info.CRC = info.CRC
+    new_info.flag_bits = info.flag_bits & 0x800  # the sizes and CRC go in the header, not a data descriptor
+    new_info.header_offset = dst_zf.fp.tell()
+    dst_zf.fp.write(new_info.FileHeader())
+    remaining = info.compress_size
+    while remaining:
+        chunk = src_zf.fp.read(min(remaining, 1024 * 1024))
+        if not chunk:
+            raise zipfile.BadZipfile("Truncated entry {} in previous archive".format(info.filename))
+        dst_zf.fp.write(chunk)
+        remaining -= len(chunk)
+    dst_zf.filelist.append(new_info)
+    dst_zf.NameToInfo[new_info.filename] = new_info
+    dst_zf.start_dir = dst_zf.fp.tell()
+    dst_zf._didModify = True  # pylint: disable=protected-access
+    return True
 
 
 def get_runtime_version_details(file_path, lang_name):
@@ -64,9 +64,9 @@ from .utils import _normalize_sku, get_sku_name
 from ._create_util import (zip_contents_from_dir, get_runtime_version_details, create_resource_group, get_app_details,
                            should_create_new_rg, set_location, does_app_already_exist, get_profile_username,
                            get_plan_to_use, get_lang_from_content, get_rg_to_use, get_sku_to_use,
-                           detect_os_form_src)
+                           detect_os_form_src, get_zip_cache_path, cache_deployed_zip)
 from ._constants import (RUNTIME_TO_DEFAULT_VERSION, NODE_VERSION_DEFAULT_FUNCTIONAPP,
-                         RUNTIME_TO_IMAGE_FUNCTIONAPP, NODE_VERSION_DEFAULT)
+                         RUNTIME_TO_IMAGE_FUNCTIONAPP, NODE_VERSION_DEFAULT, ZIP_DEPLOY_MAX_ATTEMPTS)
 
 logger = get_logger(__name__)
 
@@ -364,11 +364,25 @@ def enable_zip_deploy(cmd, resource_group_name, name, src, timeout=None, slot=No
     import requests
     import os
     from azure.cli.core.util import should_disable_connection_verify
-    # Read file content
+    # Stream the file content, so that large packages are not held in memory
     with open(os.path.realpath(os.path.expanduser(src)), 'rb') as fs:
-        zip_content = fs.read()
         logger.warning("Starting zip deployment. This operation can take a while to complete ...")
-        res = requests.post(zip_url, data=zip_content, headers=headers, verify=not should_disable_connection_verify())
+        upload = _ZipDeployUpload(cmd.cli_ctx, fs)
+        retry_delay = 2  # seconds
+        for attempt in range(ZIP_DEPLOY_MAX_ATTEMPTS):
+            upload.rewind()
+            try:
+                res = requests.post(zip_url, data=upload, headers=headers,
+                                    verify=not should_disable_connection_verify())
+                break
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as ex:
+                if attempt + 1 == ZIP_DEPLOY_MAX_ATTEMPTS:
+                    raise CLIError("Failed to upload {} after {} attempts: {}".format(src, attempt + 1, ex))
+                logger.warning("Upload of %s was interrupted (%s), retrying in %d seconds ...", src, ex, retry_delay)
+                time.sleep(retry_delay)
+                retry_delay *= 2
+            finally:
+                upload.done()
         logger.warning("Deployment endpoint responded with status code %d", res.status_code)
 
     # check if there's an ongoing process
@@ -383,6 +397,39 @@ def enable_zip_deploy(cmd, resource_group_name, name, src, timeout=None, slot=No
     return response
 
 
+class _ZipDeployUpload(object):
+    """ Read-only view of an open package file that reports upload progress as requests reads it in chunks. """
+
+    def __init__(self, cli_ctx, stream):
+        self._progress = cli_ctx.get_progress_controller(det=True)
+        self._stream = stream
+        self._stream.seek(0, 2)
+        self._total = self._stream.tell()
+        self._current = 0
+        self._reported = -1
+
+    def __len__(self):
+        return self._total
+
+    def rewind(self):
+        # The zipdeploy endpoint has no range support, so an interrupted upload starts over from the file
+        self._stream.seek(0)
+        self._current = 0
+        self._reported = -1
+
+    def read(self, size=-1):
+        chunk = self._stream.read(size)
+        self._current += len(chunk)
+        permille = 1000 * self._current // self._total if self._total else 1000
+        if permille != self._reported:
+            self._reported = permille
+            self._progress.add(message='Uploading', value=self._current, total_val=self._total)
+        return chunk
+
+    def done(self):
+        self._progress.end()
+
+
 def add_remote_build_app_settings(cmd, resource_group_name, name, slot):
     settings = get_app_settings(cmd, resource_group_name, name, slot)
     enable_oryx_build = None
@@ -3077,13 +3124,11 @@ def webapp_up(cmd, name, resource_group_name=None, plan=None, location=None, sku
     # Zip contents & Deploy
     logger.warning("Creating zip with contents of dir %s ...", src_dir)
     # zip contents & deploy
-    zip_file_path = zip_contents_from_dir(src_dir, language)
+    cached_zip_file_path = get_zip_cache_path(cmd.cli_ctx, src_dir)
+    zip_file_path = zip_contents_from_dir(src_dir, language, cached_zip_file_path)
     enable_zip_deploy(cmd, rg_name, name, zip_file_path)
-    # Remove the file after deployment, handling exception if user removed the file manually
-    try:
-        os.remove(zip_file_path)
-    except OSError:
-        pass
+    # Move the file out of the source dir after deployment, its unchanged entries are reused by the next deployment
+    cache_deployed_zip(zip_file_path, cached_zip_file_path)
 
     if launch_browser:
         logger.warning("Launching app using default browser")
@@ -2,7 +2,11 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
 import unittest
+import zipfile
 import mock
 
 from msrestazure.azure_exceptions import CloudError
@@ -30,7 +34,10 @@ from azure.cli.command_modules.appservice.custom import (set_deployment_user,
                                                          validate_container_app_create_options,
                                                          restore_deleted_webapp,
                                                          list_snapshots,
-                                                         restore_snapshot)
+                                                         restore_snapshot,
+                                                         enable_zip_deploy)
+from azure.cli.command_modules.appservice._create_util import (zip_contents_from_dir, get_zip_cache_path,
+                                                               cache_deployed_zip)
 
 # pylint: disable=line-too-long
 from vsts_cd_manager.continuous_delivery_manager import ContinuousDeliveryResult
@@ -381,6 +388,111 @@ class TestWebappMocked(unittest.TestCase):
         self.assertFalse(validate_container_app_create_options(None, None, test_multi_container_config, None))
         self.assertFalse(validate_container_app_create_options(None, None, None, None))
 
+    @mock.patch('azure.cli.command_modules.appservice.custom._check_zip_deployment_status', autospec=True)
+    @mock.patch('azure.cli.command_modules.appservice.custom._get_scm_url', return_value='https://scm')
+    @mock.patch('azure.cli.command_modules.appservice.custom._get_site_credential', return_value=('usr', 'pwd'))
+    @mock.patch('time.sleep')
+    def test_enable_zip_deploy_streams_and_retries(self, *_):
+        import requests
+        cmd_mock = mock.MagicMock()
+        uploads = []
+
+        def _post(url, data=None, **kwargs):
+            self.assertEqual(len(data), 5000)
+            chunk = data.read(3000)
+            uploads.append(chunk + data.read(3000))
+            if len(uploads) == 1:
+                raise requests.exceptions.ConnectionError('connection reset')
+            return FakedResponse(202)
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        src = os.path.join(temp_dir, 'app.zip')
+        with open(src, 'wb') as f:
+            f.write(b'1' * 5000)
+        with mock.patch('requests.post', side_effect=_post):
+            enable_zip_deploy(cmd_mock, 'rg', 'web1', src)
+        self.assertEqual(uploads, [b'1' * 5000, b'1' * 5000])
+
+        with mock.patch('requests.post', side_effect=requests.exceptions.ConnectionError('connection reset')):
+            with self.assertRaises(CLIError):
+                enable_zip_deploy(cmd_mock, 'rg', 'web1', src)
+
+
+class TestZipContentsFromDir(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.src_dir = os.path.join(self.temp_dir, 'app')
+        os.makedirs(os.path.join(self.src_dir, 'static'))
+        self._write('app.py', 'print("hello")' * 100)
+        self._write(os.path.join('static', 'site.css'), 'body {}' * 100)
+
+    def _write(self, name, content):
+        with open(os.path.join(self.src_dir, name), 'w') as f:
+            f.write(content)
+
+    def _read_zip(self, zip_file_path):
+        with zipfile.ZipFile(zip_file_path) as zf:
+            self.assertIsNone(zf.testzip())
+            return {i.filename: zf.read(i).decode() for i in zf.infolist()}
+
+    def test_unchanged_entries_are_reused(self):
+        zip_file_path = zip_contents_from_dir(self.src_dir, 'python')
+        self.assertEqual(zip_file_path, os.path.join(self.temp_dir, 'app.zip'))
+        first = self._read_zip(zip_file_path)
+
+        self._write('app.py', 'print("changed")')
+        self._write('new.txt', 'new')
+        with mock.patch('zipfile.ZipFile.write', autospec=True, side_effect=zipfile.ZipFile.write) as write_mock:
+            zip_contents_from_dir(self.src_dir, 'python')
+        self.assertEqual(sorted(c[0][2] for c in write_mock.call_args_list), ['app.py', 'new.txt'])
+        second = self._read_zip(zip_file_path)
+        self.assertEqual(second['static/site.css'], first['static/site.css'])
+        self.assertEqual(second['app.py'], 'print("changed")')
+        self.assertEqual(sorted(second), ['app.py', 'new.txt', 'static/site.css'])
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ['app', 'app.zip'])
+
+    def test_deployed_archive_is_reused_from_cache(self):
+        cli_ctx = mock.MagicMock()
+        cli_ctx.config.config_dir = os.path.join(self.temp_dir, 'config')
+        cached_zip_file_path = get_zip_cache_path(cli_ctx, self.src_dir)
+        self.assertEqual(os.path.dirname(cached_zip_file_path), os.path.join(self.temp_dir, 'config', 'webapp_up'))
+
+        zip_file_path = zip_contents_from_dir(self.src_dir, 'python', cached_zip_file_path)
+        cache_deployed_zip(zip_file_path, cached_zip_file_path)
+        self.assertFalse(os.path.exists(zip_file_path))
+
+        self._write('app.py', 'print("changed")')
+        with mock.patch('zipfile.ZipFile.write', autospec=True, side_effect=zipfile.ZipFile.write) as write_mock:
+            zip_file_path = zip_contents_from_dir(self.src_dir, 'python', cached_zip_file_path)
+        self.assertEqual([c[0][2] for c in write_mock.call_args_list], ['app.py'])
+        self.assertEqual(sorted(self._read_zip(zip_file_path)), ['app.py', 'static/site.css'])
+        cache_deployed_zip(zip_file_path, cached_zip_file_path)
+        self.assertEqual(self._read_zip(cached_zip_file_path)['app.py'], 'print("changed")')
+
+    def test_deployed_archive_cache_is_bounded(self):
+        import time
+        cache_dir = os.path.join(self.temp_dir, 'config', 'webapp_up')
+        os.makedirs(cache_dir)
+        now = time.time()
+        # 0.zip was deployed an hour ago, 5.zip six hours ago and old.zip over 30 days ago
+        for name, age in [('{}.zip'.format(i), (i + 1) * 3600) for i in range(6)] + [('old.zip', 31 * 24 * 3600)]:
+            with open(os.path.join(cache_dir, name), 'w') as f:
+                f.write('archive')
+            os.utime(os.path.join(cache_dir, name), (now - age, now - age))
+
+        zip_file_path = zip_contents_from_dir(self.src_dir, 'python')
+        cache_deployed_zip(zip_file_path, os.path.join(cache_dir, 'new.zip'))
+        self.assertEqual(sorted(os.listdir(cache_dir)), ['0.zip', '1.zip', '2.zip', '3.zip', 'new.zip'])
+
+    def test_corrupted_previous_archive_is_ignored(self):
+        zip_file_path = os.path.join(self.temp_dir, 'app.zip')
+        with open(zip_file_path, 'w') as f:
+            f.write('not a zip')
+        zip_contents_from_dir(self.src_dir, 'python')
+        self.assertEqual(sorted(self._read_zip(zip_file_path)), ['app.py', 'static/site.css'])
+
 
 class FakedResponse(object):  # pylint: disable=too-few-public-methods
     def __init__(self, status_code):
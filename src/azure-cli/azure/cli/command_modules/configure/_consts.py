@@ -9,6 +9,7 @@ OUTPUT_LIST = [
     {'name': 'json', 'desc': 'JSON formatted output that most closely matches API responses.'},
     {'name': 'jsonc',
      'desc': 'Colored JSON formatted output that most closely matches API responses.'},
+    {'name': 'jsonl', 'desc': 'One JSON document per line. List results are written as they are received.'},
     {'name': 'table', 'desc': 'Human-readable output format.'},
     {'name': 'tsv', 'desc': 'Tab- and Newline-delimited. Great for GREP, AWK, etc.'},
     {'name': 'yaml', 'desc': 'YAML formatted output. An alternative to JSON. Great for configuration files.'},
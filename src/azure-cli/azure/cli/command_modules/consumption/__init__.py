@@ -5,8 +5,6 @@
 
 from azure.cli.core import AzCommandsLoader
 
-import azure.cli.command_modules.consumption._help  # pylint: disable=unused-import
-
 
 class ConsumptionCommandsLoader(AzCommandsLoader):
     def __init__(self, cli_ctx=None):
@@ -7,8 +7,6 @@ from knack.events import EVENT_INVOKER_PRE_PARSE_ARGS
 
 from azure.cli.core import AzCommandsLoader
 
-from azure.cli.command_modules.cosmosdb._help import helps  # pylint: disable=unused-import
-
 
 def _documentdb_deprecate(_, args):
     if args[0] == 'documentdb':
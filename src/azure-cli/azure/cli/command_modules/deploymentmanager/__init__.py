@@ -5,8 +5,6 @@
 
 from azure.cli.core import AzCommandsLoader
 
-import azure.cli.command_modules.deploymentmanager._help  # pylint: disable=unused-import
-
 
 class DeploymentManagerCommandsLoader(AzCommandsLoader):
 
@@ -6,8 +6,6 @@
 
 from azure.cli.core import AzCommandsLoader
 
-from azure.cli.command_modules.dla._help import helps  # pylint: disable=unused-import
-
 
 class DataLakeAnalyticsCommandsLoader(AzCommandsLoader):
 
@@ -8,8 +8,6 @@
 from azure.cli.core import AzCommandsLoader
 from azure.cli.core.profiles import ResourceType
 
-import azure.cli.command_modules.network._help  # pylint: disable=unused-import
-
 
 class NetworkCommandsLoader(AzCommandsLoader):
 
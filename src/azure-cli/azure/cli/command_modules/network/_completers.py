@@ -10,7 +10,7 @@ from azure.cli.command_modules.network.custom import list_traffic_manager_endpoi
 
 
 # pylint: disable=inconsistent-return-statements
-@Completer
+@Completer.cached('resource_group_name', 'virtual_network_name')
 def subnet_completion_list(cmd, prefix, namespace, **kwargs):  # pylint: disable=unused-argument
     client = network_client_factory(cmd.cli_ctx)
     if namespace.resource_group_name and namespace.virtual_network_name:
@@ -22,7 +22,8 @@ def subnet_completion_list(cmd, prefix, namespace, **kwargs):  # pylint: disable
 def get_lb_subresource_completion_list(prop):
 
     # pylint: disable=inconsistent-return-statements
-    @Completer
+    @Completer.cached('resource_group_name', 'load_balancer_name', 'resource_name',
+                      name='get_lb_subresource_completion_list.{}'.format(prop))
     def completer(cmd, prefix, namespace, **kwargs):  # pylint: disable=unused-argument
         client = network_client_factory(cmd.cli_ctx)
         try:
@@ -38,7 +39,8 @@ def get_lb_subresource_completion_list(prop):
 def get_ag_subresource_completion_list(prop):
 
     # pylint: disable=inconsistent-return-statements
-    @Completer
+    @Completer.cached('resource_group_name', 'application_gateway_name', 'resource_name',
+                      name='get_ag_subresource_completion_list.{}'.format(prop))
     def completer(cmd, prefix, namespace, **kwargs):  # pylint: disable=unused-argument
         client = network_client_factory(cmd.cli_ctx)
         try:
@@ -52,7 +54,7 @@ def get_ag_subresource_completion_list(prop):
 
 
 # pylint: disable=inconsistent-return-statements
-@Completer
+@Completer.cached('resource_group_name', 'application_gateway_name', 'resource_name', 'url_path_map_name')
 def ag_url_map_rule_completion_list(cmd, prefix, namespace, **kwargs):  # pylint: disable=unused-argument
     client = network_client_factory(cmd.cli_ctx)
     try:
@@ -72,7 +74,7 @@ def tm_endpoint_completion_list(cmd, prefix, namespace, **kwargs):  # pylint: di
         else []
 
 
-@Completer
+@Completer.cached('location')
 def service_endpoint_completer(cmd, prefix, namespace, **kwargs):  # pylint: disable=unused-argument
     client = network_client_factory(cmd.cli_ctx).available_endpoint_services
     location = namespace.location
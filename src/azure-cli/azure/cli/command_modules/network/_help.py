@@ -2089,6 +2089,10 @@ examples:
   - name: Import a local zone file into a DNS zone resource.
     text: >
         az network dns zone import -g MyResourceGroup -n MyZone -f /path/to/zone/file
+  - name: Preview the changes a zone file makes to an existing DNS zone, then apply them.
+    text: |
+        az network dns zone import -g MyResourceGroup -n MyZone -f /path/to/zone/file --delete-extra --dry-run
+        az network dns zone import -g MyResourceGroup -n MyZone -f /path/to/zone/file --delete-extra
 """
 
 helps['network dns zone list'] = """
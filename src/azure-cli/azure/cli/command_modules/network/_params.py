@@ -523,6 +523,9 @@ def load_arguments(self, _):
 
     with self.argument_context('network dns zone import') as c:
         c.argument('file_name', options_list=['--file-name', '-f'], type=file_type, completer=FilesCompleter(), help='Path to the DNS zone file to import')
+        c.argument('skip_unchanged', action='store_true', help='List the existing record sets once and only create or update the record sets that differ from the zone file. Record sets are written concurrently and only if they have not changed since they were listed.')
+        c.argument('delete_extra', action='store_true', help='Delete the record sets that are not in the zone file, except the SOA and NS record sets of the zone apex. Implies --skip-unchanged.')
+        c.argument('dry_run', action='store_true', help='Print the record sets that would be created, updated or deleted without changing the zone. Implies --skip-unchanged.')
 
     with self.argument_context('network dns zone export') as c:
         c.argument('file_name', options_list=['--file-name', '-f'], type=file_type, completer=FilesCompleter(), help='Path to the DNS zone file to save')
@@ -1642,13 +1642,19 @@ def _build_record(cmd, data):
 
 
 # pylint: disable=too-many-statements
-def import_zone(cmd, resource_group_name, zone_name, file_name):
+def import_zone(cmd, resource_group_name, zone_name, file_name, skip_unchanged=False, delete_extra=False,
+                dry_run=False):
     from azure.cli.core.util import read_file_content
+    import io
     import sys
     RecordSet = cmd.get_models('RecordSet', resource_type=ResourceType.MGMT_NETWORK_DNS)
 
-    file_text = read_file_content(file_name)
-    zone_obj = parse_zone_file(file_text, zone_name)
+    try:
+        # parse the zone file as it is read
+        with io.open(file_name, encoding='utf-8-sig', newline='\n') as zone_file:
+            zone_obj = parse_zone_file(zone_file, zone_name)
+    except UnicodeDecodeError:
+        zone_obj = parse_zone_file(read_file_content(file_name), zone_name)
 
     origin = zone_name
     record_sets = {}
@@ -1688,6 +1694,10 @@ def import_zone(cmd, resource_group_name, zone_name, file_name):
                 _add_record(record_set, record, record_set_type,
                             is_list=record_set_type.lower() not in ['soa', 'cname'])
 
+    if skip_unchanged or delete_extra or dry_run:
+        _import_zone_changes(cmd, resource_group_name, zone_name, origin, record_sets, delete_extra, dry_run)
+        return
+
     total_records = 0
     for key, rs in record_sets.items():
         rs_name, rs_type = key.lower().rsplit('.', 1)
@@ -1736,6 +1746,160 @@ def import_zone(cmd, resource_group_name, zone_name, file_name):
           .format(cum_records, total_records, zone_name), file=sys.stderr)
 
 
+def _import_zone_changes(cmd, resource_group_name, zone_name, origin, record_sets, delete_extra, dry_run):
+    """
+    Import the record sets of a zone file by listing the existing record sets once and only writing the ones that
+    differ. Writes are conditional on the ETag of the listed record sets and run concurrently.
+    """
+    import sys
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from azure.cli.core.commands import DEFAULT_MAX_CONCURRENT_IDS
+    from azure.cli.core.util import AdaptiveConcurrencyLimiter
+
+    client = get_mgmt_service_client(cmd.cli_ctx, ResourceType.MGMT_NETWORK_DNS)
+    print('== BEGINNING ZONE IMPORT: {} ==\n'.format(zone_name), file=sys.stderr)
+    if dry_run:
+        try:
+            existing = list(client.record_sets.list_by_dns_zone(resource_group_name, zone_name))
+        except CloudError as ex:
+            if ex.status_code != 404:
+                raise
+            existing = []
+    else:
+        Zone = cmd.get_models('Zone', resource_type=ResourceType.MGMT_NETWORK_DNS)
+        client.zones.create_or_update(resource_group_name, zone_name, Zone(location='global'))
+        existing = list(client.record_sets.list_by_dns_zone(resource_group_name, zone_name))
+
+    plan = _plan_zone_import(origin, record_sets, existing, delete_extra)
+    writes = [change for change in plan if change['action'] != 'delete']
+    total_records = sum(change['record_count'] for change in writes)
+    unchanged = len(record_sets) - len(writes)
+    if dry_run:
+        for change in plan:
+            print("{} {} records of type '{}' and name '{}'".format(
+                change['action'].capitalize(), change['record_count'], change['type'], change['name']),
+                file=sys.stderr)
+        print("\n== DRY RUN: {} RECORD SETS TO IMPORT, {} TO DELETE, {} UNCHANGED: '{}' =="
+              .format(len(writes), len(plan) - len(writes), unchanged, zone_name), file=sys.stderr)
+        return
+
+    limiter = AdaptiveConcurrencyLimiter(
+        cmd.cli_ctx.config.getint('core', 'max_concurrent_ids', fallback=DEFAULT_MAX_CONCURRENT_IDS))
+    progress_lock = threading.Lock()
+    progress = {'records': 0, 'deleted': 0}
+    failures = []
+
+    def _apply(change):
+        try:
+            if change['action'] == 'delete':
+                limiter.call(client.record_sets.delete, resource_group_name, zone_name, change['name'],
+                             change['type'], if_match=change['etag'])
+                message = "Deleted {} records of type '{}' and name '{}'"
+            else:
+                # only create record sets that do not exist and only update the ones that have not changed since
+                # they were listed
+                limiter.call(client.record_sets.create_or_update, resource_group_name, zone_name, change['name'],
+                             change['type'], change['record_set'], if_match=change['etag'],
+                             if_none_match='*' if change['action'] == 'create' else None)
+                message = "Imported {} records of type '{}' and name '{}'"
+        except CloudError as ex:
+            # e.g. the record set was changed since it was listed
+            logger.error(ex)
+            with progress_lock:
+                failures.append((change, ex))
+            return
+        with progress_lock:
+            if change['action'] == 'delete':
+                progress['deleted'] += 1
+            else:
+                progress['records'] += change['record_count']
+            print("({}/{}) ".format(progress['records'], total_records) +
+                  message.format(change['record_count'], change['type'], change['name']), file=sys.stderr)
+
+    if plan:
+        with ThreadPoolExecutor(max_workers=min(limiter.max_limit, len(plan))) as executor:
+            list(executor.map(_apply, plan))
+    print("\n== {}/{} RECORDS IMPORTED SUCCESSFULLY, {}/{} RECORD SETS DELETED, {} RECORD SETS UNCHANGED: '{}' =="
+          .format(progress['records'], total_records, progress['deleted'], len(plan) - len(writes), unchanged,
+                  zone_name), file=sys.stderr)
+    if failures:
+        failures.sort(key=lambda failure: plan.index(failure[0]))
+        error_format = "{} of type '{}' and name '{}': {}"
+        errors = [error_format.format(change['action'].capitalize(), change['type'], change['name'],
+                                      getattr(ex, 'message', ex)) for change, ex in failures]
+        raise CLIError('Failed to import {} record sets:\n{}'.format(len(failures), '\n'.join(errors)))
+
+
+def _plan_zone_import(origin, record_sets, existing, delete_extra):
+    """ Compare the record sets of a zone file with the existing record sets of the zone. """
+    import copy
+    existing_lookup = {}
+    for rs in existing:
+        existing_lookup[(rs.name.lower(), rs.type.rsplit('/', 1)[1].lower())] = rs
+
+    plan = []
+    imported = set()
+    for key, rs in record_sets.items():
+        rs_name, rs_type = key.lower().rsplit('.', 1)
+        rs_name = '@' if rs_name == origin else rs_name
+        if rs_name.endswith(origin):
+            rs_name = rs_name[:-(len(origin) + 1)]
+        imported.add((rs_name, rs_type))
+        current = existing_lookup.get((rs_name, rs_type))
+
+        if current and rs_name == '@' and rs_type == 'soa':
+            rs.soa_record.host = current.soa_record.host
+        elif current and rs_name == '@' and rs_type == 'ns':
+            # the name servers of the zone are kept, only the TTL is imported
+            ttl = rs.ttl
+            rs = copy.deepcopy(current)
+            rs.ttl = ttl
+
+        if current and _get_record_set_content(current, rs_type) == _get_record_set_content(rs, rs_type):
+            continue
+        plan.append({
+            'action': 'update' if current else 'create',
+            'name': rs_name,
+            'type': rs_type,
+            'record_set': rs,
+            'record_count': _get_record_count(rs, rs_type),
+            'etag': current.etag if current else None
+        })
+
+    if delete_extra:
+        for (rs_name, rs_type), rs in existing_lookup.items():
+            # the root SOA and NS record sets are managed by the zone and cannot be deleted
+            if (rs_name, rs_type) in imported or (rs_name == '@' and rs_type in ['soa', 'ns']):
+                continue
+            plan.append({
+                'action': 'delete',
+                'name': rs.name,
+                'type': rs_type,
+                'record_set': rs,
+                'record_count': _get_record_count(rs, rs_type),
+                'etag': rs.etag
+            })
+    return plan
+
+
+def _get_record_count(record_set, record_type):
+    try:
+        return len(getattr(record_set, _type_to_property_name(record_type)))
+    except TypeError:
+        return 1
+
+
+def _get_record_set_content(record_set, record_type):
+    import json
+    records = getattr(record_set, _type_to_property_name(record_type))
+    if isinstance(records, list):
+        records = sorted(json.dumps(r.serialize(), sort_keys=True) for r in records)
+    elif records is not None:
+        records = json.dumps(records.serialize(), sort_keys=True)
+    return record_set.ttl, records
+
+
 def add_dns_aaaa_record(cmd, resource_group_name, zone_name, record_set_name, ipv6_address,
                         ttl=None):
     AaaaRecord = cmd.get_models('AaaaRecord', resource_type=ResourceType.MGMT_NETWORK_DNS)
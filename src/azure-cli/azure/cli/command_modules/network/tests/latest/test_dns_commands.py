@@ -628,6 +628,24 @@ class DnsParseZoneFiles(unittest.TestCase):
         ])
         self._check_a(zone, '*.' + zn, [(3600, '2.3.4.5')])
 
+    def test_zone_file_parse_equivalence(self):
+        # the parsed zone files must stay the same as they were with the original multi-pass parser, whether the
+        # zone file is given as a string or as a file object
+        import io
+        import json
+        from collections import OrderedDict
+        for i in range(1, 9):
+            file_path = os.path.join(TEST_DIR, 'zone_files', 'zone{}.txt'.format(i))
+            zone_name = 'zone{}.com.'.format(i)
+            with open(file_path + '_parsed.json') as f:
+                expected = json.load(f, object_pairs_hook=OrderedDict)
+
+            zone = self._get_zone_object('zone{}.txt'.format(i), zone_name)
+            self.assertEqual(json.loads(json.dumps(zone), object_pairs_hook=OrderedDict), expected)
+            with io.open(file_path, encoding='utf-8-sig', newline='\n') as f:
+                zone = parse_zone_file(f, zone_name)
+            self.assertEqual(json.loads(json.dumps(zone), object_pairs_hook=OrderedDict), expected)
+
     def test_zone_import_errors(self):
         from knack.util import CLIError
         for f in ['fail1', 'fail2', 'fail3', 'fail4', 'fail5']:
@@ -76,6 +76,64 @@ class TestNetworkUnitTests(unittest.TestCase):
         self.assertEqual(len(result), 2)
         self.assertEqual(result[1].value, 'noodle')
 
+    def test_network_plan_zone_import(self):
+        from azure.cli.command_modules.network.custom import _plan_zone_import
+
+        class _Record(object):
+            def __init__(self, value):
+                self.value = value
+
+            def serialize(self):
+                return {'value': self.value}
+
+        def _record_set(ttl, values, name=None, record_type='A', etag=None):
+            rs = mock.MagicMock(ttl=ttl, arecords=[_Record(v) for v in values], etag=etag)
+            rs.name = name
+            rs.type = 'Microsoft.Network/dnszones/' + record_type
+            return rs
+
+        existing = [_record_set(3600, ['1.1.1.1', '2.2.2.2'], 'same', etag='1'),
+                    _record_set(3600, ['1.1.1.1'], 'changed', etag='2'),
+                    _record_set(3600, ['1.1.1.1'], 'Extra', etag='3'),
+                    _record_set(3600, [], '@', 'NS', etag='4')]
+        record_sets = {
+            'same.example.com.a': _record_set(3600, ['2.2.2.2', '1.1.1.1']),
+            'changed.example.com.a': _record_set(60, ['1.1.1.1']),
+            'new.example.com.a': _record_set(3600, ['3.3.3.3'])
+        }
+
+        self.existing, self.record_sets = existing, record_sets
+        plan = _plan_zone_import('example.com', record_sets, existing, delete_extra=False)
+        self.assertEqual(sorted((c['action'], c['name'], c['etag']) for c in plan),
+                         [('create', 'new', None), ('update', 'changed', '2')])
+
+        plan = _plan_zone_import('example.com', record_sets, existing, delete_extra=True)
+        self.assertEqual(sorted((c['action'], c['name'], c['etag']) for c in plan),
+                         [('create', 'new', None), ('delete', 'Extra', '3'), ('update', 'changed', '2')])
+
+    @mock.patch('azure.cli.command_modules.network.custom.get_mgmt_service_client', autospec=True)
+    def test_network_import_zone_changes_reports_failures(self, client_factory_mock):
+        from msrestazure.azure_exceptions import CloudError
+        from azure.cli.command_modules.network.custom import _import_zone_changes
+        self.test_network_plan_zone_import()
+        client = client_factory_mock.return_value
+        client.record_sets.list_by_dns_zone.return_value = self.existing
+
+        def _create_or_update(resource_group_name, zone_name, name, record_type, record_set, **kwargs):
+            if kwargs.get('if_match'):
+                raise CloudError(mock.MagicMock(status_code=412, reason='Precondition Failed'),
+                                 error='The record set has been modified')
+
+        client.record_sets.create_or_update.side_effect = _create_or_update
+        cmd = mock.MagicMock()
+        cmd.cli_ctx.config.getint.return_value = 4
+        with self.assertRaises(CLIError) as context:
+            _import_zone_changes(cmd, 'rg', 'example.com', 'example.com', self.record_sets, True, False)
+        self.assertEqual(str(context.exception), "Failed to import 1 record sets:\n"
+                                                 "Update of type 'a' and name 'changed': "
+                                                 "The record set has been modified")
+        client.record_sets.delete.assert_called_once_with('rg', 'example.com', 'Extra', 'a', if_match='3')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -44,6 +44,7 @@ import re
 
 from knack.log import get_logger
 from knack.util import CLIError
+from six import string_types
 
 
 logger = get_logger(__name__)
@@ -76,6 +77,10 @@ _REGEX = {
 
 _COMPILED_REGEX = {k: re.compile(v, re.IGNORECASE) for k, v in _REGEX.items()}
 
+# the regex to parse a record with, by the lower case record type token (or directive) of the record
+_RECORD_REGEX = {('$' + k if k in ['ttl', 'origin'] else k): v for k, v in _COMPILED_REGEX.items()}
+_TTL_TOKEN_REGEX = re.compile(r'\d+\w*$')
+
 
 class IncorrectParserException(Exception):
     pass
@@ -92,9 +97,7 @@ def _tokenize_line(line, quote_strings=False, infer_name=True):
     quote = False
     tokbuf = ""
     firstchar = True
-    ll = list(line)
-    while len(ll) > 0:
-        c = ll.pop(0)
+    for c in line:
         if c.isspace():
             if firstchar:
                 # used by the _add_record_names method
@@ -210,12 +213,18 @@ def _serialize(tokens):
     return " ".join(ret)
 
 
-def _remove_comments(text):
+def _iter_records(lines):
     """
-    Remove comments from a zonefile
+    Turn the lines of a zonefile into records, one line at a time:
+    * remove comments
+    * make sure each record is on one line, removing parenthesis
+    * make sure each record has a name, using the previous record name if there is none
+    Yields the tokens of each record.
     """
-    ret = []
-    lines = text.split("\n")
+    capturing = False
+    captured = []
+    previous_record_name = None
+
     for line in lines:
         if not line:
             continue
@@ -223,88 +232,67 @@ def _remove_comments(text):
         index = _find_comment_index(line)
         if index != -1:
             line = line[:index]
-        if line:
-            ret.append(line)
-
-    return "\n".join(ret)
-
-
-def _flatten(text):
-    """
-    Flatten the text:
-    * make sure each record is on one line.
-    * remove parenthesis
-    * remove Windows line endings
-    """
-    lines = text.split('\n')
-    SENTINEL = '%%%'
-
-    # tokens: sequence of non-whitespace separated by '' where a newline was
-    tokens = []
-    for line in (x for x in lines if len(x) > 0):
-        line = line.replace('\t', ' ')
-        tokens += _tokenize_line(line, quote_strings=True, infer_name=False)
-        tokens.append(SENTINEL)
-
-    # find (...) and turn it into a single line ("capture" it)
-    capturing = False
-    captured = []
-
-    flattened = []
-    while len(tokens) > 0:
-        tok = tokens.pop(0)
-
-        if tok == '$NAME':
-            tok = ' '
-
-        if not capturing and tok == SENTINEL:
-            # normal end-of-line
-            if len(captured) > 0:
-                flattened.append(" ".join(captured))
-                captured = []
+        if not line:
             continue
 
-        if tok.startswith("("):
-            # begin grouping
-            tok = tok.lstrip("(")
-            capturing = True
+        line = line.replace('\t', ' ')
+        for tok in _tokenize_line(line, quote_strings=True, infer_name=False):
+            if tok.startswith("("):
+                # begin grouping
+                tok = tok.lstrip("(")
+                capturing = True
 
-        if capturing and tok.endswith(")"):
-            # end grouping.  next end-of-line will turn this sequence into a flat line
-            tok = tok.rstrip(")")
-            capturing = False
+            if capturing and tok.endswith(")"):
+                # end grouping.  the end of this line ends the record
+                tok = tok.rstrip(")")
+                capturing = False
 
-        if tok != SENTINEL:
             captured.append(tok)
 
-    return "\n".join(flattened)
-
-
-def _add_record_names(text):
-    """
-    Go through each line of the text and ensure that
-    a name is defined.  Use previous record name if there is none.
-    """
-    global SUPPORTED_RECORDS
-
-    lines = text.split("\n")
-    ret = []
-    previous_record_name = None
+        if capturing or not captured:
+            continue
 
-    for line in lines:
-        tokens = _tokenize_line(line)
+        tokens = _tokenize_line(" ".join(captured))
+        captured = []
         if not tokens:
             continue
 
         record_name = tokens[0]
         if record_name == '$NAME':
-            tokens = [previous_record_name] + tokens[1:]
+            tokens[0] = previous_record_name
         elif not record_name.startswith('$'):
             previous_record_name = record_name
 
-        ret.append(_serialize(tokens))
+        yield tokens
 
-    return "\n".join(ret)
+
+def _get_record_regex(tokens):
+    """
+    Find the regex to parse a record with from its record type token, which follows the name and the optional TTL
+    and class.
+    """
+    tokens = [tok for tok in tokens if tok]
+    if not tokens:
+        return None
+    if tokens[0].startswith('$'):
+        return _RECORD_REGEX.get(tokens[0].lower())
+
+    index = 1
+    if index < len(tokens) and _TTL_TOKEN_REGEX.match(tokens[index]):
+        index += 1
+    if index < len(tokens) and tokens[index].lower() == 'in':
+        index += 1
+    return _RECORD_REGEX.get(tokens[index].lower()) if index < len(tokens) else None
+
+
+def _iter_lines(text):
+    """ Iterate over the lines of a zonefile given as a string or as a file object. """
+    if isinstance(text, string_types):
+        for line in text.split("\n"):
+            yield line
+    else:
+        for line in text:
+            yield line[:-1] if line.endswith("\n") else line
 
 
 def _convert_to_seconds(value):
@@ -405,33 +393,31 @@ def _post_check_names(zone):
 
 def parse_zone_file(text, zone_name, ignore_invalid=False):
     """
-    Parse a zonefile into a dict
+    Parse a zonefile into a dict. The zonefile can be a string or a file object, which is read one line at a time.
     """
 
-    text = _remove_comments(text)
-    text = _flatten(text)
-    text = _add_record_names(text)
-
     zone_obj = OrderedDict()
-    record_lines = text.split("\n")
     current_origin = zone_name.rstrip('.') + '.'
     current_ttl = 3600
     soa_processed = False
 
-    for record_line in record_lines:
-        parse_match = False
-        record = None
-        for record_type, regex in _COMPILED_REGEX.items():
-            match = regex.match(record_line)
-            if not match:
+    parsed = False
+    for tokens in _iter_records(_iter_lines(text)):
+        parsed = True
+        match = None
+        if tokens[0] is None:
+            # a record without a name before any named record
+            record_line = _serialize(tokens[1:])
+        else:
+            record_line = _serialize(tokens)
+            regex = _get_record_regex(tokens)
+            match = regex.match(record_line) if regex else None
+        if not match:
+            if ignore_invalid:
                 continue
-
-            parse_match = True
-            record = match.groupdict()
-
-        if not parse_match and not ignore_invalid:
             raise CLIError('Unable to parse: {}'.format(record_line))
 
+        record = match.groupdict()
         record_type = record['delim'].lower()
         if record_type == '$origin':
             origin_value = record['val']
@@ -446,7 +432,6 @@ def parse_zone_file(text, zone_name, ignore_invalid=False):
                 record_name = record_name.replace('@', current_origin)
             elif not record_name.endswith('.'):
                 record_name = '{}.{}'.format(record_name, current_origin)
-            print(current_origin, record_name)
 
             # special record-specific fix-ups
             if record_type == 'ptr':
@@ -502,6 +487,9 @@ def parse_zone_file(text, zone_name, ignore_invalid=False):
                 zone_obj[record_name][record_type] = []
             zone_obj[record_name][record_type].append(record)
 
+    if not parsed and not ignore_invalid:
+        raise CLIError('Unable to parse: no records found.')
+
     _post_process_ttl(zone_obj)
     _post_check_names(zone_obj)
     return zone_obj
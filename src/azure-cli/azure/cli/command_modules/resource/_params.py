@@ -57,6 +57,7 @@ def load_arguments(self, _):
         c.argument('tags', tags_type)
         c.argument('resource_ids', nargs='+', options_list=['--ids'], help='One or more resource IDs (space-delimited). If provided, no other "Resource Id" arguments should be specified.', arg_group='Resource Id')
         c.argument('include_response_body', arg_type=get_three_state_flag(), help='Use if the default command output doesn\'t capture all of the property data.')
+        c.argument('refresh', action='store_true', help='Fetch the API versions of the resource provider again instead of using the cached ones. Provider API versions are cached for the number of hours set by `core.provider_cache_ttl_hours` (default 24, 0 to disable).')
 
     with self.argument_context('resource list') as c:
         c.argument('name', resource_name_type)
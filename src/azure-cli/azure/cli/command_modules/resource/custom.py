@@ -551,7 +551,8 @@ def _list_resources_odata_filter_builder(resource_group_name=None, resource_prov
 
 def _get_auth_provider_latest_api_version(cli_ctx):
     rcf = _resource_client_factory(cli_ctx)
-    api_version = _ResourceUtils.resolve_api_version(rcf, 'Microsoft.Authorization', None, 'providerOperations')
+    api_version = _ResourceUtils.resolve_api_version(rcf, 'Microsoft.Authorization', None, 'providerOperations',
+                                                     cli_ctx=cli_ctx)
     return api_version
 
 
@@ -994,10 +995,10 @@ def export_deployment_as_template(cmd, resource_group_name, deployment_name):
 def create_resource(cmd, properties,
                     resource_group_name=None, resource_provider_namespace=None,
                     parent_resource_path=None, resource_type=None, resource_name=None,
-                    resource_id=None, api_version=None, location=None, is_full_object=False):
+                    resource_id=None, api_version=None, location=None, is_full_object=False, refresh=False):
     res = _ResourceUtils(cmd.cli_ctx, resource_group_name, resource_provider_namespace,
                          parent_resource_path, resource_type, resource_name,
-                         resource_id, api_version)
+                         resource_id, api_version, refresh=refresh)
     return res.create_resource(properties, location, is_full_object)
 
 
@@ -1015,7 +1016,7 @@ def _get_parsed_resource_ids(resource_ids):
     return ({'resource_id': rid} for rid in resource_ids)
 
 
-def _get_rsrc_util_from_parsed_id(cli_ctx, parsed_id, api_version):
+def _get_rsrc_util_from_parsed_id(cli_ctx, parsed_id, api_version, refresh=False):
     return _ResourceUtils(cli_ctx,
                           parsed_id.get('resource_group', None),
                           parsed_id.get('resource_namespace', None),
@@ -1023,7 +1024,8 @@ def _get_rsrc_util_from_parsed_id(cli_ctx, parsed_id, api_version):
                           parsed_id.get('resource_type', None),
                           parsed_id.get('resource_name', None),
                           parsed_id.get('resource_id', None),
-                          api_version)
+                          api_version,
+                          refresh=refresh)
 
 
 def _create_parsed_id(cli_ctx, resource_group_name=None, resource_provider_namespace=None, parent_resource_path=None,
@@ -1053,7 +1055,7 @@ def _single_or_collection(obj, default=None):
 # pylint: unused-argument
 def show_resource(cmd, resource_ids=None, resource_group_name=None,
                   resource_provider_namespace=None, parent_resource_path=None, resource_type=None,
-                  resource_name=None, api_version=None, include_response_body=False):
+                  resource_name=None, api_version=None, include_response_body=False, refresh=False):
     parsed_ids = _get_parsed_resource_ids(resource_ids) or [_create_parsed_id(cmd.cli_ctx,
                                                                               resource_group_name,
                                                                               resource_provider_namespace,
@@ -1062,18 +1064,19 @@ def show_resource(cmd, resource_ids=None, resource_group_name=None,
                                                                               resource_name)]
 
     return _single_or_collection(
-        [_get_rsrc_util_from_parsed_id(cmd.cli_ctx, id_dict, api_version).get_resource(
+        [_get_rsrc_util_from_parsed_id(cmd.cli_ctx, id_dict, api_version, refresh).get_resource(
             include_response_body) for id_dict in parsed_ids])
 
 
 # pylint: disable=unused-argument
 def delete_resource(cmd, resource_ids=None, resource_group_name=None,
                     resource_provider_namespace=None, parent_resource_path=None, resource_type=None,
-                    resource_name=None, api_version=None):
+                    resource_name=None, api_version=None, refresh=False):
     """
     Deletes the given resource(s).
     This function allows deletion of ids with dependencies on one another.
-    This is done with multiple passes through the given ids.
+    Child resources are deleted before their parents, independent resources are deleted concurrently, and deletes
+    that fail are retried once other deletes have completed.
     """
     parsed_ids = _get_parsed_resource_ids(resource_ids) or [_create_parsed_id(cmd.cli_ctx,
                                                                               resource_group_name,
@@ -1081,37 +1084,14 @@ def delete_resource(cmd, resource_ids=None, resource_group_name=None,
                                                                               parent_resource_path,
                                                                               resource_type,
                                                                               resource_name)]
-    to_be_deleted = [(_get_rsrc_util_from_parsed_id(cmd.cli_ctx, id_dict, api_version), id_dict)
+    to_be_deleted = [(_get_rsrc_util_from_parsed_id(cmd.cli_ctx, id_dict, api_version, refresh), id_dict)
                      for id_dict in parsed_ids]
 
-    results = []
-    from msrestazure.azure_exceptions import CloudError
-    while to_be_deleted:
-        logger.debug("Start new loop to delete resources.")
-        operations = []
-        failed_to_delete = []
-        for rsrc_utils, id_dict in to_be_deleted:
-            try:
-                operations.append(rsrc_utils.delete())
-                resource = _build_resource_id(**id_dict) or resource_name
-                logger.debug("deleting %s", resource)
-            except CloudError as e:
-                # request to delete failed, add parsed id dict back to queue
-                id_dict['exception'] = str(e)
-                failed_to_delete.append((rsrc_utils, id_dict))
-        to_be_deleted = failed_to_delete
-
-        # stop deleting if none deletable
-        if not operations:
-            break
+    results, failed = _ResourceDeleteScheduler(cmd.cli_ctx, to_be_deleted, resource_name).run()
 
-        # all operations return result before next pass
-        for operation in operations:
-            results.append(operation.result())
-
-    if to_be_deleted:
+    if failed:
         error_msg_builder = ['Some resources failed to be deleted (run with `--verbose` for more information):']
-        for _, id_dict in to_be_deleted:
+        for _, id_dict in failed:
             logger.info(id_dict['exception'])
             resource_id = _build_resource_id(**id_dict) or id_dict['resource_id']
             error_msg_builder.append(resource_id)
@@ -1120,10 +1100,113 @@ def delete_resource(cmd, resource_ids=None, resource_group_name=None,
     return _single_or_collection(results)
 
 
+class _ResourceDeleteScheduler(object):  # pylint: disable=too-few-public-methods
+    """
+    Deletes resources concurrently. A resource is deleted only after the resources nested under it in the given ids,
+    and a delete that fails is queued until another delete completes, since it may have depended on it.
+    """
+
+    def __init__(self, cli_ctx, to_be_deleted, resource_name=None):
+        from azure.cli.core.commands import DEFAULT_MAX_CONCURRENT_IDS
+        from azure.cli.core.util import AdaptiveConcurrencyLimiter
+        self.to_be_deleted = to_be_deleted
+        self.resource_name = resource_name
+        self.limiter = AdaptiveConcurrencyLimiter(
+            cli_ctx.config.getint('core', 'max_concurrent_ids', fallback=DEFAULT_MAX_CONCURRENT_IDS))
+        self.max_workers = self.limiter.max_limit
+        self.resource_ids = [_build_resource_id(**id_dict) or id_dict.get('resource_id') or resource_name
+                             for _, id_dict in to_be_deleted]
+        self.parents = self._find_parents(self.resource_ids)
+
+    @staticmethod
+    def _find_parents(resource_ids):
+        """ Map the index of each resource id to the index of the closest resource id it is nested under. """
+        index = {}
+        for i, resource_id in enumerate(resource_ids):
+            index.setdefault((resource_id or '').lower().rstrip('/'), i)
+        parents = {}
+        for i, resource_id in enumerate(resource_ids):
+            segments = (resource_id or '').lower().rstrip('/').split('/')
+            for end in range(len(segments) - 1, 0, -1):
+                parent = index.get('/'.join(segments[:end]))
+                if parent is not None and parent != i:
+                    parents[i] = parent
+                    break
+        return parents
+
+    def _delete(self, i):
+        rsrc_utils, _ = self.to_be_deleted[i]
+        logger.debug("deleting %s", self.resource_ids[i])
+        return self.limiter.call(rsrc_utils.delete).result()
+
+    def run(self):  # pylint: disable=too-many-branches
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+        from msrestazure.azure_exceptions import CloudError
+
+        count = len(self.to_be_deleted)
+        pending_children = [0] * count
+        for parent in self.parents.values():
+            pending_children[parent] += 1
+        ready = deque(i for i in range(count) if not pending_children[i])
+        blocked = set(i for i in range(count) if pending_children[i])
+        retry, failed = [], set()
+        results = {}
+        completed_since_failure = False
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while ready or running:
+                while ready and len(running) < self.max_workers:
+                    i = ready.popleft()
+                    running[executor.submit(self._delete, i)] = i
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    _, id_dict = self.to_be_deleted[i]
+                    try:
+                        results[i] = future.result()
+                    except CloudError as e:
+                        # the resource may depend on one that is still to be deleted, try again later
+                        id_dict['exception'] = str(e)
+                        logger.info("Failed to delete %s, it will be retried: %s", self.resource_ids[i], e)
+                        retry.append(i)
+                        continue
+                    except Exception as e:  # pylint: disable=broad-except
+                        id_dict['exception'] = str(e)
+                        logger.warning("Failed to delete %s: %s", self.resource_ids[i], e)
+                        failed.add(i)
+                        continue
+                    id_dict.pop('exception', None)
+                    completed_since_failure = True
+                    if count > 1:
+                        logger.warning("Deleted %s (%d/%d)", self.resource_ids[i], len(results), count)
+                    parent = self.parents.get(i)
+                    if parent is not None:
+                        pending_children[parent] -= 1
+                        if not pending_children[parent] and parent in blocked:
+                            blocked.discard(parent)
+                            ready.append(parent)
+
+                if retry and completed_since_failure:
+                    ready.extend(retry)
+                    retry, completed_since_failure = [], False
+                elif blocked and not ready and not running:
+                    # a nested resource could not be deleted, try the parents anyway as deleting them may succeed
+                    ready.extend(sorted(blocked))
+                    blocked.clear()
+
+        failed.update(retry)
+        return ([results[i] for i in range(count) if i in results],
+                [self.to_be_deleted[i] for i in sorted(failed)])
+
+
 # pylint: unused-argument
 def update_resource(cmd, parameters, resource_ids=None,
                     resource_group_name=None, resource_provider_namespace=None,
-                    parent_resource_path=None, resource_type=None, resource_name=None, api_version=None):
+                    parent_resource_path=None, resource_type=None, resource_name=None, api_version=None,
+                    refresh=False):
     parsed_ids = _get_parsed_resource_ids(resource_ids) or [_create_parsed_id(cmd.cli_ctx,
                                                                               resource_group_name,
                                                                               resource_provider_namespace,
@@ -1132,13 +1215,15 @@ def update_resource(cmd, parameters, resource_ids=None,
                                                                               resource_name)]
 
     return _single_or_collection(
-        [_get_rsrc_util_from_parsed_id(cmd.cli_ctx, id_dict, api_version).update(parameters) for id_dict in parsed_ids])
+        [_get_rsrc_util_from_parsed_id(cmd.cli_ctx, id_dict, api_version, refresh).update(parameters)
+         for id_dict in parsed_ids])
 
 
 # pylint: unused-argument
 def tag_resource(cmd, tags, resource_ids=None,
                  resource_group_name=None, resource_provider_namespace=None,
-                 parent_resource_path=None, resource_type=None, resource_name=None, api_version=None):
+                 parent_resource_path=None, resource_type=None, resource_name=None, api_version=None,
+                 refresh=False):
     """ Updates the tags on an existing resource. To clear tags, specify the --tag option
     without anything else. """
     parsed_ids = _get_parsed_resource_ids(resource_ids) or [_create_parsed_id(cmd.cli_ctx,
@@ -1149,14 +1234,15 @@ def tag_resource(cmd, tags, resource_ids=None,
                                                                               resource_name)]
 
     return _single_or_collection(
-        [_get_rsrc_util_from_parsed_id(cmd.cli_ctx, id_dict, api_version).tag(tags) for id_dict in parsed_ids])
+        [_get_rsrc_util_from_parsed_id(cmd.cli_ctx, id_dict, api_version, refresh).tag(tags)
+         for id_dict in parsed_ids])
 
 
 # pylint: unused-argument
 def invoke_resource_action(cmd, action, request_body=None, resource_ids=None,
                            resource_group_name=None, resource_provider_namespace=None,
                            parent_resource_path=None, resource_type=None, resource_name=None,
-                           api_version=None):
+                           api_version=None, refresh=False):
     """ Invokes the provided action on an existing resource."""
     parsed_ids = _get_parsed_resource_ids(resource_ids) or [_create_parsed_id(cmd.cli_ctx,
                                                                               resource_group_name,
@@ -1165,7 +1251,7 @@ def invoke_resource_action(cmd, action, request_body=None, resource_ids=None,
                                                                               resource_type,
                                                                               resource_name)]
 
-    return _single_or_collection([_get_rsrc_util_from_parsed_id(cmd.cli_ctx, id_dict, api_version)
+    return _single_or_collection([_get_rsrc_util_from_parsed_id(cmd.cli_ctx, id_dict, api_version, refresh)
                                   .invoke_action(action, request_body) for id_dict in parsed_ids])
 
 
@@ -2029,7 +2115,7 @@ class _ResourceUtils(object):  # pylint: disable=too-many-instance-attributes
     def __init__(self, cli_ctx,
                  resource_group_name=None, resource_provider_namespace=None,
                  parent_resource_path=None, resource_type=None, resource_name=None,
-                 resource_id=None, api_version=None, rcf=None):
+                 resource_id=None, api_version=None, rcf=None, refresh=False):
         # if the resouce_type is in format 'namespace/type' split it.
         # (we don't have to do this, but commands like 'vm show' returns such values)
         if resource_type and not resource_provider_namespace and not parent_resource_path:
@@ -2041,14 +2127,17 @@ class _ResourceUtils(object):  # pylint: disable=too-many-instance-attributes
         self.rcf = rcf or _resource_client_factory(cli_ctx)
         if api_version is None:
             if resource_id:
-                api_version = _ResourceUtils._resolve_api_version_by_id(self.rcf, resource_id)
+                api_version = _ResourceUtils._resolve_api_version_by_id(self.rcf, resource_id,
+                                                                        cli_ctx=cli_ctx, refresh=refresh)
             else:
                 _validate_resource_inputs(resource_group_name, resource_provider_namespace,
                                           resource_type, resource_name)
                 api_version = _ResourceUtils.resolve_api_version(self.rcf,
                                                                  resource_provider_namespace,
                                                                  parent_resource_path,
-                                                                 resource_type)
+                                                                 resource_type,
+                                                                 cli_ctx=cli_ctx,
+                                                                 refresh=refresh)
 
         self.resource_group_name = resource_group_name
         self.resource_provider_namespace = resource_provider_namespace
@@ -2224,12 +2313,17 @@ class _ResourceUtils(object):  # pylint: disable=too-many-instance-attributes
                                     self.rcf.resources.config.long_running_operation_timeout)
 
     @staticmethod
-    def resolve_api_version(rcf, resource_provider_namespace, parent_resource_path, resource_type):
-        provider = rcf.providers.get(resource_provider_namespace)
-
+    def resolve_api_version(rcf, resource_provider_namespace, parent_resource_path, resource_type,
+                            cli_ctx=None, refresh=False):
         # If available, we will use parent resource's api-version
         resource_type_str = (parent_resource_path.split('/')[0] if parent_resource_path else resource_type)
 
+        if cli_ctx:
+            from azure.cli.core.commands.arm import get_provider
+            provider = get_provider(cli_ctx, rcf, resource_provider_namespace, resource_type_str, refresh)
+        else:
+            provider = rcf.providers.get(resource_provider_namespace)
+
         rt = [t for t in provider.resource_types
               if t.resource_type.lower() == resource_type_str.lower()]
         if not rt:
@@ -2242,7 +2336,7 @@ class _ResourceUtils(object):  # pylint: disable=too-many-instance-attributes
             .format(resource_type))
 
     @staticmethod
-    def _resolve_api_version_by_id(rcf, resource_id):
+    def _resolve_api_version_by_id(rcf, resource_id, cli_ctx=None, refresh=False):
         parts = parse_resource_id(resource_id)
         namespace = parts.get('child_namespace_1', parts['namespace'])
         if parts.get('child_type_2'):
@@ -2261,4 +2355,4 @@ class _ResourceUtils(object):  # pylint: disable=too-many-instance-attributes
             parent = None
             resource_type = parts['type']
 
-        return _ResourceUtils.resolve_api_version(rcf, namespace, parent, resource_type)
+        return _ResourceUtils.resolve_api_version(rcf, namespace, parent, resource_type, cli_ctx, refresh)
@@ -6,9 +6,9 @@
 import unittest
 
 try:
-    from unittest.mock import MagicMock
+    from unittest.mock import MagicMock, patch
 except ImportError:
-    from mock import MagicMock
+    from mock import MagicMock, patch
 
 from knack.util import CLIError
 from azure.cli.command_modules.resource.custom import (_ResourceUtils, _validate_resource_inputs,
@@ -25,7 +25,10 @@ class TestApiCheck(unittest.TestCase):
         pass
 
     def setUp(self):
-        pass
+        # keep the resolved providers out of the provider cache in the config dir
+        patcher = patch('azure.cli.core.commands.arm._load_provider_cache', return_value={})
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def tearDown(self):
         pass
@@ -0,0 +1,90 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import threading
+import unittest
+
+try:
+    import unittest.mock as mock
+except ImportError:
+    import mock
+
+from msrestazure.azure_exceptions import CloudError
+
+from azure.cli.core.mock import DummyCli
+from azure.cli.command_modules.resource.custom import _ResourceDeleteScheduler
+
+GROUP = '/subscriptions/sub/resourceGroups/rg/providers/'
+VNET = GROUP + 'Microsoft.Network/virtualNetworks/vnet'
+SUBNET = VNET + '/subnets/subnet'
+NIC = GROUP + 'Microsoft.Network/networkInterfaces/nic'
+VM = GROUP + 'Microsoft.Compute/virtualMachines/vm'
+
+
+class _FakeResources(object):
+    def __init__(self, depends_on=None, fail=None):
+        self.depends_on = depends_on or {}
+        self.fail = fail or set()
+        self.deleted = []
+        self.lock = threading.Lock()
+
+    def utils(self, resource_id):
+        rsrc_utils = mock.MagicMock()
+        rsrc_utils.delete.side_effect = lambda: self._delete(resource_id)
+        return rsrc_utils, {'resource_id': resource_id}
+
+    def _delete(self, resource_id):
+        with self.lock:
+            if resource_id in self.fail or any(d not in self.deleted for d in self.depends_on.get(resource_id, [])):
+                response = mock.MagicMock(status_code=400, reason='Bad Request')
+                raise CloudError(response, error='{} is in use'.format(resource_id))
+            self.deleted.append(resource_id)
+        return mock.MagicMock(result=lambda: resource_id)
+
+
+class TestResourceDeleteScheduler(unittest.TestCase):
+
+    def _run(self, resources, resource_ids, cli_ctx=None):
+        to_be_deleted = [resources.utils(r) for r in resource_ids]
+        with mock.patch('azure.cli.command_modules.resource.custom._build_resource_id', return_value=None):
+            return _ResourceDeleteScheduler(cli_ctx or DummyCli(), to_be_deleted).run()
+
+    def test_find_parents(self):
+        parents = _ResourceDeleteScheduler._find_parents([VNET, SUBNET.upper(), NIC, SUBNET + '/child'])
+        self.assertEqual(parents, {1: 0, 3: 1})
+
+    def test_children_deleted_before_parents(self):
+        resources = _FakeResources(depends_on={VNET: [SUBNET]})
+        results, failed = self._run(resources, [VNET, SUBNET])
+        self.assertEqual(results, [VNET, SUBNET])
+        self.assertEqual(failed, [])
+        self.assertEqual(resources.deleted, [SUBNET, VNET])
+
+    def test_failed_deletes_are_retried(self):
+        resources = _FakeResources(depends_on={SUBNET: [NIC], NIC: [VM]})
+        results, failed = self._run(resources, [VNET, SUBNET, NIC, VM])
+        self.assertEqual(results, [VNET, SUBNET, NIC, VM])
+        self.assertEqual(failed, [])
+        self.assertTrue(resources.deleted.index(VM) < resources.deleted.index(NIC) <
+                        resources.deleted.index(SUBNET) < resources.deleted.index(VNET))
+
+    def test_failures_are_reported(self):
+        resources = _FakeResources(depends_on={VNET: [SUBNET]}, fail={SUBNET})
+        results, failed = self._run(resources, [VM, VNET, SUBNET])
+        self.assertEqual(results, [VM])
+        self.assertEqual([id_dict['resource_id'] for _, id_dict in failed], [VNET, SUBNET])
+        self.assertTrue(all('exception' in id_dict for _, id_dict in failed))
+
+    def test_invalid_max_concurrent_ids(self):
+        cli_ctx = DummyCli()
+        resources = _FakeResources(depends_on={VNET: [SUBNET]})
+        with mock.patch.object(cli_ctx.config, 'getint', return_value=0):
+            results, failed = self._run(resources, [VNET, SUBNET], cli_ctx)
+        self.assertEqual(results, [VNET, SUBNET])
+        self.assertEqual(failed, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -541,6 +541,9 @@ helps['role assignment list'] = """
 type: command
 short-summary: List role assignments.
 long-summary: By default, only assignments scoped to subscription will be displayed. To view assignments scoped by resource or group, use `--all`.
+examples:
+  - name: Audit the role assignments of several principals under the subscription.
+    text: az role assignment list --all --assignees user1@contoso.com http://myapp 00000000-0000-0000-0000-000000000000
 """
 
 helps['role assignment list-changelogs'] = """
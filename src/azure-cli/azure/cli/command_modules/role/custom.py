@@ -10,8 +10,10 @@ import datetime
 import json
 import re
 import os
+import time
 import uuid
 import itertools
+import collections
 from dateutil.relativedelta import relativedelta
 import dateutil.parser
 
@@ -38,6 +40,8 @@ logger = get_logger(__name__)
 
 # pylint: disable=too-many-lines
 
+DEFAULT_LOOKUP_CACHE_TTL_MINUTES = 30
+
 
 def list_role_definitions(cmd, name=None, resource_group_name=None, scope=None,
                           custom_role_only=False):
@@ -162,15 +166,23 @@ def _create_role_assignment(cli_ctx, role, assignee, resource_group_name=None, s
 
 def list_role_assignments(cmd, assignee=None, role=None, resource_group_name=None,
                           scope=None, include_inherited=False,
-                          show_all=False, include_groups=False, include_classic_administrators=False):
+                          show_all=False, include_groups=False, include_classic_administrators=False,
+                          assignees=None):
     '''
     :param include_groups: include extra assignments to the groups of which the user is a
     member(transitively).
+    :param assignees: audit the assignments of several assignees with a single listing.
     '''
     graph_client = _graph_client_factory(cmd.cli_ctx)
     factory = _auth_client_factory(cmd.cli_ctx, scope)
     assignments_client = factory.role_assignments
     definitions_client = factory.role_definitions
+    lookup_cache = _LookupCache(cmd.cli_ctx)
+
+    if assignee and assignees:
+        raise CLIError('usage error: --assignee | --assignees')
+    if assignees and include_classic_administrators:
+        raise CLIError('--include-classic-administrators is not supported with --assignees')
 
     if show_all:
         if resource_group_name or scope:
@@ -182,7 +194,8 @@ def list_role_assignments(cmd, assignee=None, role=None, resource_group_name=Non
 
     assignments = _search_role_assignments(cmd.cli_ctx, assignments_client, definitions_client,
                                            scope, assignee, role,
-                                           include_inherited, include_groups)
+                                           include_inherited, include_groups,
+                                           assignees=assignees, lookup_cache=lookup_cache)
 
     results = todict(assignments) if assignments else []
     if include_classic_administrators:
@@ -194,10 +207,16 @@ def list_role_assignments(cmd, assignee=None, role=None, resource_group_name=Non
     # 1. fill in logic names to get things understandable.
     # (it's possible that associated roles and principals were deleted, and we just do nothing.)
     # 2. fill in role names
-    role_defs = list(definitions_client.list(
-        scope=scope or ('/subscriptions/' + definitions_client.config.subscription_id)))
     worker = MultiAPIAdaptor(cmd.cli_ctx)
-    role_dics = {i.id: worker.get_role_property(i, 'role_name') for i in role_defs}
+    role_scope = scope or ('/subscriptions/' + definitions_client.config.subscription_id)
+    role_dics = lookup_cache.get('roleDefinitions', [role_scope]).get(role_scope)
+    role_def_ids = set(worker.get_role_property(i, 'roleDefinitionId')
+                       for i in results if not i.get('roleDefinitionName'))
+    # refresh cached definitions once when an assignment refers to a role created since they were listed
+    if role_dics is None or any(role_def_id not in role_dics for role_def_id in role_def_ids):
+        role_defs = list(definitions_client.list(scope=role_scope))
+        role_dics = {i.id: worker.get_role_property(i, 'role_name') for i in role_defs}
+        lookup_cache.set('roleDefinitions', {role_scope: role_dics})
     for i in results:
         if not i.get('roleDefinitionName'):
             if role_dics.get(worker.get_role_property(i, 'roleDefinitionId')):
@@ -212,8 +231,7 @@ def list_role_assignments(cmd, assignee=None, role=None, resource_group_name=Non
 
     if principal_ids:
         try:
-            principals = _get_object_stubs(graph_client, principal_ids)
-            principal_dics = {i.object_id: _get_displayable_name(i) for i in principals}
+            principal_dics = _get_principal_names(graph_client, principal_ids, lookup_cache)
 
             for i in [r for r in results if not r.get('principalName')]:
                 i['principalName'] = ''
@@ -453,41 +471,115 @@ def delete_role_assignments(cmd, ids=None, assignee=None, role=None, resource_gr
 
 
 def _search_role_assignments(cli_ctx, assignments_client, definitions_client,
-                             scope, assignee, role, include_inherited, include_groups):
-    assignee_object_id = None
+                             scope, assignee, role, include_inherited, include_groups,
+                             assignees=None, lookup_cache=None):
+    assignee_object_ids = None
     if assignee:
-        assignee_object_id = _resolve_object_id(cli_ctx, assignee, fallback_to_object_id=True)
+        assignee_object_ids = [_resolve_object_id(cli_ctx, assignee, fallback_to_object_id=True,
+                                                  lookup_cache=lookup_cache)]
+    elif assignees:
+        assignee_object_ids = _resolve_object_ids(cli_ctx, assignees, lookup_cache=lookup_cache)
 
     # always use "scope" if provided, so we can get assignments beyond subscription e.g. management groups
     if scope:
         assignments = list(assignments_client.list_for_scope(scope=scope, filter='atScope()'))
-    elif assignee_object_id:
-        if include_groups:
-            f = "assignedTo('{}')".format(assignee_object_id)
-        else:
-            f = "principalId eq '{}'".format(assignee_object_id)
-        assignments = list(assignments_client.list(filter=f))
+    elif assignee_object_ids and (include_groups or len(assignee_object_ids) == 1):
+        f = "assignedTo('{}')" if include_groups else "principalId eq '{}'"
+        assignments = []
+        seen = set()
+        for object_id in assignee_object_ids:
+            for a in assignments_client.list(filter=f.format(object_id)):
+                if a.id not in seen:
+                    seen.add(a.id)
+                    assignments.append(a)
     else:
+        # many assignees are filtered locally from a single listing
         assignments = list(assignments_client.list())
 
     worker = MultiAPIAdaptor(cli_ctx)
     if assignments:
-        assignments = [a for a in assignments if (
-            not scope or
-            include_inherited and re.match(worker.get_role_property(a, 'scope'), scope, re.I) or
-            worker.get_role_property(a, 'scope').lower() == scope.lower()
-        )]
+        if scope:
+            is_in_scope = _get_scope_matcher(scope, include_inherited)
+            assignments = [a for a in assignments if is_in_scope(worker.get_role_property(a, 'scope'))]
 
         if role:
             role_id = _resolve_role_id(role, scope, definitions_client)
             assignments = [i for i in assignments if worker.get_role_property(i, 'role_definition_id') == role_id]
 
-        if assignee_object_id:
-            assignments = [i for i in assignments if worker.get_role_property(i, 'principal_id') == assignee_object_id]
+        if assignee_object_ids:
+            object_ids = set(assignee_object_ids)
+            assignments = [i for i in assignments if worker.get_role_property(i, 'principal_id') in object_ids]
 
     return assignments
 
 
+def _get_scope_matcher(scope, include_inherited=False):
+    """
+    Return a function telling whether an assignment scope is the given scope, or one of its parent scopes when
+    `include_inherited` is set. Scopes are compared case-insensitively by whole path segments.
+    """
+    parts = scope.lower().rstrip('/').split('/')
+    scopes = {'/'.join(parts)}
+    if include_inherited:
+        scopes.update('/'.join(parts[:i]) for i in range(1, len(parts)))
+
+    def _matches(assignment_scope):
+        return assignment_scope.lower().rstrip('/') in scopes
+
+    return _matches
+
+
+class _LookupCache(object):
+    """
+    Graph objects and role definitions looked up when listing role assignments, cached in the config dir for
+    `role.lookup_cache_ttl_minutes` (0 disables the cache).
+    """
+
+    def __init__(self, cli_ctx):
+        import threading
+        from azure.cli.core._session import Session
+        self._lock = threading.Lock()
+        self.ttl = cli_ctx.config.getint('role', 'lookup_cache_ttl_minutes',
+                                         fallback=DEFAULT_LOOKUP_CACHE_TTL_MINUTES) * 60
+        self._session = Session()
+        if self.ttl > 0:
+            self._session.load(os.path.join(cli_ctx.config.config_dir, 'roleLookupCache.json'))
+
+    def get(self, kind, keys):
+        """ Return the cached values of the given keys that have not expired. """
+        now = time.time()
+        result = {}
+        with self._lock:
+            for key in keys:
+                entry = self._session.get('{}/{}'.format(kind, key.lower()))
+                if entry and entry['time'] + self.ttl > now:
+                    result[key] = entry['value']
+        return result
+
+    def set(self, kind, values):
+        if self.ttl <= 0 or not values:
+            return
+        now = time.time()
+        with self._lock:
+            for key in [k for k, v in self._session.data.items() if v['time'] + self.ttl <= now]:
+                del self._session[key]
+            for key, value in values.items():
+                self._session['{}/{}'.format(kind, key.lower())] = {'time': now, 'value': value}
+
+
+def _get_principal_names(graph_client, principal_ids, lookup_cache):
+    tenant_id = graph_client.config.tenant_id
+    cached = lookup_cache.get('principals/' + tenant_id, principal_ids)
+    missing = [i for i in principal_ids if i not in cached]
+    if missing:
+        names = dict.fromkeys(missing)
+        names.update((i.object_id, _get_displayable_name(i)) for i in _get_object_stubs(graph_client, missing))
+        # deleted principals are cached as well
+        lookup_cache.set('principals/' + tenant_id, names)
+        cached.update(names)
+    return cached
+
+
 def _build_role_scope(resource_group_name, scope, subscription_id):
     subscription_scope = '/subscriptions/' + subscription_id
     if scope:
@@ -1641,8 +1733,17 @@ def _encode_custom_key_description(key_description):
     return key_description.encode('utf-16')
 
 
-def _resolve_object_id(cli_ctx, assignee, fallback_to_object_id=False):
-    client = _graph_client_factory(cli_ctx)
+def _resolve_object_id(cli_ctx, assignee, fallback_to_object_id=False, lookup_cache=None, client=None):
+    client = client or _graph_client_factory(cli_ctx)
+    if lookup_cache:
+        cache_kind = 'assignees/' + client.config.tenant_id
+        object_id = lookup_cache.get(cache_kind, [assignee]).get(assignee)
+        if object_id:
+            return object_id
+        object_id = _resolve_object_id(cli_ctx, assignee, fallback_to_object_id, client=client)
+        lookup_cache.set(cache_kind, {assignee: object_id})
+        return object_id
+
     result = None
     try:
         if assignee.find('@') >= 0:  # looks like a user principal name
@@ -1664,6 +1765,38 @@ def _resolve_object_id(cli_ctx, assignee, fallback_to_object_id=False):
         raise
 
 
+def _resolve_object_ids(cli_ctx, assignees, lookup_cache=None):
+    """
+    Resolve many assignees to object ids. Object ids are verified with batched graph calls, and the other
+    assignees are resolved concurrently.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from azure.cli.core.commands import DEFAULT_MAX_CONCURRENT_IDS
+    from azure.cli.core.util import AdaptiveConcurrencyLimiter
+
+    client = _graph_client_factory(cli_ctx)
+    assignees = list(collections.OrderedDict.fromkeys(assignees))
+    object_ids = {}
+    if lookup_cache:
+        object_ids.update(lookup_cache.get('assignees/' + client.config.tenant_id, assignees))
+    guids = [a for a in assignees if a not in object_ids and _is_guid(a)]
+    if guids:
+        found = set(i.object_id.lower() for i in _get_object_stubs(client, guids))
+        object_ids.update((a, a) for a in guids if a.lower() in found)
+        if lookup_cache:
+            lookup_cache.set('assignees/' + client.config.tenant_id, {a: a for a in guids if a in object_ids})
+
+    remaining = [a for a in assignees if a not in object_ids]
+    if remaining:
+        max_workers = cli_ctx.config.getint('core', 'max_concurrent_ids', fallback=DEFAULT_MAX_CONCURRENT_IDS)
+        limiter = AdaptiveConcurrencyLimiter(max_workers)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(remaining)))) as executor:
+            futures = [executor.submit(limiter.call, _resolve_object_id, cli_ctx, a, fallback_to_object_id=True,
+                                       lookup_cache=lookup_cache, client=client) for a in remaining]
+            object_ids.update(zip(remaining, [f.result() for f in futures]))
+    return [object_ids[a] for a in assignees]
+
+
 def _is_guid(guid):
     try:
         uuid.UUID(guid)
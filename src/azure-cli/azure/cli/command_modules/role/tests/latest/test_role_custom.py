@@ -2,10 +2,15 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
+import shutil
+import tempfile
 import unittest
 import mock
 
-from azure.cli.command_modules.role.custom import _resolve_role_id
+from azure.cli.core._session import commit_sessions
+from azure.cli.core.mock import DummyCli
+from azure.cli.command_modules.role.custom import (_resolve_role_id, _get_scope_matcher, _get_principal_names,
+                                                   _resolve_object_ids, _LookupCache, list_role_assignments)
 
 # pylint: disable=line-too-long
 
@@ -26,3 +31,85 @@ class TestRoleCustomCommands(unittest.TestCase):
         # action (using a full id)
         test_full_id = '/subscriptions/0b1f6471-1bf0-4dda-aec3-cb9272123456/providers/microsoft.authorization/roleDefinitions/5370bbf4-6b73-4417-969b-8f2e6e123456'
         self.assertEqual(test_full_id, _resolve_role_id(test_full_id, 'foobar', mock_client))
+
+    def test_scope_matcher(self):
+        scope = '/subscriptions/sub/resourceGroups/rg/providers/Microsoft.Compute/virtualMachines/vm'
+        is_in_scope = _get_scope_matcher(scope, include_inherited=True)
+        self.assertTrue(is_in_scope('/'))
+        self.assertTrue(is_in_scope('/subscriptions/SUB'))
+        self.assertTrue(is_in_scope('/subscriptions/sub/resourcegroups/rg/'))
+        self.assertTrue(is_in_scope(scope.upper()))
+        self.assertFalse(is_in_scope('/subscriptions/sub/resourceGroups/r'))
+        self.assertFalse(is_in_scope('/subscriptions/sub/resourceGroups/rg/providers/Microsoft.Compute'
+                                     '/virtualMachines/vm/extensions/ext'))
+        self.assertFalse(_get_scope_matcher(scope)('/subscriptions/sub'))
+        self.assertTrue(_get_scope_matcher(scope)(scope.lower()))
+
+
+class TestRoleLookupCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cli_ctx = DummyCli()
+        self.cli_ctx.config.config_dir = self.temp_dir
+        self.graph_client = mock.MagicMock()
+        self.graph_client.config.tenant_id = 'tenant'
+
+    def tearDown(self):
+        commit_sessions()
+        shutil.rmtree(self.temp_dir)
+
+    def test_principal_names_are_cached(self):
+        lookup_cache = _LookupCache(self.cli_ctx)
+        user = mock.MagicMock(object_id='1', user_principal_name='user@contoso.com')
+        self.graph_client.objects.get_objects_by_object_ids.return_value = [user]
+        expected = {'1': 'user@contoso.com', '2': None}
+        self.assertEqual(_get_principal_names(self.graph_client, ['1', '2'], lookup_cache), expected)
+        self.assertEqual(_get_principal_names(self.graph_client, ['1', '2'], lookup_cache), expected)
+        self.graph_client.objects.get_objects_by_object_ids.assert_called_once()
+
+        with mock.patch.object(self.cli_ctx.config, 'getint', return_value=0):
+            lookup_cache = _LookupCache(self.cli_ctx)
+        _get_principal_names(self.graph_client, ['1'], lookup_cache)
+        self.assertEqual(self.graph_client.objects.get_objects_by_object_ids.call_count, 2)
+
+    @mock.patch('azure.cli.command_modules.role.custom._graph_client_factory', autospec=True)
+    def test_resolve_object_ids(self, graph_client_factory_mock):
+        graph_client_factory_mock.return_value = self.graph_client
+        guid = '00000000-0000-0000-0000-000000000001'
+        self.graph_client.objects.get_objects_by_object_ids.return_value = [mock.MagicMock(object_id=guid)]
+        self.graph_client.users.list.return_value = [mock.MagicMock(object_id='2')]
+        lookup_cache = _LookupCache(self.cli_ctx)
+
+        result = _resolve_object_ids(self.cli_ctx, [guid, 'user@contoso.com', guid], lookup_cache)
+        self.assertEqual(result, [guid, '2'])
+        self.assertEqual(_resolve_object_ids(self.cli_ctx, ['user@contoso.com', guid], lookup_cache), ['2', guid])
+        self.graph_client.objects.get_objects_by_object_ids.assert_called_once()
+        self.graph_client.users.list.assert_called_once()
+
+    @mock.patch('azure.cli.command_modules.role.custom._search_role_assignments', autospec=True)
+    @mock.patch('azure.cli.command_modules.role.custom._auth_client_factory', autospec=True)
+    @mock.patch('azure.cli.command_modules.role.custom._graph_client_factory', autospec=True)
+    def test_role_definition_names_are_refreshed_on_miss(self, _, auth_client_factory_mock, search_mock):
+        definitions_client = auth_client_factory_mock.return_value.role_definitions
+        definitions_client.config.subscription_id = 'sub'
+        reader = mock.MagicMock(id='reader', role_name='Reader')
+        custom = mock.MagicMock(id='custom', role_name='Custom Role')
+        definitions_client.list.return_value = [reader]
+        cmd = mock.MagicMock(cli_ctx=self.cli_ctx)
+
+        def _list(*role_definition_ids):
+            search_mock.return_value = [{'roleDefinitionId': i, 'principalId': None} for i in role_definition_ids]
+            results = list_role_assignments(cmd, show_all=True)
+            commit_sessions()
+            return [r['roleDefinitionName'] for r in results]
+
+        self.assertEqual(_list('reader'), ['Reader'])
+        self.assertEqual(_list('reader'), ['Reader'])
+        definitions_client.list.assert_called_once_with(scope='/subscriptions/sub')
+
+        # a role created after the definitions were cached
+        definitions_client.list.return_value = [reader, custom]
+        self.assertEqual(_list('reader', 'custom'), ['Reader', 'Custom Role'])
+        self.assertEqual(_list('custom'), ['Custom Role'])
+        self.assertEqual(definitions_client.list.call_count, 2)
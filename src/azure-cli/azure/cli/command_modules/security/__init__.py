@@ -3,7 +3,6 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
-from azure.cli.command_modules.security._help import helps  # pylint: disable=unused-import
 from azure.cli.core import AzCommandsLoader
 
 
@@ -7,8 +7,6 @@ from azure.cli.core import AzCommandsLoader
 from azure.cli.core.profiles import ResourceType
 from azure.cli.core.commands import AzCommandGroup, AzArgumentContext
 
-import azure.cli.command_modules.storage._help  # pylint: disable=unused-import
-
 
 class StorageCommandsLoader(AzCommandsLoader):
     def __init__(self, cli_ctx=None):
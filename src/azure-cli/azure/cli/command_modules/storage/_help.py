@@ -346,6 +346,11 @@ examples:
 helps['storage blob download-batch'] = """
 type: command
 short-summary: Download blobs from a blob container recursively.
+long-summary: >
+    Blobs are transferred concurrently. The number of concurrent transfers, the total number of connections and the
+    number of bytes in flight are limited by the `batch_max_transfers`, `batch_max_connections` and
+    `batch_max_inflight_mb` settings in the [storage] section of the configuration. Failed transfers are retried
+    `batch_max_retries` times and reported once the rest of the batch has completed.
 parameters:
   - name: --source -s
     type: string
@@ -527,6 +532,15 @@ examples:
 helps['storage blob upload-batch'] = """
 type: command
 short-summary: Upload files from a local directory to a blob container.
+long-summary: >
+    Blobs are transferred concurrently. The number of concurrent transfers, the total number of connections and the
+    number of bytes in flight are limited by the `batch_max_transfers`, `batch_max_connections` and
+    `batch_max_inflight_mb` settings in the [storage] section of the configuration. Failed transfers are retried
+    `batch_max_retries` times and reported once the rest of the batch has completed.
+
+    With --skip-unchanged, the blobs of the destination are listed once and kept in a manifest in the
+    configuration directory. Later uploads update the manifest, and the destination is listed again when the
+    listing is older than the `batch_manifest_max_age_hours` setting (168 hours by default).
 parameters:
   - name: --source -s
     type: string
@@ -559,6 +573,8 @@ parameters:
 examples:
   - name: Upload all files that end with .py unless blob exists and has been modified since given date.
     text: az storage blob upload-batch -d MyContainer --account-name MyStorageAccount -s directory_path --pattern *.py --if-unmodified-since 2018-08-27T20:51Z
+  - name: Upload only the files that changed since the last upload.
+    text: az storage blob upload-batch -d MyContainer --account-name MyStorageAccount -s directory_path --skip-unchanged
 """
 
 helps['storage blob url'] = """
@@ -396,6 +396,12 @@ def load_arguments(self, _):  # pylint: disable=too-many-locals, too-many-statem
         c.argument('maxsize_condition', arg_group='Content Control')
         c.argument('validate_content', action='store_true', min_api='2016-05-31', arg_group='Content Control')
         c.argument('blob_type', options_list=('--type', '-t'), arg_type=get_enum_type(get_blob_types()))
+        c.argument('skip_unchanged', action='store_true',
+                   help='Skip the files whose size and modification time match their last upload, or whose MD5 '
+                        'matches the Content-MD5 of the blob, as recorded in a local manifest of the destination.')
+        c.argument('check_md5', action='store_true',
+                   help='With --skip-unchanged, compare the MD5 of the files with the Content-MD5 of the blobs '
+                        'when it is known, instead of the modification time.')
         c.extra('no_progress', progress_type)
         c.extra('socket_timeout', socket_timeout_type)
 
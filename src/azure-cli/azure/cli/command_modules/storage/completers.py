@@ -73,8 +73,11 @@ def dir_path_completer(cmd, prefix, namespace):
 
 
 def get_storage_name_completion_list(service, func, parent=None):
-    @Completer
-    def completer(cmd, _, namespace):
+    context = ['account_name', 'connection_string'] + ([parent] if parent else [])
+    name = 'get_storage_name_completion_list.{}.{}'.format(getattr(service, '__name__', service), func)
+
+    @Completer.cached(*context, name=name)
+    def cached_completer(cmd, _, namespace):
         validate_client_parameters(cmd, namespace)
         client = get_storage_client(cmd.cli_ctx, service, namespace)
         if parent:
@@ -85,9 +88,22 @@ def get_storage_name_completion_list(service, func, parent=None):
             items = [x.name for x in getattr(client, func)()]
         return items
 
+    @Completer
+    def completer(cmd, prefix, namespace):
+        # fill in the account taken from environment variables or config first, so that it's part of the cache key
+        _fill_account_from_config(cmd, namespace)
+        return cached_completer(prefix=prefix, parsed_args=namespace)
+
     return completer
 
 
+def _fill_account_from_config(cmd, namespace):
+    if not namespace.connection_string:
+        namespace.connection_string = cmd.cli_ctx.config.get('storage', 'connection_string', None)
+    if not namespace.account_name:
+        namespace.account_name = cmd.cli_ctx.config.get('storage', 'account', None)
+
+
 def get_storage_acl_name_completion_list(service, container_param, func):
     @Completer
     def completer(cmd, _, namespace):
@@ -6,15 +6,17 @@
 from __future__ import print_function
 
 import os
+from collections import OrderedDict
 from datetime import datetime
 from azure.cli.command_modules.storage.url_quote_util import encode_for_url, make_encoded_file_url_and_params
 from azure.cli.command_modules.storage.util import (create_blob_service_from_storage_client,
                                                     create_file_share_from_storage_client,
                                                     create_short_lived_share_sas,
                                                     create_short_lived_container_sas,
-                                                    filter_none, collect_blobs, collect_files,
-                                                    mkdir_p, guess_content_type, normalize_blob_file_path,
-                                                    check_precondition_success)
+                                                    filter_none, collect_blobs, collect_blobs_with_size,
+                                                    collect_files, mkdir_p, guess_content_type,
+                                                    normalize_blob_file_path, check_precondition_success,
+                                                    BatchTransferScheduler, BlobUploadManifest)
 from knack.log import get_logger
 from knack.util import CLIError
 
@@ -156,30 +158,32 @@ def storage_blob_copy_batch(cmd, client, source_client, container_name=None,
 
 
 # pylint: disable=unused-argument
-def storage_blob_download_batch(client, source, destination, source_container_name, pattern=None, dryrun=False,
+def storage_blob_download_batch(cmd, client, source, destination, source_container_name, pattern=None, dryrun=False,
                                 progress_callback=None, max_connections=2):
 
     def _download_blob(blob_service, container, destination_folder, normalized_blob_name, blob_name):
-        # TODO: try catch IO exception
-        destination_path = os.path.join(destination_folder, normalized_blob_name)
-        destination_folder = os.path.dirname(destination_path)
-        if not os.path.exists(destination_folder):
-            mkdir_p(destination_folder)
-
-        blob = blob_service.get_blob_to_path(container, blob_name, destination_path, max_connections=max_connections,
-                                             progress_callback=progress_callback)
-        return blob.name
-
-    source_blobs = collect_blobs(client, source_container_name, pattern)
-    blobs_to_download = {}
-    for blob_name in source_blobs:
+        def _download(blob_progress_callback):
+            destination_path = os.path.join(destination_folder, normalized_blob_name)
+            destination_dir = os.path.dirname(destination_path)
+            if not os.path.exists(destination_dir):
+                mkdir_p(destination_dir)
+
+            blob = blob_service.get_blob_to_path(container, blob_name, destination_path,
+                                                 max_connections=max_connections,
+                                                 progress_callback=blob_progress_callback)
+            return blob.name
+        return _download
+
+    source_blobs = collect_blobs_with_size(client, source_container_name, pattern)
+    blobs_to_download = OrderedDict()
+    for blob_name, blob_size in source_blobs:
         # remove starting path seperator and normalize
         normalized_blob_name = normalize_blob_file_path(None, blob_name)
         if normalized_blob_name in blobs_to_download:
             raise CLIError('Multiple blobs with download path: `{}`. As a solution, use the `--pattern` parameter '
                            'to select for a subset of blobs to download OR utilize the `storage blob download` '
                            'command instead to download individual blobs.'.format(normalized_blob_name))
-        blobs_to_download[normalized_blob_name] = blob_name
+        blobs_to_download[normalized_blob_name] = (blob_name, blob_size)
 
     if dryrun:
         logger = get_logger(__name__)
@@ -188,27 +192,17 @@ def storage_blob_download_batch(client, source, destination, source_container_na
         logger.warning('  container %s', source_container_name)
         logger.warning('      total %d', len(source_blobs))
         logger.warning(' operations')
-        for b in source_blobs:
+        for b, _ in source_blobs:
             logger.warning('  - %s', b)
         return []
 
-    # Tell progress reporter to reuse the same hook
-    if progress_callback:
-        progress_callback.reuse = True
-
-    results = []
-    for index, blob_normed in enumerate(blobs_to_download):
-        # add blob name and number to progress message
-        if progress_callback:
-            progress_callback.message = '{}/{}: "{}"'.format(
-                index + 1, len(blobs_to_download), blobs_to_download[blob_normed])
-        results.append(_download_blob(
-            client, source_container_name, destination, blob_normed, blobs_to_download[blob_normed]))
-
-    # end progress hook
-    if progress_callback:
-        progress_callback.hook.end()
-
+    scheduler = BatchTransferScheduler.from_config(cmd.cli_ctx, connections_per_transfer=max_connections,
+                                                   progress_callback=progress_callback)
+    results = scheduler.run(
+        (blob_name, blob_size,
+         _download_blob(client, source_container_name, destination, blob_normed, blob_name))
+        for blob_normed, (blob_name, blob_size) in blobs_to_download.items())
+    _raise_for_batch_failures(scheduler, 'downloaded', len(blobs_to_download))
     return results
 
 
@@ -218,7 +212,8 @@ def storage_blob_upload_batch(cmd, client, source, destination, pattern=None,  #
                               content_settings=None, metadata=None, validate_content=False,
                               maxsize_condition=None, max_connections=2, lease_id=None, progress_callback=None,
                               if_modified_since=None, if_unmodified_since=None, if_match=None,
-                              if_none_match=None, timeout=None, dryrun=False):
+                              if_none_match=None, timeout=None, dryrun=False, skip_unchanged=False,
+                              check_md5=False):
     def _create_return_result(blob_name, blob_content_settings, upload_result=None):
         blob_name = normalize_blob_file_path(destination_path, blob_name)
         return {
@@ -231,6 +226,16 @@ def storage_blob_upload_batch(cmd, client, source, destination, pattern=None,  #
     source_files = source_files or []
     t_content_settings = cmd.get_models('blob.models#ContentSettings')
 
+    manifest = None
+    if skip_unchanged:
+        manifest = BlobUploadManifest.from_config(cmd.cli_ctx, client, destination_container_name, destination_path,
+                                                  source)
+        manifest.load(client, destination_container_name, destination_path)
+        changed_files = [(src, dst) for src, dst in source_files
+                         if not manifest.is_unchanged(normalize_blob_file_path(destination_path, dst), src, check_md5)]
+        logger.info('skipping %d of %d unchanged files', len(source_files) - len(changed_files), len(source_files))
+        source_files = changed_files
+
     results = []
     if dryrun:
         logger.info('upload action: from %s to %s', source, destination)
@@ -246,40 +251,49 @@ def storage_blob_upload_batch(cmd, client, source, destination, pattern=None,  #
         def _upload_blob(*args, **kwargs):
             return upload_blob(*args, **kwargs)
 
-        # Tell progress reporter to reuse the same hook
-        if progress_callback:
-            progress_callback.reuse = True
-
-        for index, source_file in enumerate(source_files):
-            src, dst = source_file
-            # logger.warning('uploading %s', src)
+        def _upload_file(src, dst, guessed_content_settings):
+            def _upload(blob_progress_callback):
+                include, result = _upload_blob(cmd, client, destination_container_name,
+                                               normalize_blob_file_path(destination_path, dst), src,
+                                               blob_type=blob_type, content_settings=guessed_content_settings,
+                                               metadata=metadata, validate_content=validate_content,
+                                               maxsize_condition=maxsize_condition, max_connections=max_connections,
+                                               lease_id=lease_id, progress_callback=blob_progress_callback,
+                                               if_modified_since=if_modified_since,
+                                               if_unmodified_since=if_unmodified_since, if_match=if_match,
+                                               if_none_match=if_none_match, timeout=timeout)
+                if include and manifest:
+                    manifest.record(normalize_blob_file_path(destination_path, dst), src, result, check_md5)
+                return _create_return_result(dst, guessed_content_settings, result) if include else None
+            return _upload
+
+        scheduler = BatchTransferScheduler.from_config(cmd.cli_ctx, connections_per_transfer=max_connections,
+                                                       progress_callback=progress_callback)
+        transfers = []
+        for src, dst in source_files:
             guessed_content_settings = guess_content_type(src, content_settings, t_content_settings)
-
-            # add blob name and number to progress message
-            if progress_callback:
-                progress_callback.message = '{}/{}: "{}"'.format(
-                    index + 1, len(source_files), normalize_blob_file_path(destination_path, dst))
-
-            include, result = _upload_blob(cmd, client, destination_container_name,
-                                           normalize_blob_file_path(destination_path, dst), src,
-                                           blob_type=blob_type, content_settings=guessed_content_settings,
-                                           metadata=metadata, validate_content=validate_content,
-                                           maxsize_condition=maxsize_condition, max_connections=max_connections,
-                                           lease_id=lease_id, progress_callback=progress_callback,
-                                           if_modified_since=if_modified_since,
-                                           if_unmodified_since=if_unmodified_since, if_match=if_match,
-                                           if_none_match=if_none_match, timeout=timeout)
-            if include:
-                results.append(_create_return_result(dst, guessed_content_settings, result))
-        # end progress hook
-        if progress_callback:
-            progress_callback.hook.end()
-        num_failures = len(source_files) - len(results)
+            transfers.append((normalize_blob_file_path(destination_path, dst), os.path.getsize(src),
+                              _upload_file(src, dst, guessed_content_settings)))
+        uploaded = scheduler.run(transfers)
+        results = [r for r in uploaded if r is not None]
+        num_failures = len(source_files) - len(results) - len(scheduler.failures)
         if num_failures:
             logger.warning('%s of %s files not uploaded due to "Failed Precondition"', num_failures, len(source_files))
+        if manifest:
+            manifest.save()
+        _raise_for_batch_failures(scheduler, 'uploaded', len(source_files))
     return results
 
 
+def _raise_for_batch_failures(scheduler, action, total, max_names=10):
+    if scheduler.failures:
+        names = [name for name, _ in scheduler.failures]
+        if len(names) > max_names:
+            names = names[:max_names] + ['...']
+        raise CLIError('{} of {} files could not be {}: {}'.format(
+            len(scheduler.failures), total, action, ', '.join(names)))
+
+
 def upload_blob(cmd, client, container_name, blob_name, file_path, blob_type=None, content_settings=None, metadata=None,
                 validate_content=False, maxsize_condition=None, max_connections=2, lease_id=None, tier=None,
                 if_modified_since=None, if_unmodified_since=None, if_match=None, if_none_match=None, timeout=None,
@@ -0,0 +1,131 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import threading
+import time
+import unittest
+
+from azure.cli.command_modules.storage.util import BatchTransferScheduler
+
+
+class _HttpError(Exception):
+    def __init__(self, status_code):
+        super(_HttpError, self).__init__('status {}'.format(status_code))
+        self.status_code = status_code
+
+
+class _Progress(object):
+    def __init__(self):
+        self.calls = []
+        self.hook = self
+
+    def __call__(self, current, total):
+        self.calls.append((current, total))
+
+    def end(self):
+        self.calls.append('end')
+
+
+class TestBatchTransferScheduler(unittest.TestCase):
+
+    def test_results_keep_transfer_order(self):
+        def _transfer(value, delay):
+            def _run(_):
+                time.sleep(delay)
+                return value
+            return _run
+
+        scheduler = BatchTransferScheduler(max_transfers=4)
+        results = scheduler.run(('blob{}'.format(i), 1, _transfer(i, 0.01 * (5 - i))) for i in range(5))
+        self.assertEqual(results, [0, 1, 2, 3, 4])
+        self.assertEqual(scheduler.failures, [])
+
+    def test_limits_connections_and_inflight_bytes(self):
+        lock = threading.Lock()
+        state = {'running': 0, 'max_running': 0, 'bytes': 0, 'max_bytes': 0}
+
+        def _transfer(size):
+            def _run(_):
+                with lock:
+                    state['running'] += 1
+                    state['bytes'] += size
+                    state['max_running'] = max(state['max_running'], state['running'])
+                    state['max_bytes'] = max(state['max_bytes'], state['bytes'])
+                time.sleep(0.02)
+                with lock:
+                    state['running'] -= 1
+                    state['bytes'] -= size
+            return _run
+
+        # 8 connections at 4 connections per transfer only allows 2 transfers at a time
+        scheduler = BatchTransferScheduler(max_transfers=10, max_connections=8, connections_per_transfer=4)
+        scheduler.run(('blob{}'.format(i), 1, _transfer(1)) for i in range(6))
+        self.assertEqual(state['max_running'], 2)
+
+        # a transfer larger than the limit runs on its own
+        state['max_running'] = 0
+        scheduler = BatchTransferScheduler(max_transfers=10, max_inflight_bytes=100)
+        scheduler.run([('small0', 40, _transfer(40)), ('small1', 40, _transfer(40)), ('large', 500, _transfer(500)),
+                       ('small2', 40, _transfer(40))])
+        self.assertEqual(state['max_bytes'], 500)
+        self.assertEqual(state['max_running'], 2)
+
+    def test_retries_and_collects_failures(self):
+        attempts = {'flaky': 0, 'missing': 0, 'broken': 0}
+
+        def _flaky(_):
+            attempts['flaky'] += 1
+            if attempts['flaky'] < 2:
+                raise _HttpError(503)
+            return 'flaky'
+
+        def _missing(_):
+            attempts['missing'] += 1
+            raise _HttpError(404)
+
+        def _broken(_):
+            attempts['broken'] += 1
+            raise IOError('connection reset')
+
+        scheduler = BatchTransferScheduler(max_retries=2)
+        results = scheduler.run([('broken', 1, _broken), ('flaky', 1, _flaky), ('missing', 1, _missing),
+                                 ('ok', 1, lambda _: 'ok')])
+        self.assertEqual(results, [None, 'flaky', None, 'ok'])
+        self.assertEqual(attempts, {'flaky': 2, 'missing': 1, 'broken': 3})
+        self.assertEqual([name for name, _ in scheduler.failures], ['broken', 'missing'])
+
+    def test_progress_is_aggregated(self):
+        def _transfer(size):
+            def _run(progress_callback):
+                progress_callback(size // 2, size)
+                progress_callback(size, size)
+            return _run
+
+        progress = _Progress()
+        scheduler = BatchTransferScheduler(max_transfers=1, progress_callback=progress)
+        scheduler.run([('a', 10, _transfer(10)), ('b', 30, _transfer(30))])
+        self.assertEqual(progress.calls, [(5, 40), (10, 40), (10, 40), (25, 40), (40, 40), (40, 40), 'end'])
+        self.assertEqual(progress.message, '2/2 files')
+        self.assertTrue(progress.reuse)
+
+    def test_progress_follows_retries_and_reported_sizes(self):
+        attempts = []
+
+        def _flaky(progress_callback):
+            attempts.append(1)
+            progress_callback(4, 8)
+            if len(attempts) < 2:
+                raise _HttpError(503)
+            progress_callback(8, 8)
+
+        progress = _Progress()
+        scheduler = BatchTransferScheduler(max_transfers=1, progress_callback=progress)
+        scheduler.run([('flaky', 10, _flaky), ('ok', 2, lambda callback: callback(2, 2))])
+        # the reported size replaces the expected one and a retry starts over
+        self.assertEqual(progress.calls, [(4, 10), (0, 10), (4, 10), (8, 10), (8, 10), (10, 10), (10, 10), 'end'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+import mock
+
+from azure.cli.command_modules.storage.util import BlobUploadManifest, get_file_md5
+
+
+class TestBlobUploadManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.manifest_file = os.path.join(self.temp_dir, 'manifest.json')
+        self.file_path = os.path.join(self.temp_dir, 'file.txt')
+        with open(self.file_path, 'w') as f:
+            f.write('content')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _blob(self, name, size, last_modified, content_md5=None):
+        blob = mock.MagicMock()
+        blob.name = name
+        blob.properties.content_length = size
+        blob.properties.last_modified = last_modified
+        blob.properties.etag = 'etag'
+        blob.properties.content_settings.content_md5 = content_md5
+        return blob
+
+    def test_manifest_lists_container_once(self):
+        client = mock.MagicMock()
+        later = datetime.utcnow() + timedelta(days=1)
+        client.list_blobs.return_value = [self._blob('dir/file.txt', 7, later, get_file_md5(self.file_path)),
+                                          self._blob('dir/other.txt', 3, later),
+                                          self._blob('dir/stale.txt', 7, later)]
+
+        manifest = BlobUploadManifest(self.manifest_file)
+        manifest.load(client, 'container', 'dir')
+        client.list_blobs.assert_called_once_with('container', prefix='dir/')
+        self.assertTrue(manifest.is_unchanged('dir/file.txt', self.file_path))
+        self.assertFalse(manifest.is_unchanged('dir/other.txt', self.file_path))
+        self.assertFalse(manifest.is_unchanged('dir/missing.txt', self.file_path))
+        # a blob listed without Content-MD5 can't be compared, even when the file is older than the blob
+        self.assertFalse(manifest.is_unchanged('dir/stale.txt', self.file_path))
+        manifest.save()
+
+        manifest = BlobUploadManifest(self.manifest_file)
+        manifest.load(client, 'container', 'dir')
+        self.assertEqual(client.list_blobs.call_count, 1)
+        self.assertTrue(manifest.is_unchanged('dir/file.txt', self.file_path))
+
+        manifest = BlobUploadManifest(self.manifest_file, max_age=-1)
+        manifest.load(client, 'container', 'dir')
+        self.assertEqual(client.list_blobs.call_count, 2)
+
+    def test_manifest_compares_md5_and_recorded_uploads(self):
+        client = mock.MagicMock()
+        later = datetime.utcnow() + timedelta(days=1)
+        client.list_blobs.return_value = [self._blob('file.txt', 7, later, content_md5='bad')]
+
+        manifest = BlobUploadManifest(self.manifest_file)
+        manifest.load(client, 'container')
+        self.assertFalse(manifest.is_unchanged('file.txt', self.file_path))
+        self.assertFalse(manifest.is_unchanged('file.txt', self.file_path, check_md5=True))
+
+        upload_result = mock.MagicMock(last_modified=datetime.utcnow(), etag='new')
+        manifest.record('file.txt', self.file_path, upload_result, check_md5=True)
+        self.assertEqual(manifest.blobs['file.txt']['content_md5'], get_file_md5(self.file_path))
+        self.assertTrue(manifest.is_unchanged('file.txt', self.file_path, check_md5=True))
+        self.assertTrue(manifest.is_unchanged('file.txt', self.file_path))
+
+        os.utime(self.file_path, (0, 0))
+        self.assertFalse(manifest.is_unchanged('file.txt', self.file_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
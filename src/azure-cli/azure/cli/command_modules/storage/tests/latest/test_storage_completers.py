@@ -0,0 +1,37 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import unittest
+from argparse import Namespace
+
+import mock
+
+from azure.cli.core.decorators import Completer
+from azure.cli.command_modules.storage.completers import get_storage_name_completion_list
+
+
+class TestStorageCompleters(unittest.TestCase):
+
+    def test_name_completion_cache_key_uses_account_from_config(self):
+        cmd = mock.MagicMock()
+        config = {('storage', 'account'): 'configaccount'}
+        cmd.cli_ctx.config.get.side_effect = lambda section, key, default=None: config.get((section, key), default)
+        completer = get_storage_name_completion_list(mock.MagicMock(__name__='BlockBlobService'), 'list_containers')
+        key_accounts = []
+
+        def _call_cached(self, cmd, prefix, namespace):
+            key_accounts.append(namespace.account_name)
+            return []
+
+        with mock.patch.object(Completer, '_call_cached', _call_cached):
+            completer(prefix='', parsed_args=Namespace(_cmd=cmd, account_name=None, connection_string=None))
+            config[('storage', 'account')] = 'otheraccount'
+            completer(prefix='', parsed_args=Namespace(_cmd=cmd, account_name=None, connection_string=None))
+            completer(prefix='', parsed_args=Namespace(_cmd=cmd, account_name='myaccount', connection_string=None))
+        self.assertEqual(key_accounts, ['configaccount', 'otheraccount', 'myaccount'])
+
+
+if __name__ == '__main__':
+    unittest.main()
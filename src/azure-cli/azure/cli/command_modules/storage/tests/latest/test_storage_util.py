@@ -0,0 +1,72 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+import os
+import unittest
+
+import mock
+
+from azure.cli.command_modules.storage.util import collect_blobs, glob_files_remotely
+
+
+class _Directory(object):
+    def __init__(self, name):
+        self.name = name
+
+
+class _File(object):
+    def __init__(self, name):
+        self.name = name
+
+
+@unittest.skipIf(os.path.normcase('A') != 'A', 'Patterns are matched case-insensitively on this platform')
+class TestStorageUtil(unittest.TestCase):
+
+    def test_collect_blobs_pushes_down_pattern_prefix(self):
+        blob_service = mock.MagicMock()
+        blob_service.list_blobs.return_value = [mock.MagicMock() for _ in range(3)]
+        for blob, name in zip(blob_service.list_blobs.return_value,
+                              ['logs/2026/10/a.log', 'logs/2026/10/b.txt', 'logs/2026/10/c.log']):
+            blob.name = name
+
+        blobs = collect_blobs(blob_service, 'container', 'logs/2026/10/*.log')
+        self.assertEqual(list(blobs), ['logs/2026/10/a.log', 'logs/2026/10/c.log'])
+        blob_service.list_blobs.assert_called_once_with('container', prefix='logs/2026/10/')
+
+        blob_service.list_blobs.reset_mock()
+        list(collect_blobs(blob_service, 'container', '*.log'))
+        blob_service.list_blobs.assert_called_once_with('container', prefix=None)
+
+    def test_glob_files_remotely_prunes_directories(self):
+        tree = {
+            'logs': [_Directory('2025'), _Directory('2026')],
+            'logs/2026': [_Directory('09'), _Directory('10'), _Directory('11'), _File('summary.log')],
+            'logs/2026/10': [_File('a.log'), _File('b.txt')],
+            'logs/2026/11': [_File('c.log')],
+        }
+        client = mock.MagicMock()
+        client.list_directories_and_files.side_effect = lambda share, directory: tree[directory]
+        cmd = mock.MagicMock()
+        cmd.get_models.return_value = (_Directory, _File)
+
+        files = glob_files_remotely(cmd, client, 'share', 'logs/2026/1?/*.log')
+        self.assertEqual(sorted(files), [('logs/2026/10', 'a.log'), ('logs/2026/11', 'c.log')])
+        listed = [c[0][1] for c in client.list_directories_and_files.call_args_list]
+        self.assertEqual(sorted(listed), ['logs/2026', 'logs/2026/10', 'logs/2026/11'])
+
+    def test_glob_files_remotely_missing_prefix_directory(self):
+        from azure.common import AzureMissingResourceHttpError
+        client = mock.MagicMock()
+        client.list_directories_and_files.side_effect = AzureMissingResourceHttpError('not found', 404)
+        cmd = mock.MagicMock()
+        cmd.get_models.return_value = (_Directory, _File)
+
+        self.assertEqual(list(glob_files_remotely(cmd, client, 'share', 'missing/*')), [])
+        with self.assertRaises(AzureMissingResourceHttpError):
+            list(glob_files_remotely(cmd, client, 'share', '*'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,31 +6,63 @@
 
 import os
 
+from knack.log import get_logger
+
 
 def collect_blobs(blob_service, container, pattern=None):
     """
     List the blobs in the given blob container, filter the blob by comparing their path to the given pattern.
     """
+    _check_blob_service_and_container(blob_service, container)
+
+    if not _pattern_has_wildcards(pattern):
+        return [pattern] if blob_service.exists(container, pattern) else []
+
+    return (blob_name for blob_name, _ in _list_blobs(blob_service, container, pattern))
+
+
+def collect_blobs_with_size(blob_service, container, pattern=None):
+    """
+    List the blobs in the given blob container, filter the blob by comparing their path to the given pattern.
+    Returns a list of tuple (name, size).
+    """
+    _check_blob_service_and_container(blob_service, container)
+
+    if not _pattern_has_wildcards(pattern):
+        from azure.common import AzureMissingResourceHttpError
+        try:
+            blob = blob_service.get_blob_properties(container, pattern)
+        except AzureMissingResourceHttpError:
+            return []
+        return [(pattern, _get_blob_size(blob))]
+
+    return [(blob_name, _get_blob_size(blob)) for blob_name, blob in _list_blobs(blob_service, container, pattern)]
+
+
+def _check_blob_service_and_container(blob_service, container):
     if not blob_service:
         raise ValueError('missing parameter blob_service')
 
     if not container:
         raise ValueError('missing parameter container')
 
-    if not _pattern_has_wildcards(pattern):
-        return [pattern] if blob_service.exists(container, pattern) else []
 
-    results = []
-    for blob in blob_service.list_blobs(container):
+def _list_blobs(blob_service, container, pattern):
+    # only the blobs starting with the literal prefix of the pattern can match, let the service filter them
+    prefix = _get_pattern_prefix(pattern)
+    for blob in blob_service.list_blobs(container, prefix=prefix or None):
         try:
             blob_name = blob.name.encode('utf-8') if isinstance(blob.name, unicode) else blob.name
         except NameError:
             blob_name = blob.name
 
         if not pattern or _match_path(blob_name, pattern):
-            results.append(blob_name)
+            yield blob_name, blob
 
-    return results
+
+def _get_blob_size(blob):
+    properties = getattr(blob, 'properties', None)
+    return getattr(properties, 'content_length', None) or 0
 
 
 def collect_files(cmd, file_service, share, pattern=None):
@@ -84,17 +116,30 @@ def glob_files_locally(folder_path, pattern):
 def glob_files_remotely(cmd, client, share_name, pattern):
     """glob the files in remote file share based on the given pattern"""
     from collections import deque
+    from azure.common import AzureMissingResourceHttpError
     t_dir, t_file = cmd.get_models('file.models#Directory', 'file.models#File')
 
-    queue = deque([""])
+    # start from the deepest directory in the literal prefix of the pattern and skip the directories that cannot
+    # contain a match
+    prefix = _get_pattern_prefix(pattern)
+    start_dir = prefix.rpartition('/')[0]
+    queue = deque([start_dir])
     while queue:
         current_dir = queue.pop()
-        for f in client.list_directories_and_files(share_name, current_dir):
-            if isinstance(f, t_file):
-                if not pattern or _match_path(os.path.join(current_dir, f.name), pattern):
-                    yield current_dir, f.name
-            elif isinstance(f, t_dir):
-                queue.appendleft(os.path.join(current_dir, f.name))
+        try:
+            items = client.list_directories_and_files(share_name, current_dir)
+            for f in items:
+                if isinstance(f, t_file):
+                    if not pattern or _match_path(os.path.join(current_dir, f.name), pattern):
+                        yield current_dir, f.name
+                elif isinstance(f, t_dir):
+                    dir_path = os.path.join(current_dir, f.name)
+                    if _dir_can_match_prefix(dir_path, prefix):
+                        queue.appendleft(dir_path)
+        except AzureMissingResourceHttpError:
+            # the directory in the prefix of the pattern does not exist, so nothing matches
+            if not start_dir or current_dir != start_dir:
+                raise
 
 
 def create_short_lived_blob_sas(cmd, account_name, account_key, container, blob):
@@ -167,6 +212,22 @@ def _pattern_has_wildcards(p):
     return not p or p.find('*') != -1 or p.find('?') != -1 or p.find('[') != -1
 
 
+def _get_pattern_prefix(pattern):
+    """Return the literal part of the pattern before its first wildcard, which every matching path starts with."""
+    if not pattern or os.path.normcase('A') != 'A':
+        # paths are matched case-insensitively on this platform, so no path is guaranteed to start with the prefix
+        return ''
+    for i, c in enumerate(pattern):
+        if c in '*?[':
+            return pattern[:i]
+    return pattern
+
+
+def _dir_can_match_prefix(dir_path, prefix):
+    dir_path = dir_path.replace(os.path.sep, '/').rstrip('/') + '/'
+    return dir_path.startswith(prefix) or prefix.startswith(dir_path)
+
+
 def _match_path(path, pattern):
     from fnmatch import fnmatch
     return fnmatch(path, pattern)
@@ -212,6 +273,252 @@ def normalize_blob_file_path(path, name):
     return path_sep.join(os.path.normpath(name).split(os.path.sep)).strip(path_sep)
 
 
+DEFAULT_BATCH_MAX_TRANSFERS = 8
+DEFAULT_BATCH_MAX_CONNECTIONS = 32
+DEFAULT_BATCH_MAX_INFLIGHT_MB = 256
+DEFAULT_BATCH_MAX_RETRIES = 2
+
+
+class BatchTransferScheduler(object):  # pylint: disable=too-many-instance-attributes
+    """
+    Run the transfers of a batch operation concurrently.
+
+    Every transfer is a (name, size, func) tuple, where func takes a progress callback and returns the result of the
+    transfer. A transfer is only started while the number of connections in use (``connections_per_transfer`` for
+    each running transfer) and the number of in-flight bytes stay under the configured limits. A single transfer
+    larger than the byte limit still runs, on its own. Failed transfers are retried and then collected in
+    ``failures`` instead of aborting the rest of the batch.
+    """
+
+    def __init__(self, max_transfers=DEFAULT_BATCH_MAX_TRANSFERS, max_connections=DEFAULT_BATCH_MAX_CONNECTIONS,
+                 max_inflight_bytes=DEFAULT_BATCH_MAX_INFLIGHT_MB * 1024 * 1024, connections_per_transfer=1,
+                 max_retries=DEFAULT_BATCH_MAX_RETRIES, progress_callback=None):
+        import threading
+        self.connections_per_transfer = max(1, connections_per_transfer)
+        self.max_connections = max(max_connections, self.connections_per_transfer)
+        self.max_transfers = max(1, min(max_transfers, self.max_connections // self.connections_per_transfer))
+        self.max_inflight_bytes = max_inflight_bytes
+        self.max_retries = max_retries
+        self.progress_callback = progress_callback
+        self.failures = []
+        self._failed = []
+        self._condition = threading.Condition()
+        self._running = 0
+        self._inflight_bytes = 0
+        self._progress = {}
+        self._totals = {}
+        self._grand_total = 0
+        self._transferred = 0
+        self._completed = 0
+
+    @classmethod
+    def from_config(cls, cli_ctx, connections_per_transfer=1, progress_callback=None):
+        config = cli_ctx.config
+        return cls(max_transfers=config.getint('storage', 'batch_max_transfers', fallback=DEFAULT_BATCH_MAX_TRANSFERS),
+                   max_connections=config.getint('storage', 'batch_max_connections',
+                                                 fallback=DEFAULT_BATCH_MAX_CONNECTIONS),
+                   max_inflight_bytes=config.getint('storage', 'batch_max_inflight_mb',
+                                                    fallback=DEFAULT_BATCH_MAX_INFLIGHT_MB) * 1024 * 1024,
+                   max_retries=config.getint('storage', 'batch_max_retries', fallback=DEFAULT_BATCH_MAX_RETRIES),
+                   connections_per_transfer=connections_per_transfer or 1,
+                   progress_callback=progress_callback)
+
+    def run(self, transfers):
+        """
+        Run the transfers and return their results in the order of the transfers. The result of a failed transfer is
+        None and the failure is recorded in ``failures`` as a (name, exception) tuple.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        transfers = list(transfers)
+        self._totals = {index: size or 0 for index, (_, size, _) in enumerate(transfers)}
+        self._progress = {}
+        self._grand_total = sum(self._totals.values())
+        self._transferred = 0
+        if self.progress_callback:
+            # Tell progress reporter to reuse the same hook
+            self.progress_callback.reuse = True
+
+        futures = []
+        with ThreadPoolExecutor(max_workers=self.max_transfers) as executor:
+            for index, (name, size, func) in enumerate(transfers):
+                size = size or 0
+                self._acquire(size)
+                try:
+                    futures.append(executor.submit(self._transfer, index, name, size, func, len(transfers)))
+                except Exception:
+                    self._release(size)
+                    raise
+        results = [f.result() for f in futures]
+        self.failures = [(name, ex) for _, name, ex in sorted(self._failed, key=lambda f: f[0])]
+
+        # end progress hook
+        if self.progress_callback:
+            self.progress_callback.hook.end()
+        return results
+
+    def _acquire(self, size):
+        with self._condition:
+            while self._running and (self._running >= self.max_transfers or
+                                     self._inflight_bytes + size > self.max_inflight_bytes):
+                self._condition.wait()
+            self._running += 1
+            self._inflight_bytes += size
+
+    def _release(self, size):
+        with self._condition:
+            self._running -= 1
+            self._inflight_bytes -= size
+            self._condition.notify_all()
+
+    def _transfer(self, index, name, size, func, count):
+        logger = get_logger(__name__)
+
+        def _update_progress(current, total):
+            self._report_progress(index, current, total, count)
+
+        try:
+            attempt = 0
+            while True:
+                try:
+                    result = func(_update_progress)
+                    break
+                except Exception as ex:  # pylint: disable=broad-except
+                    if attempt >= self.max_retries or not _is_retryable_transfer_error(ex):
+                        logger.error('Failed to transfer "%s": %s', name, ex)
+                        with self._condition:
+                            self._failed.append((index, name, ex))
+                        result = None
+                        break
+                    attempt += 1
+                    logger.warning('Retrying transfer of "%s" (%d/%d): %s', name, attempt, self.max_retries, ex)
+                    self._report_progress(index, 0, None, count)
+            with self._condition:
+                self._completed += 1
+            self._report_progress(index, self._totals[index], None, count)
+            return result
+        finally:
+            self._release(size)
+
+    def _report_progress(self, index, current, total, count):
+        if not self.progress_callback:
+            return
+        with self._condition:
+            # keep the sums up to date with the change of this transfer, instead of summing over every transfer
+            if total:
+                self._grand_total += total - self._totals[index]
+                self._totals[index] = total
+            self._transferred += current - self._progress.get(index, 0)
+            self._progress[index] = current
+            self.progress_callback.message = '{}/{} files'.format(self._completed, count)
+            if self._grand_total:
+                self.progress_callback(min(self._transferred, self._grand_total), self._grand_total)
+
+
+DEFAULT_BATCH_MANIFEST_MAX_AGE_HOURS = 24 * 7
+
+
+class BlobUploadManifest(object):
+    """
+    A local record of the blobs under a destination path of a container, used to skip uploading unchanged files.
+
+    The manifest is populated with a single listing of the container and refreshed from the uploads of later runs. It
+    is stored as a JSON file in the configuration directory, and the container is listed again once the last listing
+    is older than ``max_age`` seconds.
+    """
+
+    def __init__(self, filename, max_age=DEFAULT_BATCH_MANIFEST_MAX_AGE_HOURS * 3600):
+        from azure.cli.core._session import Session
+        self.filename = filename
+        self.max_age = max_age
+        self._session = Session(encoding='utf-8')
+
+    @classmethod
+    def from_config(cls, cli_ctx, client, container, destination_path, source):
+        import hashlib
+        key = '|'.join([client.account_name or '', container, destination_path or '', source])
+        directory = os.path.join(cli_ctx.config.config_dir, 'blob_manifests')
+        mkdir_p(directory)
+        max_age = cli_ctx.config.getint('storage', 'batch_manifest_max_age_hours',
+                                        fallback=DEFAULT_BATCH_MANIFEST_MAX_AGE_HOURS) * 3600
+        return cls(os.path.join(directory, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json'), max_age)
+
+    @property
+    def blobs(self):
+        return self._session['blobs']
+
+    def load(self, client, container, destination_path=None):
+        """Load the manifest, listing the blobs of the container when the manifest is missing or outdated."""
+        import time
+        self._session.load(self.filename)
+        if self._session.get('listed_at', 0) + self.max_age >= time.time():
+            return
+
+        prefix = normalize_blob_file_path(destination_path, '') + '/' if destination_path else None
+        blobs = {}
+        for blob in client.list_blobs(container, prefix=prefix):
+            properties = blob.properties
+            blobs[blob.name] = {
+                'size': properties.content_length,
+                'last_modified': _to_timestamp(properties.last_modified),
+                'etag': properties.etag,
+                'content_md5': getattr(properties.content_settings, 'content_md5', None)}
+        self._session.data = {'listed_at': time.time(), 'blobs': blobs}
+
+    def is_unchanged(self, blob_name, file_path, check_md5=False):
+        """
+        Check whether the local file matches the blob recorded in the manifest. The sizes must match, then the MD5 of
+        the file is compared when requested and known for the blob, otherwise the modification time of the file as
+        recorded by an earlier upload. Blobs only known from the listing of the container are compared by MD5, and
+        files are never skipped when neither is available.
+        """
+        entry = self.blobs.get(blob_name)
+        stat = os.stat(file_path)
+        if not entry or entry.get('size') != stat.st_size:
+            return False
+        if check_md5 and entry.get('content_md5'):
+            return get_file_md5(file_path) == entry['content_md5']
+        if entry.get('mtime') is not None:
+            return entry['mtime'] == stat.st_mtime
+        return bool(entry.get('content_md5')) and get_file_md5(file_path) == entry['content_md5']
+
+    def record(self, blob_name, file_path, upload_result, check_md5=False):
+        stat = os.stat(file_path)
+        self.blobs[blob_name] = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'last_modified': _to_timestamp(upload_result.last_modified),
+            'etag': upload_result.etag,
+            'content_md5': get_file_md5(file_path) if check_md5 else None}
+
+    def save(self):
+        self._session.save_with_retry()
+
+
+def get_file_md5(file_path, chunk_size=4 * 1024 * 1024):
+    """Return the base64 encoded MD5 of a file, in the format of the Content-MD5 of a blob."""
+    import base64
+    import hashlib
+    md5 = hashlib.md5()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            md5.update(chunk)
+    return base64.b64encode(md5.digest()).decode('utf-8')
+
+
+def _to_timestamp(value):
+    if value is None:
+        return None
+    import calendar
+    return calendar.timegm(value.utctimetuple())
+
+
+def _is_retryable_transfer_error(ex):
+    status_code = getattr(ex, 'status_code', None)
+    # client errors other than timeouts and throttling will not succeed on a retry
+    return not status_code or status_code >= 500 or status_code in [408, 429]
+
+
 def check_precondition_success(func):
     def wrapper(*args, **kwargs):
         from azure.common import AzureHttpError
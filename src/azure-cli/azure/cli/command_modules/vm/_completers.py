@@ -9,13 +9,13 @@ from azure.cli.core.decorators import Completer
 from azure.cli.command_modules.vm._actions import load_images_from_aliases_doc, get_vm_sizes
 
 
-@Completer
+@Completer.cached()
 def get_urn_aliases_completion_list(cmd, prefix, namespace):  # pylint: disable=unused-argument
     images = load_images_from_aliases_doc(cmd.cli_ctx)
     return [i['urnAlias'] for i in images]
 
 
-@Completer
+@Completer.cached('location')
 def get_vm_size_completion_list(cmd, prefix, namespace):  # pylint: disable=unused-argument
     location = namespace.location
     if not location:
@@ -24,7 +24,7 @@ def get_vm_size_completion_list(cmd, prefix, namespace):  # pylint: disable=unus
     return [r.name for r in result]
 
 
-@Completer
+@Completer.cached('location')
 def get_vm_run_command_completion_list(cmd, prefix, namespace):  # pylint: disable=unused-argument
     from ._client_factory import _compute_client_factory
     try:
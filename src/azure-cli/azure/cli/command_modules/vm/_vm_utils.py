@@ -41,13 +41,14 @@ def read_content_if_is_file(string_or_file):
 
 
 def _resolve_api_version(cli_ctx, provider_namespace, resource_type, parent_path):
+    from azure.cli.core.commands.arm import get_provider
     from azure.cli.core.commands.client_factory import get_mgmt_service_client
     from azure.cli.core.profiles import ResourceType
     client = get_mgmt_service_client(cli_ctx, ResourceType.MGMT_RESOURCE_RESOURCES)
-    provider = client.providers.get(provider_namespace)
 
     # If available, we will use parent resource's api-version
     resource_type_str = (parent_path.split('/')[0] if parent_path else resource_type)
+    provider = get_provider(cli_ctx, client, provider_namespace, resource_type_str)
 
     rt = [t for t in provider.resource_types  # pylint: disable=no-member
           if t.resource_type.lower() == resource_type_str.lower()]
@@ -771,23 +771,33 @@ def get_vm_details(cmd, resource_group_name, vm_name):
     result = get_instance_view(cmd, resource_group_name, vm_name)
     network_client = get_mgmt_service_client(
         cmd.cli_ctx, ResourceType.MGMT_NETWORK, api_version=get_target_network_api(cmd.cli_ctx))
+
+    def get_nic(nic_id):
+        nic_parts = parse_resource_id(nic_id)
+        return network_client.network_interfaces.get(nic_parts['resource_group'], nic_parts['name'])
+
+    def get_public_ip(public_ip_id):
+        res = parse_resource_id(public_ip_id)
+        return network_client.public_ip_addresses.get(res['resource_group'], res['name'])
+
+    return _set_vm_details(result, get_nic, get_public_ip)
+
+
+def _set_vm_details(result, get_nic, get_public_ip):
     public_ips = []
     fqdns = []
     private_ips = []
     mac_addresses = []
     # pylint: disable=line-too-long,no-member
     for nic_ref in result.network_profile.network_interfaces:
-        nic_parts = parse_resource_id(nic_ref.id)
-        nic = network_client.network_interfaces.get(nic_parts['resource_group'], nic_parts['name'])
+        nic = get_nic(nic_ref.id)
         if nic.mac_address:
             mac_addresses.append(nic.mac_address)
         for ip_configuration in nic.ip_configurations:
             if ip_configuration.private_ip_address:
                 private_ips.append(ip_configuration.private_ip_address)
             if ip_configuration.public_ip_address:
-                res = parse_resource_id(ip_configuration.public_ip_address.id)
-                public_ip_info = network_client.public_ip_addresses.get(res['resource_group'],
-                                                                        res['name'])
+                public_ip_info = get_public_ip(ip_configuration.public_ip_address.id)
                 if public_ip_info.ip_address:
                     public_ips.append(public_ip_info.ip_address)
                 if public_ip_info.dns_settings:
@@ -803,6 +813,61 @@ def get_vm_details(cmd, resource_group_name, vm_name):
     return result
 
 
+def _list_vm_details(cmd, vm_list, resource_group_name=None):
+    """
+    Get the details of many VMs. The NICs and public IPs are listed once and joined in memory, like
+    `list_vm_ip_addresses` does, and the instance views are fetched concurrently.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from msrestazure.tools import parse_resource_id
+    from azure.cli.core.commands import DEFAULT_MAX_CONCURRENT_IDS
+    from azure.cli.core.util import AdaptiveConcurrencyLimiter
+    from azure.cli.command_modules.vm._vm_utils import get_target_network_api
+    vm_list = list(vm_list)
+    if not vm_list:
+        return []
+
+    compute_client = _compute_client_factory(cmd.cli_ctx)
+    network_client = get_mgmt_service_client(
+        cmd.cli_ctx, ResourceType.MGMT_NETWORK, api_version=get_target_network_api(cmd.cli_ctx))
+    limiter = AdaptiveConcurrencyLimiter(
+        cmd.cli_ctx.config.getint('core', 'max_concurrent_ids', fallback=DEFAULT_MAX_CONCURRENT_IDS))
+
+    def get_instance_view_by_id(vm_id):
+        rg, name = _parse_rg_name(vm_id)
+        return limiter.call(compute_client.virtual_machines.get, rg, name, expand='instanceView')
+
+    # NICs and public IPs are usually, but not necessarily, in the resource group of their VM
+    if resource_group_name:
+        nics = network_client.network_interfaces.list(resource_group_name)
+        public_ips = network_client.public_ip_addresses.list(resource_group_name)
+    else:
+        nics = network_client.network_interfaces.list_all()
+        public_ips = network_client.public_ip_addresses.list_all()
+    nic_lookup = {nic.id.lower(): nic for nic in nics}
+    public_ip_lookup = {public_ip.id.lower(): public_ip for public_ip in public_ips}
+
+    def get_nic(nic_id):
+        nic = nic_lookup.get(nic_id.lower())
+        if nic is None:
+            nic_parts = parse_resource_id(nic_id)
+            nic = nic_lookup[nic_id.lower()] = network_client.network_interfaces.get(nic_parts['resource_group'],
+                                                                                     nic_parts['name'])
+        return nic
+
+    def get_public_ip(public_ip_id):
+        public_ip = public_ip_lookup.get(public_ip_id.lower())
+        if public_ip is None:
+            res = parse_resource_id(public_ip_id)
+            public_ip = public_ip_lookup[public_ip_id.lower()] = network_client.public_ip_addresses.get(
+                res['resource_group'], res['name'])
+        return public_ip
+
+    with ThreadPoolExecutor(max_workers=min(limiter.max_limit, len(vm_list))) as executor:
+        results = list(executor.map(get_instance_view_by_id, [v.id for v in vm_list]))
+    return [_set_vm_details(result, get_nic, get_public_ip) for result in results]
+
+
 def list_skus(cmd, location=None, size=None, zone=None, show_all=None, resource_type=None):
     from ._vm_utils import list_sku_info
     result = list_sku_info(cmd.cli_ctx, location)
@@ -824,7 +889,7 @@ def list_vm(cmd, resource_group_name=None, show_details=False):
     vm_list = ccf.virtual_machines.list(resource_group_name=resource_group_name) \
         if resource_group_name else ccf.virtual_machines.list_all()
     if show_details:
-        return [get_vm_details(cmd, _parse_rg_name(v.id)[0], v.name) for v in vm_list]
+        return _list_vm_details(cmd, vm_list, resource_group_name)
 
     return list(vm_list)
 
@@ -14,7 +14,7 @@ from azure.cli.command_modules.vm.custom import (enable_boot_diagnostics, disabl
                                                  _LINUX_ACCESS_EXT,
                                                  _WINDOWS_ACCESS_EXT,
                                                  _get_extension_instance_name,
-                                                 get_boot_log)
+                                                 get_boot_log, list_vm)
 from azure.cli.command_modules.vm.custom import \
     (attach_unmanaged_data_disk, detach_data_disk, get_vmss_instance_view)
 
@@ -237,6 +237,52 @@ class TestVmCustom(unittest.TestCase):
         vm_client.virtual_machine_scale_set_vms.list.assert_called_once_with('rg1', 'vmss1', expand='instanceView',
                                                                              select='instanceView')
 
+    @mock.patch('azure.cli.command_modules.vm.custom.get_mgmt_service_client')
+    @mock.patch('azure.cli.command_modules.vm.custom._compute_client_factory')
+    def test_list_vm_show_details(self, factory_mock, network_factory_mock):
+        vm_prefix = '/subscriptions/sub/resourceGroups/rg1/providers/Microsoft.Compute/virtualMachines/'
+        network_prefix = '/subscriptions/sub/resourceGroups/rg1/providers/Microsoft.Network/'
+
+        def _vm(name, nic_names):
+            vm = mock.MagicMock(id=vm_prefix + name)
+            vm.network_profile.network_interfaces = [mock.MagicMock(id=network_prefix + 'networkInterfaces/' + n)
+                                                     for n in nic_names]
+            vm.instance_view.statuses = [InstanceViewStatus(code='PowerState/running', display_status='VM running')]
+            return vm
+
+        def _nic(name, private_ip, public_ip_name=None):
+            ip_configuration = mock.MagicMock(private_ip_address=private_ip, public_ip_address=None)
+            if public_ip_name:
+                public_ip_id = network_prefix + 'publicIPAddresses/' + public_ip_name
+                ip_configuration.public_ip_address = mock.MagicMock(id=public_ip_id)
+            return mock.MagicMock(id=network_prefix + 'networkInterfaces/' + name, mac_address=name + '-mac',
+                                  ip_configurations=[ip_configuration])
+
+        vms = {'vm1': _vm('vm1', ['nic1']), 'vm2': _vm('vm2', ['nic2', 'nic3'])}
+        compute_client = mock.MagicMock()
+        compute_client.virtual_machines.list_all.return_value = [mock.MagicMock(id=vm_prefix + 'vm1'),
+                                                                 mock.MagicMock(id=vm_prefix + 'vm2')]
+        compute_client.virtual_machines.get.side_effect = lambda rg, name, expand: vms[name]
+        factory_mock.return_value = compute_client
+        network_client = mock.MagicMock()
+        network_client.network_interfaces.list_all.return_value = [_nic('nic1', '10.0.0.4', 'ip1'),
+                                                                   _nic('nic2', '10.0.0.5')]
+        network_client.network_interfaces.get.return_value = _nic('nic3', '10.0.1.5')
+        network_client.public_ip_addresses.list_all.return_value = [
+            mock.MagicMock(id=network_prefix + 'publicIPAddresses/ip1', ip_address='1.2.3.4', dns_settings=None)]
+        network_factory_mock.return_value = network_client
+
+        result = list_vm(_get_test_cmd(), show_details=True)
+        self.assertEqual([r.id for r in result], [vm_prefix + 'vm1', vm_prefix + 'vm2'])
+        self.assertEqual(result[0].public_ips, '1.2.3.4')
+        self.assertEqual(result[0].power_state, 'VM running')
+        self.assertEqual(result[1].private_ips, '10.0.0.5,10.0.1.5')
+        self.assertEqual(result[1].mac_addresses, 'nic2-mac,nic3-mac')
+        # NICs and public IPs are listed once, only the NIC missing from the list is fetched
+        network_client.network_interfaces.get.assert_called_once_with('rg1', 'nic3')
+        network_client.public_ip_addresses.get.assert_not_called()
+        self.assertEqual(compute_client.virtual_machines.get.call_count, 2)
+
     # pylint: disable=line-too-long
     @mock.patch('azure.cli.command_modules.vm.disk_encryption._compute_client_factory', autospec=True)
     @mock.patch('azure.cli.command_modules.vm.disk_encryption._get_keyvault_key_url', autospec=True)